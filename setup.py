@@ -40,5 +40,6 @@ setup(
     keywords="",
     classifiers=[],
     python_requires=">=3.6, <3.9",
+    extras_require={"parquet": ["pyarrow"]},
     test_suite="tests",
 )
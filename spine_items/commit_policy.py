@@ -0,0 +1,107 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Contains the commit policy shared by items that write into databases.
+
+:date:    18.10.2026
+"""
+
+PER_RUN = "run"
+PER_FILE = "file"
+PER_TABLE = "table"
+EVERY_N_ITEMS = "items"
+GRANULARITIES = (PER_RUN, PER_FILE, PER_TABLE, EVERY_N_ITEMS)
+
+
+class CommitPolicy:
+    """Decides when pending changes are committed to a database.
+
+    Files are source files for Importer and source databases for Data Store;
+    tables are source tables for Importer and item types for Data Store.
+    """
+
+    def __init__(self, granularity=PER_RUN, item_count=0):
+        """
+        Args:
+            granularity (str): one of ``GRANULARITIES``
+            item_count (int): number of items between commits when granularity is ``EVERY_N_ITEMS``
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Unknown commit granularity '{granularity}'.")
+        self.granularity = granularity
+        self.item_count = item_count
+
+    def __eq__(self, other):
+        if not isinstance(other, CommitPolicy):
+            return NotImplemented
+        return self.granularity == other.granularity and self.item_count == other.item_count
+
+    def commit_after_items(self, uncommitted_count):
+        """Checks if enough items have been imported to warrant a commit.
+
+        Args:
+            uncommitted_count (int): number of items imported since last commit
+
+        Returns:
+            bool: True if changes should be committed, False otherwise
+        """
+        return self.granularity == EVERY_N_ITEMS and 0 < self.item_count <= uncommitted_count
+
+    def commit_after_table(self):
+        """Checks if changes should be committed after each table.
+
+        Returns:
+            bool: True if changes should be committed, False otherwise
+        """
+        return self.granularity == PER_TABLE
+
+    def commit_after_file(self):
+        """Checks if changes should be committed after each file.
+
+        Returns:
+            bool: True if changes should be committed, False otherwise
+        """
+        return self.granularity in (PER_FILE, PER_TABLE)
+
+    def describe(self):
+        """Returns a log message that describes the policy.
+
+        Returns:
+            str: description
+        """
+        if self.granularity == EVERY_N_ITEMS and self.item_count > 0:
+            return f"Committing every {self.item_count} items."
+        if self.granularity == PER_FILE:
+            return "Committing after each source."
+        if self.granularity == PER_TABLE:
+            return "Committing after each table."
+        return "Committing once at the end of the run."
+
+    def to_dict(self):
+        """Serializes the policy into a dictionary.
+
+        Returns:
+            dict: serialized policy
+        """
+        return {"granularity": self.granularity, "item_count": self.item_count}
+
+    @staticmethod
+    def from_dict(policy_dict):
+        """Restores a policy from a dictionary.
+
+        Args:
+            policy_dict (dict): serialized policy
+
+        Returns:
+            CommitPolicy: restored policy
+        """
+        return CommitPolicy(policy_dict.get("granularity", PER_RUN), policy_dict.get("item_count", 0))
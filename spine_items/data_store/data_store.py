@@ -27,6 +27,7 @@ from spine_engine import ExecutionDirection
 from spine_engine.utils.serialization import serialize_path, deserialize_path
 from .commands import UpdateDSURLCommand
 from ..commands import UpdateCancelOnErrorCommand
+from ..commit_policy import CommitPolicy, PER_FILE
 from .executable_item import ExecutableItem
 from .item_info import ItemInfo
 from .utils import convert_to_sqlalchemy_url
@@ -34,7 +35,19 @@ from .output_resources import scan_for_resources
 
 
 class DataStore(ProjectItem):
-    def __init__(self, name, description, x, y, toolbox, project, url, cancel_on_error=False):
+    def __init__(
+        self,
+        name,
+        description,
+        x,
+        y,
+        toolbox,
+        project,
+        url,
+        cancel_on_error=False,
+        sqlite_bulk_load=False,
+        commit_policy=None,
+    ):
         """Data Store class.
 
         Args:
@@ -46,6 +59,8 @@ class DataStore(ProjectItem):
             project (SpineToolboxProject): the project this item belongs to
             url (str or dict, optional): SQLAlchemy url
             cancel_on_error (bool): if True, changes will be reverted on errors
+            sqlite_bulk_load (bool): if True, SQLite durability is relaxed while merging data during execution
+            commit_policy (CommitPolicy, optional): when to commit merged data; by default after each source
         """
         super().__init__(name, description, x, y, project)
         self._toolbox = toolbox
@@ -55,6 +70,8 @@ class DataStore(ProjectItem):
         except OSError:
             self._logger.msg_error.emit(f"[OSError] Creating directory {self.logs_dir} failed. Check permissions.")
         self.cancel_on_error = cancel_on_error
+        self.sqlite_bulk_load = sqlite_bulk_load
+        self.commit_policy = commit_policy if commit_policy is not None else CommitPolicy(PER_FILE)
         if url is None:
             url = dict()
         self._url = self.parse_url(url)
@@ -425,6 +442,8 @@ class DataStore(ProjectItem):
         if d["url"]["dialect"] == "sqlite" and d["url"]["database"]:
             d["url"]["database"] = serialize_path(d["url"]["database"], self._project.project_dir)
         d["cancel_on_error"] = self._properties_ui.cancel_on_error_checkBox.isChecked()
+        d["sqlite_bulk_load"] = self.sqlite_bulk_load
+        d["commit_policy"] = self.commit_policy.to_dict()
         return d
 
     def copy_local_data(self, original_data_dir, original_url, duplicate_items):
@@ -457,7 +476,11 @@ class DataStore(ProjectItem):
         if url and not isinstance(url["database"], str):
             url["database"] = deserialize_path(url["database"], project.project_dir)
         cancel_on_error = item_dict.get("cancel_on_error", False)
-        return DataStore(name, description, x, y, toolbox, project, url, cancel_on_error)
+        sqlite_bulk_load = item_dict.get("sqlite_bulk_load", False)
+        commit_policy = CommitPolicy.from_dict(item_dict.get("commit_policy", {"granularity": PER_FILE}))
+        return DataStore(
+            name, description, x, y, toolbox, project, url, cancel_on_error, sqlite_bulk_load, commit_policy
+        )
 
     def rename(self, new_name, rename_data_dir_message):
         """See base class."""
@@ -25,6 +25,28 @@ from spinedb_api import (
     SpineDBVersionError,
     DatabaseMapping,
 )
+from ..commit_policy import EVERY_N_ITEMS
+from ..utils import is_sqlite_url, relax_sqlite_durability
+
+_IMPORT_ORDER = (
+    "alternatives",
+    "scenarios",
+    "scenario_alternatives",
+    "object_classes",
+    "relationship_classes",
+    "parameter_value_lists",
+    "object_parameters",
+    "relationship_parameters",
+    "features",
+    "tools",
+    "tool_features",
+    "tool_feature_methods",
+    "objects",
+    "relationships",
+    "object_groups",
+    "object_parameter_values",
+    "relationship_parameter_values",
+)
 
 
 def _get_db_map(url, logger):
@@ -36,21 +58,42 @@ def _get_db_map(url, logger):
     return db_map
 
 
-def do_work(cancel_on_error, logs_dir, from_urls, to_url, logger):
+def do_work(cancel_on_error, logs_dir, from_urls, to_url, sqlite_bulk_load, commit_policy, logger):
     from_db_maps = [_get_db_map(url, logger) for url in from_urls]
     to_db_map = _get_db_map(to_url, logger)
     if to_db_map is None:
         return (False,)
     from_db_map_data = {db_map: export_data(db_map) for db_map in from_db_maps if db_map is not None}
+    logger.msg.emit(commit_policy.describe())
     all_errors = []
-    for from_db_map, data in from_db_map_data.items():
-        import_count, import_errors = import_data(to_db_map, **data)
+    if sqlite_bulk_load and is_sqlite_url(to_url):
+        relax_sqlite_durability(to_db_map.connection)
+    pending = _PendingImports()
+    last_index = len(from_db_map_data) - 1
+    for index, (from_db_map, data) in enumerate(from_db_map_data.items()):
+        import_count = 0
+        import_errors = []
+        batches = _batches(data, commit_policy)
+        for batch_index, batch in enumerate(batches):
+            batch_count, batch_errors = import_data(to_db_map, **batch)
+            import_count += batch_count
+            import_errors += batch_errors
+            pending.add(batch_count, from_db_map.db_url)
+            if batch_errors and cancel_on_error:
+                break
+            last_batch = index == last_index and batch_index == len(batches) - 1
+            if last_batch:
+                continue
+            if commit_policy.commit_after_table() or commit_policy.commit_after_items(pending.count):
+                pending.commit(to_db_map)
         all_errors += import_errors
         if import_errors and cancel_on_error and to_db_map.has_pending_changes():
             to_db_map.rollback_session()
+            pending.clear()
             continue
+        if commit_policy.commit_after_file() and index != last_index:
+            pending.commit(to_db_map)
         if import_count:
-            to_db_map.commit_session(f"Import {import_count} items from {from_db_map.db_url}")
             logger.msg_success.emit(
                 "Merged {0} items with {1} errors from {2} into {3}".format(
                     import_count, len(import_errors), from_db_map.db_url, to_db_map.db_url
@@ -60,7 +103,10 @@ def do_work(cancel_on_error, logs_dir, from_urls, to_url, logger):
             logger.msg_warning.emit("No new data merged from {0} into {1}".format(from_db_map.db_url, to_db_map.db_url))
     for db_map in from_db_map_data:
         db_map.connection.close()
-    to_db_map.connection.close()
+    try:
+        pending.commit(to_db_map)
+    finally:
+        to_db_map.connection.close()
     if all_errors:
         # Log errors in a time stamped file into the logs directory
         timestamp = create_log_file_timestamp()
@@ -72,3 +118,102 @@ def do_work(cancel_on_error, logs_dir, from_urls, to_url, logger):
         logfile_anchor = f"<a style='color:#BB99FF;' title='{logfilepath}' href='file:///{logfilepath}'>error log</a>"
         logger.msg_error.emit("Import errors. Logfile: {0}".format(logfile_anchor))
     return (bool(from_db_map_data),)
+
+
+def _batches(data, commit_policy):
+    """
+    Splits exported data into batches that are committed separately.
+
+    Item types are batched in import dependency order
+    so items that are referenced by others, e.g. alternatives by parameter values, get imported first.
+
+    Args:
+        data (dict): exported data
+        commit_policy (CommitPolicy): commit policy
+
+    Returns:
+        list of dict: batches of data
+    """
+    if commit_policy.commit_after_table():
+        return [{item_type: items} for item_type, items in _in_import_order(data) if items]
+    if commit_policy.granularity != EVERY_N_ITEMS or commit_policy.item_count <= 0:
+        return [data]
+    batches = list()
+    batch = dict()
+    batch_size = 0
+    for item_type, items in _in_import_order(data):
+        items = list(items)
+        start = 0
+        while start < len(items):
+            count = min(commit_policy.item_count - batch_size, len(items) - start)
+            batch.setdefault(item_type, []).extend(items[start : start + count])
+            batch_size += count
+            start += count
+            if batch_size == commit_policy.item_count:
+                batches.append(batch)
+                batch = dict()
+                batch_size = 0
+    if batch or not batches:
+        batches.append(batch)
+    return batches
+
+
+def _in_import_order(data):
+    """
+    Yields exported data by item type in import dependency order.
+
+    Item types that are not known to be dependencies of others come last in their original order.
+
+    Args:
+        data (dict): exported data
+
+    Yields:
+        tuple: item type and items
+    """
+    for item_type in _IMPORT_ORDER:
+        if item_type in data:
+            yield item_type, data[item_type]
+    for item_type, items in data.items():
+        if item_type not in _IMPORT_ORDER:
+            yield item_type, items
+
+
+class _PendingImports:
+    """Keeps track of imports that have not been committed yet."""
+
+    def __init__(self):
+        self._count = 0
+        self._sources = list()
+
+    @property
+    def count(self):
+        """Number of items imported since last commit."""
+        return self._count
+
+    def add(self, count, source):
+        """Records imported items.
+
+        Args:
+            count (int): number of imported items
+            source (str): source database URL
+        """
+        if not count:
+            return
+        self._count += count
+        if source not in self._sources:
+            self._sources.append(source)
+
+    def clear(self):
+        """Forgets pending imports."""
+        self._count = 0
+        self._sources.clear()
+
+    def commit(self, db_map):
+        """Commits pending imports.
+
+        Args:
+            db_map (DatabaseMapping): target database mapping
+        """
+        if self._count:
+            db_map.commit_session(f"Import {self._count} items from {', '.join(self._sources)}")
+        self.clear()
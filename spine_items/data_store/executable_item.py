@@ -18,15 +18,16 @@ Contains Data Store's executable item as well as support utilities.
 
 from spine_engine.project_item.executable_item_base import ExecutableItemBase
 from spine_engine.utils.serialization import deserialize_path
-from spine_engine.utils.returning_process import ReturningProcess
 from .item_info import ItemInfo
+from ..commit_policy import CommitPolicy, PER_FILE
+from ..process_pool import PooledProcess
 from .utils import convert_to_sqlalchemy_url
 from .do_work import do_work
 from .output_resources import scan_for_resources
 
 
 class ExecutableItem(ExecutableItemBase):
-    def __init__(self, name, url, cancel_on_error, project_dir, logger):
+    def __init__(self, name, url, cancel_on_error, project_dir, logger, sqlite_bulk_load=False, commit_policy=None):
         """
         Args:
             name (str): item's name
@@ -35,10 +36,14 @@ class ExecutableItem(ExecutableItemBase):
             cancel_on_error (bool): if True, revert changes on error and move on
             project_dir (str): absolute path to project directory
             logger (LoggerInterface): a logger
+            sqlite_bulk_load (bool): if True, relax SQLite durability of the connection that merges data
+            commit_policy (CommitPolicy, optional): when to commit merged data; by default after each source
         """
         super().__init__(name, project_dir, logger)
         self._url = url
         self._cancel_on_error = cancel_on_error
+        self._sqlite_bulk_load = sqlite_bulk_load
+        self._commit_policy = commit_policy if commit_policy is not None else CommitPolicy(PER_FILE)
         self._process = None
 
     @staticmethod
@@ -61,7 +66,9 @@ class ExecutableItem(ExecutableItemBase):
             item_dict["url"]["database"] = deserialize_path(item_dict["url"]["database"], project_dir)
         url = convert_to_sqlalchemy_url(item_dict["url"], name, logger)
         cancel_on_error = item_dict["cancel_on_error"]
-        return cls(name, url, cancel_on_error, project_dir, logger)
+        sqlite_bulk_load = item_dict.get("sqlite_bulk_load", False)
+        commit_policy = CommitPolicy.from_dict(item_dict.get("commit_policy", {"granularity": PER_FILE}))
+        return cls(name, url, cancel_on_error, project_dir, logger, sqlite_bulk_load, commit_policy)
 
     @staticmethod
     def _urls_from_resources(resources):
@@ -74,8 +81,17 @@ class ExecutableItem(ExecutableItemBase):
         from_urls = self._urls_from_resources(forward_resources)
         if not from_urls:
             return True
-        self._process = ReturningProcess(
-            target=do_work, args=(self._cancel_on_error, self._logs_dir, from_urls, str(self._url), self._logger)
+        self._process = PooledProcess(
+            target=do_work,
+            args=(
+                self._cancel_on_error,
+                self._logs_dir,
+                from_urls,
+                str(self._url),
+                self._sqlite_bulk_load,
+                self._commit_policy,
+            ),
+            logger=self._logger,
         )
         return_value = self._process.run_until_complete()
         self._process = None
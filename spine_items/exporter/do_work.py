@@ -16,16 +16,19 @@ Exporter's execute kernel (do_work), as target for a multiprocess.Process
 :date:    14.12.2020
 """
 from copy import copy
+from functools import partial
 from pathlib import Path
 from spinedb_api.spine_io.exporters.writer import write, WriterException
 from spinedb_api.spine_io.exporters.csv_writer import CsvWriter
 from spinedb_api.spine_io.exporters.excel_writer import ExcelWriter
 from spinedb_api import clear_filter_configs, DatabaseMapping, SpineDBAPIError
-from spine_items.utils import subdirectory_for_fork
+from spine_items.utils import process_pool_map, subdirectory_for_fork
+from .parquet_writer import ParquetWriter
+from .query_cache import QueryCache
 from .specification import Specification, OutputFormat
 
 
-def do_work(specification, output_time_stamps, cancel_on_error, out_dir, databases, forks, logger):
+def do_work(specification, output_time_stamps, cancel_on_error, out_dir, databases, forks, process_count, logger):
     """
     Exports databases using given specification as export mapping.
 
@@ -36,58 +39,77 @@ def do_work(specification, output_time_stamps, cancel_on_error, out_dir, databas
         out_dir (str): base output directory
         databases (dict): databases to export
         forks (dict): mapping from base database URL to a set of fork names
+        process_count (int): maximum number of worker processes that export databases in parallel
         logger (LoggerInterface): a logger
 
     Returns:
         tuple: boolean success flag, dictionary of output files
     """
-    specification = Specification.from_dict(specification)
-    successes = list()
-    written_files = dict()
+    exports = list()
     for url, output_file_name in databases.items():
         out_path = subdirectory_for_fork(
             output_file_name, out_dir, output_time_stamps, forks[clear_filter_configs(url)]
         )
-        try:
-            database_map = DatabaseMapping(url)
-        except SpineDBAPIError as error:
-            logger.msg_error.emit(f"Failed to export <b>{url}</b>: {error}")
-            if cancel_on_error:
-                return False, written_files
-            successes.append(False)
-            continue
-        try:
-            try:
-                file = Path(out_path)
-                file.parent.mkdir(parents=True, exist_ok=True)
-                if file.exists():
-                    file.unlink()
-                writer = make_writer(specification.output_format, out_path)
-                for mapping_specification in specification.mapping_specifications().values():
-                    mapping = copy(mapping_specification.root)
-                    mapping.drop_non_positioned_tail()
-                    write(database_map, writer, mapping)
-            except (PermissionError, WriterException) as e:
-                logger.msg_error.emit(str(e))
+        exports.append((url, output_file_name, out_path))
+    export = partial(_export_database, specification)
+    successes = list()
+    written_files = dict()
+    with process_pool_map(export, exports, process_count) as results:
+        for (url, output_file_name, out_path), (files, error) in zip(exports, results):
+            if error is not None:
+                logger.msg_error.emit(error)
                 if cancel_on_error:
                     return False, written_files
                 successes.append(False)
+                continue
+            written_files[output_file_name] = files
+            if len(files) > 1:
+                logger.msg_success.emit(f"Wrote multiple files:<br>{'<br>'.join(files)}")
             else:
-                if isinstance(writer, CsvWriter):
-                    files = writer.output_files()
-                else:
-                    files = [out_path]
-                written_files[output_file_name] = files
-                if len(files) > 1:
-                    logger.msg_success.emit(f"Wrote multiple files:<br>{'<br>'.join(files)}")
-                else:
-                    logger.msg_success.emit(f"File <b>{out_path}</b> written.")
-                successes.append(True)
-        finally:
-            database_map.connection.close()
+                logger.msg_success.emit(f"File <b>{out_path}</b> written.")
+            successes.append(True)
     return all(successes), written_files
 
 
+def _export_database(specification, export):
+    """
+    Exports a single database.
+
+    Args:
+        specification (dict): export specification dictionary
+        export (tuple): database URL, output file name and output path
+
+    Returns:
+        tuple: list of written files and None if export succeeded, None and an error message otherwise
+    """
+    url, _, out_path = export
+    specification = Specification.from_dict(specification)
+    try:
+        database_map = DatabaseMapping(url)
+    except SpineDBAPIError as error:
+        return None, f"Failed to export <b>{url}</b>: {error}"
+    try:
+        file = Path(out_path)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        if file.exists():
+            file.unlink()
+        writer = make_writer(specification.output_format, out_path)
+        cached_database_map = QueryCache(database_map).database_map
+        for mapping_specification in specification.mapping_specifications().values():
+            mapping = copy(mapping_specification.root)
+            mapping.drop_non_positioned_tail()
+            if isinstance(writer, ParquetWriter):
+                writer.first_row_is_header = any(m.header for m in mapping.flatten())
+            write(cached_database_map, writer, mapping)
+    except (PermissionError, WriterException) as e:
+        return None, str(e)
+    finally:
+        database_map.connection.close()
+    if isinstance(writer, (CsvWriter, ParquetWriter)):
+        return writer.output_files(), None
+    return [out_path], None
+
+
 def make_writer(output_format, out_path):
     """
     Constructs a writer.
@@ -102,4 +124,7 @@ def make_writer(output_format, out_path):
     if output_format == OutputFormat.CSV:
         path = Path(out_path)
         return CsvWriter(path.parent, path.name)
+    if output_format == OutputFormat.PARQUET:
+        path = Path(out_path)
+        return ParquetWriter(path.parent, path.name)
     return ExcelWriter(out_path)
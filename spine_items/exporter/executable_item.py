@@ -17,18 +17,28 @@ Contains Exporter's executable item as well as support utilities.
 """
 from json import dump
 from pathlib import Path
-from spine_engine.utils.returning_process import ReturningProcess
 from spine_engine.utils.serialization import deserialize_path
 from spinedb_api import clear_filter_configs
 from spine_items.utils import Database
 from .do_work import do_work
+from .export_record import export_stamp, ExportRecord, specification_hash
 from ..executable_item_base import ExporterExecutableItemBase
+from ..process_pool import PooledProcess
 from .item_info import ItemInfo
 
 
 class ExecutableItem(ExporterExecutableItemBase):
     def __init__(
-        self, name, specification, databases, output_time_stamps, cancel_on_error, gams_path, project_dir, logger
+        self,
+        name,
+        specification,
+        databases,
+        output_time_stamps,
+        cancel_on_error,
+        gams_path,
+        project_dir,
+        logger,
+        export_process_count=1,
     ):
         """
         Args:
@@ -40,9 +50,11 @@ class ExecutableItem(ExporterExecutableItemBase):
             gams_path (str): GAMS path from Toolbox settings
             project_dir (str): absolute path to project directory
             logger (LoggerInterface): a logger
+            export_process_count (int): maximum number of worker processes that export databases in parallel
         """
         super().__init__(name, databases, output_time_stamps, cancel_on_error, gams_path, project_dir, logger)
         self._specification = specification
+        self._export_process_count = export_process_count
 
     @staticmethod
     def item_type():
@@ -58,30 +70,66 @@ class ExecutableItem(ExporterExecutableItemBase):
             return True
         database_urls = [r.url for r in forward_resources if r.type_ == "database"]
         databases, self._forks = self._databases_and_forks(database_urls)
-        out_dir = Path(self._data_dir, "output")
-        self._process = ReturningProcess(
-            target=do_work,
-            args=(
-                self._specification.to_dict(),
-                self._output_time_stamps,
-                self._cancel_on_error,
-                str(out_dir),
-                databases,
-                self._forks,
-                self._logger,
-            ),
-        )
-        result = self._process.run_until_complete()
-        success = result[0]
-        # result contains only the success flag if execution was forcibly stopped.
-        if len(result) > 1:
-            self._result_files = result[1]
-            file_name = "__export-manifest-" + self.filter_id + ".json" if self.filter_id else "__export-manifest.json"
-            with open(Path(self._data_dir, file_name), "w") as manifest:
-                dump(self._result_files, manifest)
-        self._process = None
+        specification_dict = self._specification.to_dict()
+        record = ExportRecord(str(Path(self._data_dir, self._file_name_for_filter("__export-record"))))
+        hash_ = specification_hash(specification_dict)
+        stamps = {url: export_stamp(url, hash_, self._output_time_stamps) for url in databases}
+        result_files = dict()
+        for url, output_file_name in list(databases.items()):
+            files = record.up_to_date_files(output_file_name, stamps[url])
+            if files is not None:
+                result_files[output_file_name] = files
+                del databases[url]
+        if result_files:
+            self._logger.msg.emit(
+                f"<b>{self.name}</b>: Databases and specification unchanged since last export. "
+                f"Reusing {', '.join(result_files)}."
+            )
+        success = True
+        if databases:
+            out_dir = Path(self._data_dir, "output")
+            self._process = PooledProcess(
+                target=do_work,
+                args=(
+                    specification_dict,
+                    self._output_time_stamps,
+                    self._cancel_on_error,
+                    str(out_dir),
+                    databases,
+                    self._forks,
+                    self._export_process_count,
+                ),
+                logger=self._logger,
+            )
+            result = self._process.run_until_complete()
+            self._process = None
+            success = result[0]
+            # result contains only the success flag if execution was forcibly stopped.
+            if len(result) == 1:
+                return success
+            written_files = result[1]
+            for url, output_file_name in databases.items():
+                files = written_files.get(output_file_name)
+                if files is not None:
+                    record.update(output_file_name, stamps[url], files)
+            record.save()
+            result_files.update(written_files)
+        self._result_files = result_files
+        with open(Path(self._data_dir, self._file_name_for_filter("__export-manifest")), "w") as manifest:
+            dump(self._result_files, manifest)
         return success
 
+    def _file_name_for_filter(self, base_name):
+        """Appends filter id to given file name if item is being executed with filters.
+
+        Args:
+            base_name (str): file name without extension
+
+        Returns:
+            str: JSON file name
+        """
+        return base_name + "-" + self.filter_id + ".json" if self.filter_id else base_name + ".json"
+
     @classmethod
     def from_dict(cls, item_dict, name, project_dir, app_settings, specifications, logger):
         """See base class."""
@@ -97,6 +145,15 @@ class ExecutableItem(ExporterExecutableItemBase):
         output_time_stamps = item_dict.get("output_time_stamps", False)
         cancel_on_error = item_dict.get("cancel_on_error", True)
         gams_path = app_settings.value("appSettings/gamsPath", defaultValue=None)
+        export_process_count = item_dict.get("export_process_count", 1)
         return ExecutableItem(
-            name, specification, databases, output_time_stamps, cancel_on_error, gams_path, project_dir, logger
+            name,
+            specification,
+            databases,
+            output_time_stamps,
+            cancel_on_error,
+            gams_path,
+            project_dir,
+            logger,
+            export_process_count,
         )
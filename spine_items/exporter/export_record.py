@@ -0,0 +1,128 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Contains Exporter's export record that keeps track of what has been exported into which output files.
+
+:date:    18.10.2026
+"""
+import hashlib
+import json
+import os.path
+from spinedb_api import clear_filter_configs, load_filters
+from spinedb_api.filters.tools import filter_configs
+from ..utils import latest_commit
+
+
+class ExportRecord:
+    """
+    Records the state of the database and the specification each output file was exported from.
+
+    Entries are stored per output file name.
+    An entry matches when the database's latest commit, the filter configuration,
+    the specification and the output settings are the same as during the export and all output files still exist.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): path to record file
+        """
+        self._path = path
+        self._exports = dict()
+        if os.path.exists(path):
+            try:
+                with open(path) as record_file:
+                    self._exports = json.load(record_file).get("exports", {})
+            except (OSError, ValueError):
+                self._exports = dict()
+
+    def up_to_date_files(self, output_file_name, stamp):
+        """
+        Returns the files of a previous export if nothing has changed since.
+
+        Args:
+            output_file_name (str): output file name
+            stamp (dict, optional): export stamp from :func:`export_stamp`
+
+        Returns:
+            list of str: paths to previously written files or None if output file needs to be exported again
+        """
+        if stamp is None:
+            return None
+        entry = self._exports.get(output_file_name)
+        if entry is None or entry["stamp"] != stamp:
+            return None
+        files = entry["files"]
+        if not files or not all(os.path.isfile(path) for path in files):
+            return None
+        return files
+
+    def update(self, output_file_name, stamp, files):
+        """
+        Records a successful export.
+
+        Args:
+            output_file_name (str): output file name
+            stamp (dict, optional): export stamp from :func:`export_stamp`
+            files (Iterable of str): paths to written files
+        """
+        if stamp is None:
+            self._exports.pop(output_file_name, None)
+            return
+        self._exports[output_file_name] = {"stamp": stamp, "files": sorted(files)}
+
+    def save(self):
+        """Writes the record to disk."""
+        with open(self._path, "w") as record_file:
+            json.dump({"exports": self._exports}, record_file, indent=4)
+
+
+def export_stamp(url, specification_hash, output_time_stamps):
+    """
+    Collects the state that determines the contents of an output file.
+
+    Args:
+        url (str): database URL including filter configurations
+        specification_hash (str): hash of the export specification
+        output_time_stamps (bool): True if output files go into time stamped directories
+
+    Returns:
+        dict: JSON compatible stamp or None if database's latest commit could not be determined
+    """
+    commit = latest_commit(clear_filter_configs(url))
+    if commit is None:
+        return None
+    try:
+        filters = load_filters(filter_configs(url))
+    except (OSError, ValueError):
+        return None
+    stamp = {
+        "commit": commit,
+        "filters": filters,
+        "specification_hash": specification_hash,
+        "output_time_stamps": output_time_stamps,
+    }
+    return json.loads(json.dumps(stamp, default=str))
+
+
+def specification_hash(specification_dict):
+    """
+    Calculates a hash of export specification.
+
+    Args:
+        specification_dict (dict): serialized specification
+
+    Returns:
+        str: hex digest
+    """
+    serialized = json.dumps(specification_dict, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
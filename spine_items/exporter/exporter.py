@@ -40,6 +40,7 @@ class Exporter(ExporterBase):
         databases=None,
         output_time_stamps=False,
         cancel_on_error=True,
+        export_process_count=1,
     ):
         """
         Args:
@@ -50,9 +51,11 @@ class Exporter(ExporterBase):
             toolbox (QWidget): parent window
             project (SpineToolboxProject): the project this item belongs to
             specification_name (str, optional): exporter specification
+            export_process_count (int): maximum number of worker processes that export databases in parallel
         """
         super().__init__(name, description, x, y, toolbox, project, databases, output_time_stamps, cancel_on_error)
         self._specification_name = specification_name
+        self.export_process_count = export_process_count
         self._specification = self._toolbox.specification_model.find_specification(specification_name)
         if specification_name and not self._specification:
             self._toolbox.msg_error.emit(
@@ -78,6 +81,7 @@ class Exporter(ExporterBase):
         """See base class."""
         serialized = super().item_dict()
         serialized["specification"] = self._specification_name
+        serialized["export_process_count"] = self.export_process_count
         return serialized
 
     @staticmethod
@@ -92,6 +96,7 @@ class Exporter(ExporterBase):
         output_time_stamps = item_dict.get("output_time_stamps", False)
         cancel_on_error = item_dict.get("cancel_on_error", True)
         specification_name = item_dict.get("specification", "")
+        export_process_count = item_dict.get("export_process_count", 1)
         specification = toolbox.specification_model.find_specification(specification_name)
         if specification_name and not specification:
             toolbox.msg_error.emit(f"Exporter <b>{name}</b> specification <b>{specification_name}</b> not found")
@@ -106,6 +111,7 @@ class Exporter(ExporterBase):
             databases,
             output_time_stamps,
             cancel_on_error,
+            export_process_count,
         )
 
     def make_signal_handler_dict(self):
@@ -0,0 +1,279 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Contains an export writer that writes tables into Parquet files.
+
+:date:    18.10.2026
+"""
+from datetime import datetime
+from itertools import product
+from numbers import Real
+import os
+import os.path
+import numpy
+from spinedb_api.parameter_value import DateTime, IndexedValue
+from spinedb_api.spine_io.exporters.writer import Writer, WriterException
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+class ParquetWriter(Writer):
+    """An export writer that writes each table into its own Parquet file.
+
+    Rows are buffered and written one row group at a time.
+    Column types are inferred from a file's first row group:
+    numbers become float64 columns, date times become timestamps and other values become strings.
+    Indexed values such as time series are expanded into long form:
+    every index gets a row of its own and the indexes go into an additional column.
+    """
+
+    DEFAULT_ROW_GROUP_SIZE = 65536
+
+    def __init__(self, path, backup_file_name, row_group_size=DEFAULT_ROW_GROUP_SIZE):
+        """
+        Args:
+            path (Path or str): path to output directory
+            backup_file_name (str): output file name if no table name is provided by the mappings
+            row_group_size (int): maximum number of rows in a row group
+        """
+        if pyarrow is None:
+            raise WriterException("Parquet output requires pyarrow. Install it to export Parquet files.")
+        super().__init__()
+        self._path = path
+        self._default_table_name = backup_file_name
+        self._row_group_size = row_group_size
+        self._current_table = None
+        self._finished_files = list()
+        self._expect_header = False
+        self.first_row_is_header = False
+        """If True, the first row of each table is used as column names."""
+
+    def finish_table(self):
+        """See base class."""
+        try:
+            self._current_table.close()
+        except (pyarrow.ArrowException, OSError) as error:
+            raise WriterException(f"Failed to write {self._current_table.file_name}: {error}") from error
+        self._finished_files.append(self._current_table.file_name)
+        self._current_table = None
+
+    def output_files(self):
+        """Returns absolute paths to files that have been written.
+
+        Returns:
+            list of str: file paths
+        """
+        return list(self._finished_files)
+
+    def start_table(self, table_name):
+        """See base class."""
+        file_name = os.path.join(self._path, table_name + ".parquet" if table_name else self._default_table_name)
+        if file_name in self._finished_files:
+            raise WriterException(
+                f"Parquet table {os.path.basename(file_name)} has been written already; "
+                "give each mapping a table name of its own."
+            )
+        if os.path.exists(file_name):
+            os.remove(file_name)
+        self._current_table = _ParquetTable(file_name)
+        self._expect_header = self.first_row_is_header
+        return True
+
+    def write_row(self, row):
+        """See base class."""
+        if self._expect_header:
+            self._current_table.column_names = [str(name) if name is not None else None for name in row]
+            self._expect_header = False
+            return True
+        self._current_table.append(row)
+        if len(self._current_table) >= self._row_group_size:
+            try:
+                self._current_table.flush()
+            except (pyarrow.ArrowException, OSError) as error:
+                raise WriterException(f"Failed to write {self._current_table.file_name}: {error}") from error
+        return True
+
+
+class _ParquetTable:
+    """Buffers the rows of a single Parquet file and writes them in row groups."""
+
+    def __init__(self, file_name):
+        """
+        Args:
+            file_name (str): path to output file
+        """
+        self.file_name = file_name
+        self.column_names = None
+        self._rows = list()
+        self._indexes = list()
+        self._schema = None
+        self._columns = None
+        self._writer = None
+
+    def __len__(self):
+        return len(self._rows)
+
+    def append(self, row):
+        """Buffers a row expanding its indexed values into long form.
+
+        Args:
+            row (list): row cells
+        """
+        indexed = [column for column, cell in enumerate(row) if isinstance(cell, IndexedValue)]
+        if not indexed:
+            self._rows.append([_plain(cell) for cell in row])
+            self._indexes.append({})
+            return
+        expansions = [list(zip(row[column].indexes, row[column].values)) for column in indexed]
+        for combination in product(*expansions):
+            cells = [_plain(cell) for cell in row]
+            indexes = dict()
+            for column, (index, value) in zip(indexed, combination):
+                cells[column] = _plain(value)
+                indexes[column] = _plain(index)
+            self._rows.append(cells)
+            self._indexes.append(indexes)
+
+    def flush(self):
+        """Writes buffered rows as a row group."""
+        if not self._rows:
+            return
+        if self._schema is None:
+            self._create_schema()
+        else:
+            self._check_shape()
+        arrays = list()
+        for (column, is_index), field in zip(self._columns, self._schema):
+            if is_index:
+                values = [indexes.get(column) for indexes in self._indexes]
+            else:
+                values = [row[column] if column < len(row) else None for row in self._rows]
+            arrays.append(_to_array(values, field))
+        table = pyarrow.Table.from_arrays(arrays, schema=self._schema)
+        if self._writer is None:
+            self._writer = pyarrow.parquet.ParquetWriter(self.file_name, self._schema)
+        self._writer.write_table(table, row_group_size=len(self._rows))
+        self._rows = list()
+        self._indexes = list()
+
+    def close(self):
+        """Writes remaining rows and closes the file."""
+        self.flush()
+        if self._writer is None:
+            if self._schema is None:
+                self._create_schema()
+            self._writer = pyarrow.parquet.ParquetWriter(self.file_name, self._schema)
+        self._writer.close()
+
+    def _create_schema(self):
+        """Infers column names and types from buffered rows."""
+        column_count = max((len(row) for row in self._rows), default=0)
+        names = list(self.column_names) if self.column_names is not None else []
+        column_count = max(column_count, len(names))
+        names += (column_count - len(names)) * [None]
+        names = [name if name else f"column_{column + 1}" for column, name in enumerate(names)]
+        indexed_columns = set()
+        for indexes in self._indexes:
+            indexed_columns.update(indexes)
+        self._columns = list()
+        fields = list()
+        for column, name in enumerate(names):
+            if column in indexed_columns:
+                self._columns.append((column, True))
+                index_values = (indexes.get(column) for indexes in self._indexes)
+                fields.append(pyarrow.field(name + "_index", _infer_type(index_values)))
+            self._columns.append((column, False))
+            values = (row[column] for row in self._rows if column < len(row))
+            fields.append(pyarrow.field(name, _infer_type(values)))
+        self._schema = pyarrow.schema(fields)
+
+    def _check_shape(self):
+        """Raises if buffered rows do not fit into the schema inferred from the first row group."""
+        column_count = len([column for column, is_index in self._columns if not is_index])
+        indexed_columns = {column for column, is_index in self._columns if is_index}
+        if any(len(row) > column_count for row in self._rows):
+            raise WriterException(
+                f"{os.path.basename(self.file_name)} has rows longer than the {column_count} columns "
+                "of its first row group."
+            )
+        if any(not indexed_columns.issuperset(indexes) for indexes in self._indexes):
+            raise WriterException(
+                f"{os.path.basename(self.file_name)} has indexed values in columns that had none in its first row group."
+            )
+
+
+def _plain(value):
+    """Converts a cell value into a Python scalar that maps to a column type.
+
+    Args:
+        value (Any): cell value
+
+    Returns:
+        float, bool, datetime, str or None: plain value
+    """
+    if value is None or isinstance(value, (bool, str, datetime)):
+        return value
+    if isinstance(value, numpy.bool_):
+        return bool(value)
+    if isinstance(value, Real):
+        return float(value)
+    if isinstance(value, DateTime):
+        value = value.value
+    if isinstance(value, numpy.datetime64):
+        return value.astype("datetime64[us]").item()
+    if isinstance(value, datetime):
+        return value
+    return str(value)
+
+
+def _infer_type(values):
+    """Chooses the narrowest column type that fits all values.
+
+    Args:
+        values (Iterable): plain values
+
+    Returns:
+        DataType: column type
+    """
+    types = {type(value) for value in values if value is not None}
+    if types == {float}:
+        return pyarrow.float64()
+    if types == {bool}:
+        return pyarrow.bool_()
+    if types == {datetime}:
+        return pyarrow.timestamp("us")
+    return pyarrow.string()
+
+
+def _to_array(values, field):
+    """Converts plain values into an Arrow array of given field's type.
+
+    Args:
+        values (list): plain values
+        field (Field): column field
+
+    Returns:
+        Array: column data
+    """
+    if pyarrow.types.is_string(field.type):
+        values = [str(value) if value is not None else None for value in values]
+    try:
+        return pyarrow.array(values, type=field.type)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError) as error:
+        raise WriterException(
+            f"Column {field.name} holds values of different types; "
+            f"its type was inferred as {field.type} from the first row group: {error}"
+        ) from error
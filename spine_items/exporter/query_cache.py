@@ -0,0 +1,127 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Contains a query cache that is shared by all mappings of one export.
+
+:date:    18.10.2026
+"""
+from sqlalchemy.orm import Query
+
+
+class QueryCache:
+    """Memoizes query results per database map for the life of one export.
+
+    Export mappings build their queries from the database map's subqueries.
+    Mappings that export the same items from the same classes end up running identical queries;
+    with the cache, each distinct query is executed once and later mappings read its rows from memory.
+    """
+
+    def __init__(self, db_map):
+        """
+        Args:
+            db_map (DatabaseMappingBase): database map to query
+        """
+        self._db_map = db_map
+        self._results = dict()
+        self.hit_count = 0
+        self.miss_count = 0
+
+    @property
+    def database_map(self):
+        """A stand-in for the database map that runs its queries through the cache."""
+        return _CachingDatabaseMapping(self._db_map, self)
+
+    def clear(self):
+        """Drops all cached results."""
+        self._results.clear()
+
+    def rows(self, query):
+        """Returns the result rows of a query executing it only if it has not been executed before.
+
+        Args:
+            query (Query): query
+
+        Returns:
+            list: result rows
+        """
+        key = _query_key(query)
+        rows = self._results.get(key)
+        if rows is None:
+            self.miss_count += 1
+            rows = query.all()
+            self._results[key] = rows
+        else:
+            self.hit_count += 1
+        return rows
+
+
+class _CachingDatabaseMapping:
+    """Forwards everything to a database map but wraps its queries into :class:`_CachedQuery`."""
+
+    def __init__(self, db_map, cache):
+        """
+        Args:
+            db_map (DatabaseMappingBase): database map
+            cache (QueryCache): query cache
+        """
+        self._db_map = db_map
+        self._cache = cache
+
+    def __getattr__(self, name):
+        return getattr(self._db_map, name)
+
+    def query(self, *args, **kwargs):
+        return _CachedQuery(self._db_map.query(*args, **kwargs), self._cache)
+
+
+class _CachedQuery:
+    """Wraps a query so that its rows come from the cache."""
+
+    def __init__(self, query, cache):
+        """
+        Args:
+            query (Query): wrapped query
+            cache (QueryCache): query cache
+        """
+        self._query = query
+        self._cache = cache
+
+    def __getattr__(self, name):
+        attribute = getattr(self._query, name)
+        if not callable(attribute):
+            return attribute
+
+        def wrapped(*args, **kwargs):
+            result = attribute(*args, **kwargs)
+            return _CachedQuery(result, self._cache) if isinstance(result, Query) else result
+
+        return wrapped
+
+    def __iter__(self):
+        return iter(self._cache.rows(self._query))
+
+    def all(self):
+        return list(self._cache.rows(self._query))
+
+
+def _query_key(query):
+    """Returns a hashable key that identifies a query's SQL and its parameters.
+
+    Args:
+        query (Query): query
+
+    Returns:
+        tuple: key
+    """
+    compiled = query.statement.compile()
+    parameters = tuple(sorted((name, repr(value)) for name, value in compiled.params.items()))
+    return str(compiled), parameters
@@ -47,6 +47,7 @@ class MappingType(Enum):
 class OutputFormat(Enum):
     CSV = "csv"
     EXCEL = "Excel"
+    PARQUET = "Parquet"
 
 
 class MappingSpecification:
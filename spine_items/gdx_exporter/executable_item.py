@@ -19,9 +19,9 @@ from json import dump
 from pathlib import Path
 from spinedb_api.spine_io.exporters import gdx
 from spine_engine.utils.serialization import deserialize_path
-from spine_engine.utils.returning_process import ReturningProcess
 from spine_items.utils import Database
 from ..executable_item_base import ExporterExecutableItemBase
+from ..process_pool import PooledProcess
 from .do_work import do_work
 from .item_info import ItemInfo
 from .settings_pack import SettingsPack
@@ -63,7 +63,7 @@ class ExecutableItem(ExporterExecutableItemBase):
             self._logger.msg_error.emit(f"<b>{self.name}</b>: Cannot proceed. No GAMS installation found.")
             return False
         databases, self._forks = self._databases_and_forks(database_urls)
-        self._process = ReturningProcess(
+        self._process = PooledProcess(
             target=do_work,
             args=(
                 self._settings_pack,
@@ -73,8 +73,8 @@ class ExecutableItem(ExporterExecutableItemBase):
                 gams_system_directory,
                 databases,
                 self._forks,
-                self._logger,
             ),
+            logger=self._logger,
         )
         result = self._process.run_until_complete()
         success = result[0]
@@ -0,0 +1,77 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Contains a database source connector that fetches rows in batches.
+
+:date:    18.10.2026
+"""
+from spinedb_api.spine_io.importers.sqlalchemy_connector import SqlAlchemyConnector
+
+
+class BatchedSqlAlchemyConnector(SqlAlchemyConnector):
+    """A SqlAlchemyConnector that streams table rows through a server-side cursor a batch at a time.
+
+    Only one batch of rows is held in memory at a time, unlike with the base class which loads the entire table.
+    """
+
+    DEFAULT_BATCH_SIZE = 10000
+
+    def __init__(self, settings):
+        """
+        Args:
+            settings (dict, optional): connector settings; ``fetch_batch_size`` sets the number of rows per fetch
+        """
+        super().__init__(settings)
+        batch_size = settings.get("fetch_batch_size") if settings is not None else None
+        self._batch_size = batch_size if batch_size else self.DEFAULT_BATCH_SIZE
+
+    @property
+    def batch_size(self):
+        """Number of rows fetched from the database at a time."""
+        return self._batch_size
+
+    def get_data_iterator(self, table, options, max_rows=-1):
+        """See base class."""
+        db_table = self._metadata.tables[table]
+        header = [str(name) for name in db_table.columns.keys()]
+        statement = db_table.select()
+        if max_rows > 0:
+            statement = statement.limit(max_rows)
+        return _fetch_in_batches(self._engine, statement, self._batch_size), header, len(header)
+
+
+def _fetch_in_batches(engine, statement, batch_size):
+    """
+    Executes a statement and yields result rows fetching them in batches.
+
+    Args:
+        engine (Engine): database engine
+        statement (Select): select statement
+        batch_size (int): number of rows to fetch at a time
+
+    Yields:
+        list: row
+    """
+    connection = engine.connect().execution_options(stream_results=True)
+    try:
+        result = connection.execute(statement)
+        try:
+            while True:
+                rows = result.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield list(row)
+        finally:
+            result.close()
+    finally:
+        connection.close()
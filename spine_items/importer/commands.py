@@ -679,6 +679,32 @@ class SetColumnOrRowType(QUndoCommand):
         self._header_widget.set_data_types(self._source_table_name, self._sections, self._previous_type)
 
 
+class SetInferredColumnTypes(QUndoCommand):
+    """Command to apply inferred types to columns."""
+
+    def __init__(self, source_table_name, header_widget, new_types, previous_types):
+        """
+        Args:
+            source_table_name (src): name of the source table
+            header_widget (HeaderWithButton): horizontal header widget
+            new_types (dict): mapping from column index to inferred conversion specification
+            previous_types (dict): mapping from column index to previous conversion specification
+        """
+        super().__init__("infer column types")
+        self._source_table_name = source_table_name
+        self._header_widget = header_widget
+        self._new_types = new_types
+        self._previous_types = previous_types
+
+    def redo(self):
+        """Sets inferred column types."""
+        _set_column_types(self._source_table_name, self._header_widget, self._new_types)
+
+    def undo(self):
+        """Restores column types to their previous values."""
+        _set_column_types(self._source_table_name, self._header_widget, self._previous_types)
+
+
 class RestoreMappingsFromDict(QUndoCommand):
     """Restores mappings from a dict."""
 
@@ -700,3 +726,19 @@ class RestoreMappingsFromDict(QUndoCommand):
     def undo(self):
         """Reverts back to previous mappings."""
         self._import_editor.import_mappings(self._previous_mapping_dict)
+
+
+def _set_column_types(source_table_name, header_widget, types):
+    """Sets column types one conversion specification at a time.
+
+    Args:
+        source_table_name (src): name of the source table
+        header_widget (HeaderWithButton): horizontal header widget
+        types (dict): mapping from column index to conversion specification
+    """
+    columns_by_type = dict()
+    for column, convert_spec in types.items():
+        key = repr(convert_spec.to_json_value())
+        columns_by_type.setdefault(key, (convert_spec, list()))[1].append(column)
+    for convert_spec, columns in columns_by_type.values():
+        header_widget.set_data_types(source_table_name, columns, convert_spec)
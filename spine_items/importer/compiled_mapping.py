@@ -0,0 +1,122 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Contains a compiled form of Importer specification's mappings.
+
+:date:    18.10.2026
+"""
+import copy
+from spinedb_api import item_mapping_from_dict
+from spinedb_api.json_mapping import read_with_mapping
+from spinedb_api.spine_io.type_conversion import value_to_convert_spec
+
+
+class CompiledTable:
+    """Parsed mappings, options and convert specs of a single source table."""
+
+    def __init__(self, mappings, options, column_types, row_types):
+        """
+        Args:
+            mappings (list of ItemMappingBase): parsed item mappings
+            options (dict): table options
+            column_types (dict): mapping from column index to convert spec
+            row_types (dict): mapping from row index to convert spec
+        """
+        self.mappings = mappings
+        self.options = options
+        self.column_types = column_types
+        self.row_types = row_types
+        self.pivoted = any(mapping.is_pivoted() for mapping in mappings)
+
+    def map_rows(self, rows, column_count, header, first_row=0):
+        """
+        Maps rows of the table.
+
+        Args:
+            rows (Iterable): source rows
+            column_count (int): number of columns in table
+            header (list): table header
+            first_row (int): index of the first row in ``rows`` within the table
+
+        Returns:
+            tuple: mapped data and a list of errors
+        """
+        mappings = self.mappings if first_row == 0 else _shift_read_start_row(self.mappings, first_row)
+        return read_with_mapping(rows, mappings, column_count, header, self.column_types, self.row_types)
+
+
+def compile_table(mappings, options=None, column_types=None, row_types=None):
+    """
+    Compiles a table's mappings.
+
+    Args:
+        mappings (dict or ItemMappingBase or list): mapping dicts or mappings
+        options (dict, optional): table options
+        column_types (dict, optional): mapping from column index to convert spec or its JSON value
+        row_types (dict, optional): mapping from row index to convert spec or its JSON value
+
+    Returns:
+        CompiledTable: compiled table
+    """
+    if not isinstance(mappings, list):
+        mappings = [mappings]
+    mappings = [item_mapping_from_dict(m) if isinstance(m, dict) else m for m in mappings]
+    return CompiledTable(
+        mappings, options if options is not None else {}, _convert_specs(column_types), _convert_specs(row_types)
+    )
+
+
+def compile_specification(mapping):
+    """
+    Compiles the selected tables of Importer specification's mapping dict.
+
+    Args:
+        mapping (dict): Importer specification's mapping
+
+    Returns:
+        dict: mapping from table name to :class:`CompiledTable`
+    """
+    selected_tables = mapping.get("selected_tables", [])
+    table_options = mapping.get("table_options", {})
+    table_types = mapping.get("table_types", {})
+    table_row_types = mapping.get("table_row_types", {})
+    return {
+        table: compile_table(mappings, table_options.get(table), table_types.get(table), table_row_types.get(table))
+        for table, mappings in mapping.get("table_mappings", {}).items()
+        if table in selected_tables
+    }
+
+
+def _convert_specs(types):
+    """Resolves convert specs from their JSON values."""
+    if not types:
+        return {}
+    return {int(i): value_to_convert_spec(spec) for i, spec in types.items()}
+
+
+def _shift_read_start_row(mappings, first_row):
+    """
+    Adjusts mappings' read start row for a chunk that does not begin from the first row of the table.
+
+    Args:
+        mappings (list of ItemMappingBase): mappings
+        first_row (int): index of chunk's first row within the table
+
+    Returns:
+        list of ItemMappingBase: adjusted copies of mappings
+    """
+    shifted = list()
+    for mapping in mappings:
+        mapping = copy.copy(mapping)
+        mapping.read_start_row = max(mapping.read_start_row - first_row, 0)
+        shifted.append(mapping)
+    return shifted
@@ -16,8 +16,20 @@ Contains ConnectionManager class.
 :date:   1.6.2019
 """
 
+from collections import OrderedDict
+import json
+import os.path
+import threading
 from PySide2.QtCore import QObject, QThread, Signal, Slot
 from PySide2.QtWidgets import QFileDialog
+from .compiled_mapping import compile_table
+from .type_inference import infer_column_types, sample_rows
+
+_DATA_REQUEST = "data"
+_MAPPED_DATA_REQUEST = "mapped data"
+_TYPE_INFERENCE_REQUEST = "type inference"
+_STALENESS_CHECK_INTERVAL = 1000
+"""Number of rows to read between checks for newer data requests."""
 
 
 class ConnectionManager(QObject):
@@ -25,9 +37,10 @@ class ConnectionManager(QObject):
     """
 
     start_table_get = Signal()
-    start_data_get = Signal(str, dict, int)
-    start_mapped_data_get = Signal(dict, dict, dict, dict, int)
+    start_data_get = Signal(str, dict, int, int)
+    start_mapped_data_get = Signal(dict, dict, dict, dict, int, int)
     start_default_mapping_get = Signal()
+    start_type_inference = Signal(str, dict, int, int)
 
     connection_failed = Signal(str)
     """Signal with error message if connection fails  """
@@ -53,12 +66,21 @@ class ConnectionManager(QObject):
     mapped_data_ready = Signal(dict, list)
     """mapped data read from data source  """
 
+    mapped_table_data_ready = Signal(dict, list)
+    """mapped data read from data source as a dict from table name to mapped data, and a list of errors"""
+
     default_mapping_ready = Signal(dict)
     """default mapping ready from data source  """
 
+    column_types_inferred = Signal(str, dict)
+    """Emitted with table name and a dict from column to TypeProposal when column types have been inferred."""
+
     current_table_changed = Signal()
     """Emitted when the current table has changed."""
 
+    PREVIEW_CACHE_SIZE = 16
+    """Maximum number of table previews to keep in cache."""
+
     def __init__(self, connection, connection_settings):
         """
         Args:
@@ -76,6 +98,8 @@ class ConnectionManager(QObject):
         self._connection = connection
         self._connection_settings = connection_settings
         self._is_connected = False
+        self._preview_cache = PreviewCache(self.PREVIEW_CACHE_SIZE)
+        self._generations = RequestGenerations()
 
     @property
     def connection(self):
@@ -141,8 +165,14 @@ class ConnectionManager(QObject):
         """
         if self.is_connected:
             options = self._table_options.get(self._current_table, {})
+            generation = self._generations.next(_DATA_REQUEST)
+            cached = self._preview_cache.get(self._source, table, options, max_rows)
+            if cached is not None:
+                data, header = cached
+                self.data_ready.emit(data, header)
+                return
             self.fetching_data.emit()
-            self.start_data_get.emit(table, options, max_rows)
+            self.start_data_get.emit(table, options, max_rows, generation)
 
     def request_mapped_data(self, table_mappings, max_rows=-1):
         """Get mapped data from csv file
@@ -159,8 +189,22 @@ class ConnectionManager(QObject):
                 options[table_name] = self._table_options.get(table_name, {})
                 types.setdefault(table_name, self._table_types.get(table_name, {}))
                 row_types.setdefault(table_name, self._table_row_types.get(table_name, {}))
+            generation = self._generations.next(_MAPPED_DATA_REQUEST)
+            self.fetching_data.emit()
+            self.start_mapped_data_get.emit(table_mappings, options, types, row_types, max_rows, generation)
+
+    def request_type_inference(self, table, sample_size):
+        """Requests column type proposals for a table.
+
+        Args:
+            table (str): source table name
+            sample_size (int): number of rows to sample across the table
+        """
+        if self.is_connected:
+            options = self._table_options.get(table, {})
+            generation = self._generations.next(_TYPE_INFERENCE_REQUEST)
             self.fetching_data.emit()
-            self.start_mapped_data_get.emit(table_mappings, options, types, row_types, max_rows)
+            self.start_type_inference.emit(table, options, sample_size, generation)
 
     def request_default_mapping(self):
         """Request default mapping from worker."""
@@ -188,14 +232,15 @@ class ConnectionManager(QObject):
         self.close_connection()
         # create new thread and worker
         self._thread = QThread()
-        self._worker = ConnectionWorker(self._source, self._connection, self._connection_settings)
+        self._worker = ConnectionWorker(self._source, self._connection, self._connection_settings, self._generations)
         self._worker.moveToThread(self._thread)
         # connect worker signals
         self._worker.connectionReady.connect(self._handle_connection_ready)
         self._worker.tablesReady.connect(self._handle_tables_ready)
-        self._worker.dataReady.connect(self.data_ready.emit)
-        self._worker.mappedDataReady.connect(self.mapped_data_ready.emit)
+        self._worker.dataReady.connect(self._handle_data_ready)
+        self._worker.mappedDataReady.connect(self._handle_mapped_data_ready)
         self._worker.defaultMappingReady.connect(self.default_mapping_ready.emit)
+        self._worker.typesInferred.connect(self._handle_types_inferred)
         self._worker.error.connect(self.error.emit)
         self._worker.connectionFailed.connect(self.connection_failed.emit)
         # connect start working signals
@@ -203,6 +248,7 @@ class ConnectionManager(QObject):
         self.start_data_get.connect(self._worker.data)
         self.start_mapped_data_get.connect(self._worker.mapped_data)
         self.start_default_mapping_get.connect(self._worker.default_mapping)
+        self.start_type_inference.connect(self._worker.infer_types)
         self.connection_closed.connect(self._worker.disconnect)
 
         # when thread is started, connect worker to source
@@ -214,6 +260,28 @@ class ConnectionManager(QObject):
         self._is_connected = True
         self.connection_ready.emit()
 
+    @Slot(object, dict, int, list, list, int)
+    def _handle_data_ready(self, table, options, max_rows, data, header, generation):
+        self._preview_cache.put(self._source, table, options, max_rows, data, header)
+        if self._generations.is_current(_DATA_REQUEST, generation):
+            self.data_ready.emit(data, header)
+
+    @Slot(dict, list, int)
+    def _handle_mapped_data_ready(self, table_data, errors, generation):
+        if not self._generations.is_current(_MAPPED_DATA_REQUEST, generation):
+            return
+        data = dict()
+        for mapped_data in table_data.values():
+            for key, value in mapped_data.items():
+                data.setdefault(key, []).extend(value)
+        self.mapped_table_data_ready.emit(table_data, errors)
+        self.mapped_data_ready.emit(data, errors)
+
+    @Slot(str, dict, int)
+    def _handle_types_inferred(self, table, proposals, generation):
+        if self._generations.is_current(_TYPE_INFERENCE_REQUEST, generation):
+            self.column_types_inferred.emit(table, proposals)
+
     @Slot(dict)
     def _handle_tables_ready(self, table_options):
         if isinstance(table_options, list):
@@ -306,9 +374,14 @@ class ConnectionManager(QObject):
 class ConnectionWorker(QObject):
     """A class for delegating SourceConnection operations to another QThread.
 
+    Data requests that have been superseded by newer ones are skipped
+    and long reads are abandoned as soon as a newer request comes in.
+
     Args:
         source (str): path of the source file
         connection (class): A class derived from `SourceConnection` for connecting to the source file
+        connection_settings (dict): connection specific settings
+        generations (RequestGenerations): latest request generations
     """
 
     connectionFailed = Signal(str)
@@ -319,17 +392,23 @@ class ConnectionWorker(QObject):
     """Signal that connection is ready to be read"""
     tablesReady = Signal(list)
     """Signal when tables from source is ready, list of table names"""
-    dataReady = Signal(list, list)
-    """Signal when data from a specific table in source is ready, list of data and list of headers"""
-    mappedDataReady = Signal(dict, list)
-    """Signal when data is read and mapped, dict with data and list of errors when reading data with mappings"""
+    dataReady = Signal(object, dict, int, list, list, int)
+    """Signal when data from a specific table in source is ready, table, options, max rows, data, headers
+    and request generation"""
+    mappedDataReady = Signal(dict, list, int)
+    """Signal when data is read and mapped, dict from table name to mapped data,
+    list of errors when reading data with mappings and request generation"""
     defaultMappingReady = Signal(dict)
     """Signal when default mapping is ready"""
+    typesInferred = Signal(str, dict, int)
+    """Signal when column types have been inferred, table name, dict from column to TypeProposal
+    and request generation"""
 
-    def __init__(self, source, connection, connection_settings, parent=None):
+    def __init__(self, source, connection, connection_settings, generations, parent=None):
         super().__init__(parent)
         self._source = source
         self._connection = connection(connection_settings)
+        self._generations = generations
 
     @Slot()
     def init_connection(self):
@@ -355,24 +434,62 @@ class ConnectionWorker(QObject):
             self.error.emit(f"Could not get tables from source: {error}")
             raise error
 
-    @Slot(list, dict, int)
-    def data(self, table, options, max_rows):
+    @Slot(str, dict, int, int)
+    def data(self, table, options, max_rows, generation):
+        if not self._generations.is_current(_DATA_REQUEST, generation):
+            return
         try:
-            data, header = self._connection.get_data(table, options, max_rows)
-            self.dataReady.emit(data, header)
+            data_iterator, header, _ = self._connection.get_data_iterator(table, options, max_rows)
+            data = list()
+            for row in data_iterator:
+                data.append(row)
+                if len(data) % _STALENESS_CHECK_INTERVAL == 0 and not self._generations.is_current(
+                    _DATA_REQUEST, generation
+                ):
+                    return
+            self.dataReady.emit(table, options, max_rows, data, header, generation)
         except Exception as error:
             self.error.emit(f"Could not get data from source: {error}")
             raise error
 
-    @Slot(dict, dict, list, list, int)
-    def mapped_data(self, table_mappings, options, types, table_row_types, max_rows):
+    @Slot(dict, dict, dict, dict, int, int)
+    def mapped_data(self, table_mappings, options, types, table_row_types, max_rows, generation):
+        table_data = dict()
+        errors = list()
         try:
-            data, errors = self._connection.get_mapped_data(table_mappings, options, types, table_row_types, max_rows)
-            self.mappedDataReady.emit(data, errors)
+            for table, mappings in table_mappings.items():
+                if not self._generations.is_current(_MAPPED_DATA_REQUEST, generation):
+                    return
+                compiled = compile_table(mappings, options.get(table), types.get(table), table_row_types.get(table))
+                rows, header, column_count = self._connection.get_data_iterator(table, compiled.options, max_rows)
+                table_data[table], table_errors = compiled.map_rows(rows, column_count, header)
+                errors += [(table, error) for error in table_errors]
+            self.mappedDataReady.emit(table_data, errors, generation)
         except Exception as error:
             self.error.emit(f"Could not get mapped data from source: {error}")
             raise error
 
+    @Slot(str, dict, int, int)
+    def infer_types(self, table, options, sample_size, generation):
+        if not self._generations.is_current(_TYPE_INFERENCE_REQUEST, generation):
+            return
+        try:
+            rows, _, column_count = self._connection.get_data_iterator(table, options, -1)
+            sample = sample_rows(self._abandon_if_stale(rows, _TYPE_INFERENCE_REQUEST, generation), sample_size)
+            if not self._generations.is_current(_TYPE_INFERENCE_REQUEST, generation):
+                return
+            self.typesInferred.emit(table, infer_column_types(sample, column_count), generation)
+        except Exception as error:
+            self.error.emit(f"Could not infer column types: {error}")
+            raise error
+
+    def _abandon_if_stale(self, rows, kind, generation):
+        """Yields rows until a newer request of given kind comes in."""
+        for count, row in enumerate(rows, start=1):
+            yield row
+            if count % _STALENESS_CHECK_INTERVAL == 0 and not self._generations.is_current(kind, generation):
+                return
+
     @Slot()
     def disconnect(self):
         try:
@@ -389,3 +506,138 @@ class ConnectionWorker(QObject):
         except Exception as error:
             self.error.emit(f"Could not default mapping from source: {error}")
             raise error
+
+
+class RequestGenerations:
+    """Thread safe counters that tell which data requests are the latest ones.
+
+    Each new request gets a generation that supersedes all earlier requests of the same kind.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latest = dict()
+
+    def next(self, kind):
+        """Starts a new generation of requests.
+
+        Args:
+            kind (str): request kind
+
+        Returns:
+            int: new generation
+        """
+        with self._lock:
+            generation = self._latest.get(kind, 0) + 1
+            self._latest[kind] = generation
+            return generation
+
+    def is_current(self, kind, generation):
+        """Checks if given request generation is the latest.
+
+        Args:
+            kind (str): request kind
+            generation (int): request's generation
+
+        Returns:
+            bool: True if no newer request has been made, False otherwise
+        """
+        with self._lock:
+            return self._latest.get(kind, 0) == generation
+
+
+class PreviewCache:
+    """A bounded least-recently-used cache for source table previews.
+
+    Cached previews are discarded when source file's modification time changes.
+    Sources that are not files, e.g. databases, have no such time stamp to check so they are never cached.
+    """
+
+    def __init__(self, capacity):
+        """
+        Args:
+            capacity (int): maximum number of previews to store
+        """
+        self._capacity = capacity
+        self._previews = OrderedDict()
+        self._source_mtimes = dict()
+
+    def get(self, source, table, options, max_rows):
+        """Returns cached preview.
+
+        Args:
+            source (str): source path or URL
+            table (str): table name
+            options (dict): table options
+            max_rows (int): maximum number of rows in preview
+
+        Returns:
+            tuple: copy of data and header, or None if preview is not in cache
+        """
+        mtime = _modification_time(source)
+        if mtime is None or not self._is_fresh(source, mtime):
+            return None
+        key = self._key(source, table, options, max_rows)
+        preview = self._previews.get(key)
+        if preview is None:
+            return None
+        self._previews.move_to_end(key)
+        data, header = preview
+        return [list(row) for row in data], list(header)
+
+    def put(self, source, table, options, max_rows, data, header):
+        """Stores a preview.
+
+        Args:
+            source (str): source path or URL
+            table (str): table name
+            options (dict): table options
+            max_rows (int): maximum number of rows in preview
+            data (list of list): preview data
+            header (list): preview header
+        """
+        mtime = _modification_time(source)
+        if self._capacity <= 0 or mtime is None:
+            return
+        self._is_fresh(source, mtime)
+        key = self._key(source, table, options, max_rows)
+        self._previews[key] = ([list(row) for row in data], list(header))
+        self._previews.move_to_end(key)
+        while len(self._previews) > self._capacity:
+            self._previews.popitem(last=False)
+
+    def clear(self):
+        """Empties the cache."""
+        self._previews.clear()
+        self._source_mtimes.clear()
+
+    def _is_fresh(self, source, mtime):
+        """Drops source's previews if the source file has been modified since last check.
+
+        Args:
+            source (str): source path
+            mtime (float): source file's current modification time
+
+        Returns:
+            bool: True if cached previews of the source are still valid, False otherwise
+        """
+        if source in self._source_mtimes and self._source_mtimes[source] == mtime:
+            return True
+        for key in [key for key in self._previews if key[0] == source]:
+            del self._previews[key]
+        self._source_mtimes[source] = mtime
+        return False
+
+    @staticmethod
+    def _key(source, table, options, max_rows):
+        return source, table, json.dumps(options, sort_keys=True, default=str), max_rows
+
+
+def _modification_time(source):
+    """Returns source file's modification time or None if source is not a file."""
+    if not isinstance(source, str) or not os.path.isfile(source):
+        return None
+    try:
+        return os.path.getmtime(source)
+    except OSError:
+        return None
@@ -16,118 +16,853 @@ Importer's execute kernel (do_work), as target for a multiprocess.Process
 :date:   6.11.2020
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import os
 import spinedb_api
-from spinedb_api.spine_io.type_conversion import value_to_convert_spec
+from sqlalchemy.engine.url import make_url
 from spine_engine.utils.helpers import create_log_file_timestamp
+from ..process_pool import cancel_requested
+from ..utils import is_sqlite_url, latest_commit, process_pool_map, relax_sqlite_durability
+from .compiled_mapping import compile_specification
+from .existence_index import ExistenceIndex
+from .import_manifest import ImportManifest, mapping_hash, source_hash, table_hashes
+from .streaming import mapped_data_chunks
+from .throughput import ThroughputReport
 
 
-def do_work(mapping, cancel_on_error, logs_dir, source_filepaths, connector, urls_downstream, logger):
+def do_work(
+    mapping,
+    cancel_on_error,
+    logs_dir,
+    source_filepaths,
+    connector,
+    urls_downstream,
+    settings,
+    manifest_path,
+    logger,
+):
+    report = ThroughputReport()
+    try:
+        with report.timed("convert"):
+            compiled_tables = compile_specification(mapping)
+    except spinedb_api.InvalidMapping as error:
+        logger.msg_error.emit(f"Invalid mapping: {error}")
+        if cancel_on_error:
+            logger.msg_error.emit("Cancel import on error has been set. Bailing out.")
+            return (False,)
+        logger.msg_warning.emit("Ignoring errors. Set Cancel import on error to bail out instead.")
+        return (True,)
+    skip_cache = _SkipCache(manifest_path, mapping, enabled=not (settings.force_reimport or settings.dry_run))
+    if settings.force_reimport or settings.dry_run:
+        outdated_tables = {source: list(compiled_tables) for source in source_filepaths}
+    else:
+        outdated_tables = skip_cache.tables_to_import(
+            source_filepaths, urls_downstream, settings.changed_tables_only, logger
+        )
+    source_filepaths = [source for source in source_filepaths if outdated_tables.get(source)]
+    if not source_filepaths:
+        logger.msg.emit("All sources are up to date in downstream databases. Nothing to import.")
+        return (True,)
+    source_tables = {
+        source: {table: compiled_tables[table] for table in outdated_tables[source]} for source in source_filepaths
+    }
+    if settings.streaming and settings.read_process_count > 1:
+        logger.msg_warning.emit("Sources are read one at a time in streaming mode.")
+    if settings.dry_run:
+        work = _do_dry_run
+    else:
+        if urls_downstream:
+            logger.msg.emit(settings.commit_policy.describe())
+        work = _do_streaming_work if settings.streaming else _do_in_memory_work
+    try:
+        result = work(
+            source_tables,
+            cancel_on_error,
+            logs_dir,
+            source_filepaths,
+            connector,
+            urls_downstream,
+            settings,
+            skip_cache,
+            report,
+            logger,
+        )
+        if cancel_requested():
+            logger.msg_warning.emit(
+                "Import stopped. Data committed so far has been kept; next execution resumes from where it stopped."
+            )
+            return (False,)
+        return result
+    finally:
+        report.finish()
+        if report.row_count:
+            _log_throughput(report, logs_dir, logger)
+
+
+def _do_in_memory_work(
+    source_tables,
+    cancel_on_error,
+    logs_dir,
+    source_filepaths,
+    connector,
+    urls_downstream,
+    settings,
+    skip_cache,
+    report,
+    logger,
+):
+    """Reads and maps all sources before importing the data into downstream databases."""
     all_data = []
     all_errors = []
-    table_mappings = {
-        name: m for name, m in mapping.get("table_mappings", {}).items() if name in mapping["selected_tables"]
-    }
-    table_options = {
-        name: options
-        for name, options in mapping.get("table_options", {}).items()
-        if name in mapping["selected_tables"]
-    }
-    table_types = {
-        tn: {int(col): value_to_convert_spec(spec) for col, spec in cols.items()}
-        for tn, cols in mapping.get("table_types", {}).items()
-    }
-    table_row_types = {
-        tn: {int(col): value_to_convert_spec(spec) for col, spec in cols.items()}
-        for tn, cols in mapping.get("table_row_types", {}).items()
-    }
-    for path in source_filepaths:
-        try:
+    clean_sources = []
+    read_source = partial(_read_source, connector, source_tables)
+    with process_pool_map(read_source, source_filepaths, settings.read_process_count) as results:
+        for path, (data, errors, failure, source_report) in zip(source_filepaths, results):
+            if cancel_requested():
+                return (False,)
+            report.merge(source_report)
+            if isinstance(failure, IOError):
+                logger.msg_error.emit(f"Failed to connect to source: {failure}")
+                return (False,)
+            if failure is not None:
+                logger.msg_error.emit(f"Failed to import '{path}': {failure}")
+                if cancel_on_error:
+                    logger.msg_error.emit("Cancel import on error has been set. Bailing out.")
+                    return (False,)
+                logger.msg_warning.emit("Ignoring errors. Set Cancel import on error to bail out instead.")
+                continue
+            read_count = sum(len(d) for table_data in data.values() for d in table_data.values())
+            if errors:
+                logger.msg_warning.emit(f"Read {read_count} data from {path} with {len(errors)} errors.")
+            else:
+                logger.msg.emit(f"Successfully read {read_count} data from {path}")
+                clean_sources.append(path)
+            all_data.append((path, data, list(source_tables[path]) if not errors else []))
+            all_errors.extend(errors)
+    if all_errors:
+        _log_errors(all_errors, logs_dir, "_read_error.log", logger)
+        if cancel_on_error:
+            logger.msg_error.emit("Cancel import on error has been set. Bailing out.")
+            return (False,)
+        logger.msg_warning.emit("Ignoring errors. Set Cancel import on error to bail out instead.")
+    if not all_data:
+        return (True,)
+    if settings.concurrent_import and len(urls_downstream) > 1:
+        with ThreadPoolExecutor(max_workers=len(urls_downstream)) as executor:
+            futures = {
+                url: executor.submit(
+                    _import_data_to_url,
+                    cancel_on_error,
+                    logs_dir,
+                    all_data,
+                    url,
+                    _import_error_log_name(url, urls_downstream),
+                    settings,
+                    report,
+                    logger,
+                )
+                for url in urls_downstream
+            }
+            results = {url: future.result() for url, future in futures.items()}
+        for url, (success, committed_tables) in results.items():
+            if success:
+                skip_cache.record_imports(clean_sources, url)
+            skip_cache.record_checkpoint(committed_tables, url)
+        return (all(success for success, _ in results.values()) or not cancel_on_error,)
+    for url in urls_downstream:
+        if cancel_requested():
+            break
+        error_log_name = _import_error_log_name(url, urls_downstream)
+        success, committed_tables = _import_data_to_url(
+            cancel_on_error, logs_dir, all_data, url, error_log_name, settings, report, logger
+        )
+        if success:
+            skip_cache.record_imports(clean_sources, url)
+        skip_cache.record_checkpoint(committed_tables, url)
+        if not success and cancel_on_error:
+            return (False,)
+    return (True,)
+
+
+def _read_source(connector, source_tables, path):
+    """Reads and maps all data from a source.
+
+    Args:
+        connector (SourceConnection): connector
+        source_tables (dict): mapping from source path to a dict of compiled tables to read
+        path (str): path to source
+
+    Returns:
+        tuple: mapped data by table, list of errors, an exception if the source could not be read, None otherwise,
+            and throughput report
+    """
+    report = ThroughputReport()
+    try:
+        with report.timed("connect", path):
             connector.connect_to_source(path)
+    except IOError as error:
+        return None, None, error, report
+    data = dict()
+    errors = list()
+    try:
+        for table, table_data, table_errors in mapped_data_chunks(connector, source_tables[path], 0, report, path):
+            data[table] = table_data
+            errors += table_errors
+    except spinedb_api.InvalidMapping as error:
+        return None, None, error, report
+    return data, errors, None, report
+
+
+def _do_streaming_work(
+    source_tables,
+    cancel_on_error,
+    logs_dir,
+    source_filepaths,
+    connector,
+    urls_downstream,
+    settings,
+    skip_cache,
+    report,
+    logger,
+):
+    """Reads, maps and imports source data in chunks so only one chunk is kept in memory at a time.
+
+    Unlike in the default mode, data gets imported before all sources have been read.
+    If cancel on error is set, the import bails out at the first error
+    and rolls back changes made since the last commit.
+    """
+    targets = list()
+    for url in urls_downstream:
+        target = _ImportTarget.open(url, settings, report, logger)
+        if target is None:
+            if cancel_on_error:
+                _close_targets(targets)
+                return (False,)
+            continue
+        targets.append(target)
+    if settings.concurrent_import and len(targets) > 1:
+        executor = ThreadPoolExecutor(max_workers=len(targets))
+    else:
+        executor = None
+    all_read_errors = []
+    clean_sources = []
+    success = True
+    for source_index, path in enumerate(source_filepaths):
+        if cancel_requested():
+            break
+        last_source = source_index == len(source_filepaths) - 1
+        try:
+            with report.timed("connect", path):
+                connector.connect_to_source(path)
         except IOError as error:
             logger.msg_error.emit(f"Failed to connect to source: {error}")
-            return (False,)
+            success = False
+            break
+        read_count = 0
+        read_errors = []
+        stopped = False
         try:
-            data, errors = connector.get_mapped_data(
-                table_mappings, table_options, table_types, table_row_types, max_rows=-1
-            )
+            for table_index, (table, compiled_table) in enumerate(source_tables[path].items()):
+                error_counts = [len(target.errors) for target in targets]
+                table_read_errors = []
+                for _, data, errors in mapped_data_chunks(
+                    connector, {table: compiled_table}, settings.chunk_size, report, path
+                ):
+                    if cancel_requested():
+                        stopped = True
+                        break
+                    read_count += sum(len(d) for d in data.values())
+                    table_read_errors += errors
+                    if errors and cancel_on_error:
+                        stopped = True
+                        break
+                    if not _import_chunk(data, path, table, targets, cancel_on_error, executor):
+                        stopped = True
+                        break
+                read_errors += table_read_errors
+                if stopped:
+                    break
+                if not table_read_errors:
+                    for target, error_count in zip(targets, error_counts):
+                        if len(target.errors) == error_count:
+                            target.finish_tables(path, [table])
+                last_table = last_source and table_index == len(source_tables[path]) - 1
+                for target in targets:
+                    target.table_done(last=last_table)
         except spinedb_api.InvalidMapping as error:
             logger.msg_error.emit(f"Failed to import '{path}': {error}")
             if cancel_on_error:
                 logger.msg_error.emit("Cancel import on error has been set. Bailing out.")
-                return (False,)
+                success = False
+                break
             logger.msg_warning.emit("Ignoring errors. Set Cancel import on error to bail out instead.")
             continue
-        if not errors:
-            logger.msg.emit(f"Successfully read {sum(len(d) for d in data.values())} data from {path}")
+        if cancel_requested():
+            break
+        if read_errors:
+            logger.msg_warning.emit(f"Read {read_count} data from {path} with {len(read_errors)} errors.")
         else:
-            logger.msg_warning.emit(
-                f"Read {sum(len(d) for d in data.values())} data from {path} with {len(errors)} errors."
-            )
-        all_data.append(data)
-        all_errors.extend(errors)
-    if all_errors:
-        # Log errors in a time stamped file into the logs directory
-        timestamp = create_log_file_timestamp()
-        logfilepath = os.path.abspath(os.path.join(logs_dir, timestamp + "_read_error.log"))
-        with open(logfilepath, "w") as f:
-            for err in all_errors:
-                f.write(f"{err}\n")
-        # Make error log file anchor with path as tooltip
-        logfile_anchor = (
-            "<a style='color:#BB99FF;' title='" + logfilepath + "' href='file:///" + logfilepath + "'>Error log</a>"
-        )
-        logger.msg_error.emit(logfile_anchor)
+            logger.msg.emit(f"Successfully read {read_count} data from {path}")
+            clean_sources.append(path)
+        all_read_errors += read_errors
+        if cancel_on_error and (read_errors or any(target.errors for target in targets)):
+            success = False
+            break
+        for target in targets:
+            target.file_done(last=last_source)
+    if executor is not None:
+        executor.shutdown()
+    if all_read_errors:
+        _log_errors(all_read_errors, logs_dir, "_read_error.log", logger)
         if cancel_on_error:
             logger.msg_error.emit("Cancel import on error has been set. Bailing out.")
+        else:
+            logger.msg_warning.emit("Ignoring errors. Set Cancel import on error to bail out instead.")
+    for target in targets:
+        if target.errors:
+            logger.msg_error.emit("Errors while importing a table.")
+            if cancel_on_error:
+                logger.msg_error.emit("Cancel import on error is set. Bailing out.")
+            else:
+                logger.msg_warning.emit("Ignoring errors. Set Cancel import on error to bail out instead.")
+        if success:
+            _finish_target(target, logger)
+            if not target.errors:
+                skip_cache.record_imports(clean_sources, target.url)
+        else:
+            if target.rollback():
+                logger.msg_error.emit("Rolling back changes.")
+            target.close()
+        skip_cache.record_checkpoint(target.committed_tables, target.url)
+        if target.errors:
+            _log_errors(target.errors, logs_dir, _import_error_log_name(target.url, urls_downstream), logger)
+            if cancel_on_error:
+                success = False
+    return (success,)
+
+
+def _do_dry_run(
+    source_tables,
+    cancel_on_error,
+    logs_dir,
+    source_filepaths,
+    connector,
+    urls_downstream,
+    settings,
+    skip_cache,
+    report,
+    logger,
+):
+    """Reads, maps and converts source data into a counting sink instead of downstream databases.
+
+    Nothing is written to databases or to the import manifest.
+    """
+    logger.msg.emit("Dry run: nothing will be written to downstream databases.")
+    sink = _CountingSink(report)
+    read_errors = []
+    for path in source_filepaths:
+        if cancel_requested():
             return (False,)
-        logger.msg_warning.emit("Ignoring errors. Set Cancel import on error to bail out instead.")
-    if all_data:
-        for url in urls_downstream:
-            success = _import_data_to_url(cancel_on_error, logs_dir, all_data, url, logger)
-            if not success and cancel_on_error:
-                return (False,)
-    return (True,)
+        try:
+            with report.timed("connect", path):
+                connector.connect_to_source(path)
+        except IOError as error:
+            logger.msg_error.emit(f"Failed to connect to source: {error}")
+            return (False,)
+        try:
+            for table, data, errors in mapped_data_chunks(
+                connector, source_tables[path], settings.chunk_size, report, path
+            ):
+                if cancel_requested():
+                    return (False,)
+                read_errors += errors
+                sink.import_data(data, path, table)
+        except spinedb_api.InvalidMapping as error:
+            read_errors.append(f"Failed to map '{path}': {error}")
+    logger.msg.emit(
+        f"Dry run of {len(source_filepaths)} sources: {report.row_count} rows would be imported as {sink.count} items "
+        f"with {len(read_errors)} read errors and {len(sink.errors)} conversion errors."
+    )
+    if sink.item_counts:
+        counts = ", ".join(f"{item_type}: {count}" for item_type, count in sink.item_counts.items())
+        logger.msg.emit(f"Items by type: {counts}")
+    if read_errors:
+        _log_errors(read_errors, logs_dir, "_read_error.log", logger)
+    if sink.errors:
+        _log_errors(sink.errors, logs_dir, "_conversion_error.log", logger)
+    return (not (cancel_on_error and (read_errors or sink.errors)),)
 
 
-def _import_data_to_url(cancel_on_error, logs_dir, all_data, url, logger):
-    try:
-        db_map = spinedb_api.DatabaseMapping(url, upgrade=False, username="Importer")
-    except (spinedb_api.SpineDBAPIError, spinedb_api.SpineDBVersionError) as err:
-        logger.msg_error.emit(f"Unable to create database mapping, all import operations will be omitted: {err}")
-        return False
-    all_import_errors = []
-    all_import_num = 0
-    for data in all_data:
-        import_num, import_errors = spinedb_api.import_data(db_map, **data)
-        all_import_errors += import_errors
+def _import_chunk(data, source, table, targets, cancel_on_error, executor):
+    """Imports a chunk of mapped data into all targets.
+
+    Args:
+        data (dict): mapped data
+        source (str): source path
+        table (str): source table
+        targets (list of _ImportTarget): import targets
+        cancel_on_error (bool): if True, stop importing at first error
+        executor (ThreadPoolExecutor, optional): executor to import into targets concurrently
+
+    Returns:
+        bool: False if import should be cancelled due to errors, True otherwise
+    """
+    if executor is not None:
+        import_errors = list(executor.map(lambda target: target.import_data(data, source, table), targets))
+        return not (cancel_on_error and any(import_errors))
+    for target in targets:
+        import_errors = target.import_data(data, source, table)
+        if import_errors and cancel_on_error:
+            return False
+    return True
+
+
+def _import_data_to_url(cancel_on_error, logs_dir, all_data, url, error_log_name, settings, report, logger):
+    """Imports mapped data of all sources into a database.
+
+    Args:
+        cancel_on_error (bool): if True, bail out at first error
+        logs_dir (str): path to logs directory
+        all_data (list of tuple): source path, mapped data by table and a list of tables that were read without errors
+        url (str): database URL
+        error_log_name (str): suffix of import error log file
+        settings (ExecutionSettings): execution settings
+        report (ThroughputReport): throughput report
+        logger (LoggerInterface): a logger
+
+    Returns:
+        tuple: True if import was successful, False otherwise, and a dict of committed tables by source
+    """
+    target = _ImportTarget.open(url, settings, report, logger)
+    if target is None:
+        return False, {}
+    last_index = len(all_data) - 1
+    for index, (source, data, clean_tables) in enumerate(all_data):
+        if cancel_requested():
+            break
+        if target.commit_policy.commit_after_table():
+            import_errors = list()
+            for table_index, (table, table_data) in enumerate(data.items()):
+                table_errors = target.import_data(table_data, source, table)
+                import_errors += table_errors
+                if table_errors and cancel_on_error:
+                    break
+                target.table_done(last=index == last_index and table_index == len(data) - 1)
+        else:
+            import_errors = target.import_data(_merge_tables(data), source)
         if import_errors:
-            logger.msg_error.emit("Errors while importing a table.")
+            logger.msg_error.emit(f"Errors while importing a table into {url}.")
             if cancel_on_error:
                 logger.msg_error.emit("Cancel import on error is set. Bailing out.")
-                if db_map.has_pending_changes():
-                    logger.msg_error.emit("Rolling back changes.")
-                    db_map.rollback_session()
+                if target.rollback():
+                    logger.msg_error.emit(f"Rolling back changes in {url}.")
                 break
             logger.msg_warning.emit("Ignoring errors. Set Cancel import on error to bail out instead.")
-        all_import_num += import_num
-    if db_map.has_pending_changes():
-        db_map.commit_session("Import data by Spine Toolbox Importer")
-        logger.msg_success.emit(f"Inserted {all_import_num} data with {len(all_import_errors)} errors into {url}")
-    else:
-        logger.msg_warning.emit("No new data imported")
-    db_map.connection.close()
-    if all_import_errors:
-        # Log errors in a time stamped file into the logs directory
-        timestamp = create_log_file_timestamp()
-        logfilepath = os.path.abspath(os.path.join(logs_dir, timestamp + "_import_error.log"))
-        with open(logfilepath, "w") as f:
-            for err in all_import_errors:
-                f.write(str(err) + "\n")
-        # Make error log file anchor with path as tooltip
-        logfile_anchor = (
-            "<a style='color:#BB99FF;' title='" + logfilepath + "' href='file:///" + logfilepath + "'>Error log</a>"
+        else:
+            target.finish_tables(source, clean_tables)
+        target.file_done(last=index == last_index)
+    _finish_target(target, logger)
+    if target.errors:
+        _log_errors(target.errors, logs_dir, error_log_name, logger)
+        return False, target.committed_tables
+    return True, target.committed_tables
+
+
+def _merge_tables(data):
+    """Merges mapped data of source tables.
+
+    Args:
+        data (dict): mapping from table name to mapped data
+
+    Returns:
+        dict: merged mapped data
+    """
+    merged = dict()
+    for table_data in data.values():
+        for key, value in table_data.items():
+            merged.setdefault(key, []).extend(value)
+    return merged
+
+
+def _import_error_log_name(url, urls):
+    """Creates a file name suffix for import error log that is unique for each target database.
+
+    Args:
+        url (str): target database URL
+        urls (list of str): all target database URLs
+
+    Returns:
+        str: log file name suffix
+    """
+    if len(urls) == 1:
+        return "_import_error.log"
+    database = make_url(url).database
+    name = os.path.splitext(os.path.basename(database))[0] if database else ""
+    return f"_import_error_{urls.index(url) + 1}{'_' + name if name else ''}.log"
+
+
+def _finish_target(target, logger):
+    """Commits pending changes, reports the outcome and closes the target's connection."""
+    if target.commit() or target.committed_count:
+        logger.msg_success.emit(
+            f"Inserted {target.import_count} data with {len(target.errors)} errors into {target.url}"
         )
-        logger.msg_error.emit(logfile_anchor)
-        return False
-    return True
+    else:
+        logger.msg_warning.emit(f"No new data imported into {target.url}")
+    target.report.add_imported(target.import_count, target.url)
+    target.close()
+
+
+def _close_targets(targets):
+    for target in targets:
+        target.rollback()
+        target.close()
+
+
+def _log_errors(errors, logs_dir, file_name_suffix, logger):
+    """Logs errors in a time stamped file into the logs directory and emits a link to the file."""
+    timestamp = create_log_file_timestamp()
+    logfilepath = os.path.abspath(os.path.join(logs_dir, timestamp + file_name_suffix))
+    with open(logfilepath, "w") as f:
+        for err in errors:
+            f.write(f"{err}\n")
+    # Make error log file anchor with path as tooltip
+    logfile_anchor = (
+        "<a style='color:#BB99FF;' title='" + logfilepath + "' href='file:///" + logfilepath + "'>Error log</a>"
+    )
+    logger.msg_error.emit(logfile_anchor)
+
+
+def _log_throughput(report, logs_dir, logger):
+    """Writes throughput report into the logs directory and emits a summary with a link to the report."""
+    report_path = report.save(logs_dir)
+    report_anchor = (
+        "<a style='color:#BB99FF;' title='" + report_path + "' href='file:///" + report_path + "'>Throughput report</a>"
+    )
+    logger.msg.emit(f"{report.summary()} {report_anchor}")
+
+
+class _SkipCache:
+    """Keeps track of sources' and mapping's hashes and target databases' states during import.
+
+    Sources are hashed only when they are first needed; a disabled cache hashes nothing and records nothing.
+    """
+
+    def __init__(self, path, mapping, enabled=True):
+        """
+        Args:
+            path (str): path to manifest file
+            mapping (dict): import mapping
+            enabled (bool): if False, all tables are imported and no imports are recorded
+        """
+        self._enabled = enabled
+        self._manifest = ImportManifest(path) if enabled else None
+        self._mapping_hash = mapping_hash(mapping)
+        self._table_hashes = table_hashes(mapping)
+        self._source_hashes = dict()
+        self._start_commits = dict()
+
+    def tables_to_import(self, source_filepaths, urls, changed_tables_only, logger):
+        """Lists the tables of each source that need to be imported.
+
+        Sources that have not changed since they were last imported into all given databases are skipped
+        unless the databases have been committed to since.
+        Tables that were committed before an interrupted import are skipped, too,
+        as are tables with unchanged mappings if ``changed_tables_only`` is set.
+
+        Args:
+            source_filepaths (list of str): paths to sources
+            urls (list of str): target database URLs
+            changed_tables_only (bool): if True, import only tables whose mappings or options have changed
+            logger (LoggerInterface): a logger
+
+        Returns:
+            dict: mapping from source path to list of table names that need to be imported
+        """
+        all_tables = list(self._table_hashes)
+        if not self._enabled or not urls:
+            return {source: all_tables for source in source_filepaths}
+        self._start_commits = {url: latest_commit(url) for url in urls}
+        if any(commit is None for commit in self._start_commits.values()):
+            return {source: all_tables for source in source_filepaths}
+        to_import = dict()
+        for source in source_filepaths:
+            hash_ = self._source_hash(source)
+            tables = set()
+            for url in urls:
+                commit = self._start_commits[url]
+                if changed_tables_only or self._manifest.is_checkpoint(source, hash_, url, commit):
+                    tables.update(self._manifest.outdated_tables(source, hash_, self._table_hashes, url, commit))
+                elif not self._manifest.is_up_to_date(source, hash_, self._mapping_hash, url, commit):
+                    tables.update(all_tables)
+            to_import[source] = [table for table in all_tables if table in tables]
+            if not tables:
+                logger.msg.emit(f"Skipping '{source}': unchanged since last import.")
+            elif len(tables) < len(all_tables):
+                table_list = ", ".join(f"'{table}'" for table in to_import[source])
+                logger.msg.emit(f"Importing only tables {table_list} from '{source}'; other tables are up to date.")
+        return to_import
+
+    def record_imports(self, sources, url):
+        """Records successful imports and saves the manifest.
+
+        Args:
+            sources (Iterable of str): imported sources
+            url (str): target database URL
+        """
+        if not self._enabled:
+            return
+        commit = latest_commit(url)
+        if commit is None:
+            return
+        for source in sources:
+            self._manifest.update(
+                source, self._source_hash(source), self._mapping_hash, url, commit, self._table_hashes
+            )
+        self._manifest.save()
+
+    def record_checkpoint(self, committed_tables, url):
+        """Records tables of incompletely imported sources that have been committed and saves the manifest.
+
+        Args:
+            committed_tables (dict): mapping from source path to list of committed table names
+            url (str): target database URL
+        """
+        if not self._enabled or not any(committed_tables.values()):
+            return
+        commit = latest_commit(url)
+        if commit is None:
+            return
+        recorded = False
+        for source, tables in committed_tables.items():
+            hash_ = self._source_hash(source)
+            if not tables or self._manifest.is_up_to_date(source, hash_, self._mapping_hash, url, commit):
+                continue
+            self._manifest.update_checkpoint(
+                source,
+                hash_,
+                url,
+                commit,
+                {table: self._table_hashes[table] for table in tables},
+                self._start_commits.get(url),
+            )
+            recorded = True
+        if recorded:
+            self._manifest.save()
+
+    def _source_hash(self, source):
+        """Returns source's hash calculating it on first call.
+
+        Args:
+            source (str): path to source
+
+        Returns:
+            str: hex digest or None if source is not a readable file
+        """
+        try:
+            return self._source_hashes[source]
+        except KeyError:
+            hash_ = self._source_hashes[source] = source_hash(source)
+            return hash_
+
+
+class _CountingSink:
+    """Counts mapped items and converts parameter values to their database representation without storing them."""
+
+    _VALUE_POSITIONS = {
+        "object_parameters": 2,
+        "relationship_parameters": 2,
+        "object_parameter_values": 3,
+        "relationship_parameter_values": 3,
+    }
+    """Positions of values that get converted on import by item type."""
+
+    def __init__(self, report):
+        """
+        Args:
+            report (ThroughputReport): report to record conversion times
+        """
+        self.report = report
+        self.count = 0
+        self.item_counts = dict()
+        self.errors = []
+
+    def import_data(self, data, source=None, table=None):
+        """Counts and converts mapped data.
+
+        Args:
+            data (dict): mapped data
+            source (str, optional): path to the source the data came from
+            table (str, optional): source table the data came from
+
+        Returns:
+            list: conversion errors
+        """
+        errors = []
+        with self.report.timed("convert", source, table):
+            for item_type, items in data.items():
+                self.count += len(items)
+                self.item_counts[item_type] = self.item_counts.get(item_type, 0) + len(items)
+                position = self._VALUE_POSITIONS.get(item_type)
+                if position is None:
+                    continue
+                for item in items:
+                    if len(item) <= position:
+                        continue
+                    try:
+                        spinedb_api.to_database(item[position])
+                    except (spinedb_api.ParameterValueFormatError, TypeError, ValueError) as error:
+                        errors.append(f"Failed to convert value of {item_type} {tuple(item[:position])}: {error}")
+        self.errors += errors
+        return errors
+
+
+class _ImportTarget:
+    """Imports mapped data into a database and commits the session according to a commit policy."""
+
+    def __init__(self, url, db_map, commit_policy, bulk_load=False, report=None, existence_index=None):
+        """
+        Args:
+            url (str): database URL
+            db_map (DatabaseMapping): database mapping
+            commit_policy (CommitPolicy): policy that decides when to commit
+            bulk_load (bool): if True and the database is SQLite, relax durability of target's connection
+            report (ThroughputReport, optional): report to record import and commit times
+            existence_index (ExistenceIndex, optional): index of existing items used to drop redundant declarations
+        """
+        self.url = url
+        self.report = report if report is not None else ThroughputReport()
+        self._db_map = db_map
+        self.commit_policy = commit_policy
+        self._existence_index = existence_index
+        self._uncommitted_count = 0
+        self.import_count = 0
+        self.committed_count = 0
+        self.committed_tables = dict()
+        self._finished_tables = dict()
+        self.errors = []
+        if bulk_load and is_sqlite_url(url):
+            relax_sqlite_durability(db_map.connection)
+
+    @classmethod
+    def open(cls, url, settings, report, logger):
+        """Creates a database mapping for given URL.
+
+        Args:
+            url (str): database URL
+            settings (ExecutionSettings): execution settings
+            report (ThroughputReport): throughput report
+            logger (LoggerInterface): a logger
+
+        Returns:
+            _ImportTarget: import target or None if database mapping could not be created
+        """
+        try:
+            db_map = spinedb_api.DatabaseMapping(url, upgrade=False, username="Importer")
+        except (spinedb_api.SpineDBAPIError, spinedb_api.SpineDBVersionError) as err:
+            logger.msg_error.emit(f"Unable to create database mapping, all import operations will be omitted: {err}")
+            return None
+        if settings.prefetch_existing_items:
+            with report.timed("import"):
+                existence_index = ExistenceIndex.build(db_map)
+        else:
+            existence_index = None
+        return cls(url, db_map, settings.commit_policy, settings.sqlite_bulk_load, report, existence_index)
+
+    def import_data(self, data, source=None, table=None):
+        """Imports mapped data and commits if commit interval has been reached.
+
+        Args:
+            data (dict): mapped data
+            source (str, optional): path to the source the data came from
+            table (str, optional): source table the data came from
+
+        Returns:
+            list: import errors
+        """
+        with self.report.timed("import", source, table):
+            if self._existence_index is not None:
+                data = self._existence_index.prune(data)
+            if data:
+                import_count, import_errors = spinedb_api.import_data(self._db_map, **data)
+            else:
+                import_count, import_errors = 0, []
+        if self._existence_index is not None and not import_errors:
+            self._existence_index.add(data)
+        self.errors += import_errors
+        self.import_count += import_count
+        self._uncommitted_count += import_count
+        if not import_errors and self.commit_policy.commit_after_items(self._uncommitted_count):
+            self.commit()
+        return import_errors
+
+    def table_done(self, last=False):
+        """Commits if the commit policy says so after each table.
+
+        Args:
+            last (bool): if True, the table is the last one and the final commit is left to :meth:`commit`
+        """
+        if not last and self.commit_policy.commit_after_table():
+            self.commit()
+
+    def file_done(self, last=False):
+        """Commits if the commit policy says so after each source file.
+
+        Args:
+            last (bool): if True, the file is the last one and the final commit is left to :meth:`commit`
+        """
+        if not last and self.commit_policy.commit_after_file():
+            self.commit()
+
+    def finish_tables(self, source, tables):
+        """Marks source tables whose data has been imported completely.
+
+        The tables are moved to ``committed_tables`` by the next commit.
+
+        Args:
+            source (str): source path
+            tables (Iterable of str): table names
+        """
+        self._finished_tables.setdefault(source, []).extend(tables)
+
+    def commit(self):
+        """Commits pending changes.
+
+        Returns:
+            bool: True if there was something to commit, False otherwise
+        """
+        self._uncommitted_count = 0
+        if self._existence_index is not None:
+            self._existence_index.commit()
+        finished_tables = self._finished_tables
+        self._finished_tables = dict()
+        if self._db_map.has_pending_changes():
+            with self.report.timed("commit"):
+                self._db_map.commit_session("Import data by Spine Toolbox Importer")
+            committed = True
+            self.committed_count = self.import_count
+        else:
+            committed = False
+        for source, tables in finished_tables.items():
+            self.committed_tables.setdefault(source, []).extend(tables)
+        return committed
+
+    def rollback(self):
+        """Rolls back changes made since last commit.
+
+        Returns:
+            bool: True if there was something to roll back, False otherwise
+        """
+        self._uncommitted_count = 0
+        self._finished_tables = dict()
+        if self._existence_index is not None:
+            self._existence_index.rollback()
+        if not self._db_map.has_pending_changes():
+            return False
+        self._db_map.rollback_session()
+        return True
+
+    def close(self):
+        """Closes database connection discarding uncommitted changes."""
+        self._db_map.connection.close()
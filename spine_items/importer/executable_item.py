@@ -17,6 +17,7 @@ Contains Importer's executable item as well as support utilities.
 """
 
 import os
+from pathlib import Path
 from spinedb_api.spine_io.gdx_utils import find_gams_directory
 from spinedb_api.spine_io.importers.csv_reader import CSVConnector
 from spinedb_api.spine_io.importers.excel_reader import ExcelConnector
@@ -25,14 +26,22 @@ from spinedb_api.spine_io.importers.json_reader import JSONConnector
 from spinedb_api.spine_io.importers.datapackage_reader import DataPackageConnector
 from spinedb_api.spine_io.importers.sqlalchemy_connector import SqlAlchemyConnector
 from spine_engine.project_item.executable_item_base import ExecutableItemBase
-from spine_engine.utils.returning_process import ReturningProcess
+from .batched_sqlalchemy_connector import BatchedSqlAlchemyConnector
+from .streaming_excel_connector import StreamingExcelConnector
 from .item_info import ItemInfo
 from .do_work import do_work
+from .execution_settings import ExecutionSettings
 from ..utils import labelled_resource_filepaths
+from ..process_pool import PooledProcess
+
+_STOP_GRACE_PERIOD = 10.0
+"""Seconds to wait for a stopped import to finish cleanly before terminating it."""
 
 
 class ExecutableItem(ExecutableItemBase):
-    def __init__(self, name, mapping, selected_files, gams_path, cancel_on_error, project_dir, logger):
+    def __init__(
+        self, name, mapping, selected_files, gams_path, cancel_on_error, project_dir, logger, execution_settings=None
+    ):
         """
         Args:
             name (str): Importer's name
@@ -42,12 +51,14 @@ class ExecutableItem(ExecutableItemBase):
             cancel_on_error (bool): if True, revert changes on error and quit
             project_dir (str): absolute path to project directory
             logger (LoggerInterface): a logger
+            execution_settings (ExecutionSettings, optional): execution settings
         """
         super().__init__(name, project_dir, logger)
         self._mapping = mapping
         self._selected_files = selected_files
         self._gams_path = gams_path
         self._cancel_on_error = cancel_on_error
+        self._execution_settings = execution_settings if execution_settings is not None else ExecutionSettings()
         self._process = None
 
     @staticmethod
@@ -56,10 +67,14 @@ class ExecutableItem(ExecutableItemBase):
         return ItemInfo.item_type()
 
     def stop_execution(self):
-        """Stops executing this Gimlet."""
+        """Stops executing this Importer.
+
+        The import is asked to stop between chunks or tables so committed data and the checkpoint stay consistent;
+        the process is terminated if it does not stop within a grace period.
+        """
         super().stop_execution()
         if self._process is not None:
-            self._process.terminate()
+            self._process.cancel(_STOP_GRACE_PERIOD)
             self._process = None
 
     def execute(self, forward_resources, backward_resources):
@@ -78,6 +93,12 @@ class ExecutableItem(ExecutableItemBase):
         source_type = self._mapping["source_type"]
         if source_type == "GdxConnector":
             source_settings = {"gams_directory": self._gams_system_directory()}
+        elif source_type == "SqlAlchemyConnector" and self._execution_settings.fetch_batch_size > 0:
+            source_type = "BatchedSqlAlchemyConnector"
+            source_settings = {"fetch_batch_size": self._execution_settings.fetch_batch_size}
+        elif source_type == "ExcelConnector" and self._execution_settings.stream_excel:
+            source_type = "StreamingExcelConnector"
+            source_settings = None
         else:
             source_settings = None
         connector = {
@@ -87,8 +108,10 @@ class ExecutableItem(ExecutableItemBase):
             "JSONConnector": JSONConnector,
             "DataPackageConnector": DataPackageConnector,
             "SqlAlchemyConnector": SqlAlchemyConnector,
+            "BatchedSqlAlchemyConnector": BatchedSqlAlchemyConnector,
+            "StreamingExcelConnector": StreamingExcelConnector,
         }[source_type](source_settings)
-        self._process = ReturningProcess(
+        self._process = PooledProcess(
             target=do_work,
             args=(
                 self._mapping,
@@ -97,13 +120,20 @@ class ExecutableItem(ExecutableItemBase):
                 source_filepaths,
                 connector,
                 urls_downstream,
-                self._logger,
+                self._execution_settings,
+                self._manifest_path(),
             ),
+            logger=self._logger,
         )
         return_value = self._process.run_until_complete()
         self._process = None
         return return_value[0]
 
+    def _manifest_path(self):
+        """Returns path to the import manifest file."""
+        file_name = "__import-manifest-" + self.filter_id + ".json" if self.filter_id else "__import-manifest.json"
+        return str(Path(self._data_dir, file_name))
+
     def _gams_system_directory(self):
         """Returns GAMS system path or None if GAMS default is to be used."""
         path = self._gams_path
@@ -125,4 +155,5 @@ class ExecutableItem(ExecutableItemBase):
         selected_files = [filepath for filepath, selected in file_selection.items() if selected]
         gams_path = app_settings.value("appSettings/gamsPath", defaultValue=None)
         cancel_on_error = item_dict["cancel_on_error"]
-        return cls(name, mapping, selected_files, gams_path, cancel_on_error, project_dir, logger)
+        execution_settings = ExecutionSettings.from_dict(item_dict.get("execution_settings", {}))
+        return cls(name, mapping, selected_files, gams_path, cancel_on_error, project_dir, logger, execution_settings)
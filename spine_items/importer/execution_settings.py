@@ -0,0 +1,157 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Contains Importer's execution settings.
+
+:date:    18.10.2026
+"""
+from ..commit_policy import CommitPolicy, EVERY_N_ITEMS, PER_RUN
+
+
+class ExecutionSettings:
+    """
+    Settings that control how Importer reads and writes data during execution.
+
+    Attributes:
+        chunk_size (int): number of source rows to read and map at a time; 0 reads each table in full
+        commit_interval (int): number of imported items after which the session is committed;
+            0 commits only once at the end of the import
+        read_process_count (int): maximum number of worker processes that read source files in parallel;
+            has no effect in streaming mode
+        force_reimport (bool): if True, sources are imported even if they have not changed since last import
+        concurrent_import (bool): if True, data is imported into all downstream databases concurrently
+        sqlite_bulk_load (bool): if True, journaling and syncing of SQLite targets are relaxed
+            until the final commit
+        changed_tables_only (bool): if True, only tables whose mappings or options have changed
+            since the last successful import of an unchanged source are imported again
+        fetch_batch_size (int): number of rows to fetch at a time from database sources through a server-side cursor;
+            0 loads each table in full
+        commit_granularity (str, optional): when to commit: once per run, after each file or table,
+            or every ``commit_interval`` items; if None, granularity follows ``commit_interval``
+        dry_run (bool): if True, sources are read, mapped and converted but nothing is written
+            to downstream databases; item counts, errors and stage timings are reported instead
+        prefetch_existing_items (bool): if True, existing classes, entities, parameter definitions and alternatives
+            are read from each downstream database once per execution and declarations that would not change
+            the database are dropped before import
+        stream_excel (bool): if True, Excel sheets are read lazily from the workbook file
+            instead of loading the whole workbook into memory first
+    """
+
+    def __init__(
+        self,
+        chunk_size=0,
+        commit_interval=0,
+        read_process_count=1,
+        force_reimport=False,
+        concurrent_import=False,
+        sqlite_bulk_load=False,
+        changed_tables_only=False,
+        fetch_batch_size=0,
+        commit_granularity=None,
+        dry_run=False,
+        prefetch_existing_items=False,
+        stream_excel=False,
+    ):
+        """
+        Args:
+            chunk_size (int): number of source rows to read and map at a time; 0 reads each table in full
+            commit_interval (int): number of imported items between commits; 0 commits once at the end
+            read_process_count (int): maximum number of worker processes reading source files
+            force_reimport (bool): if True, unchanged sources are imported again
+            concurrent_import (bool): if True, downstream databases are written to concurrently
+            sqlite_bulk_load (bool): if True, SQLite targets are written in bulk load mode
+            changed_tables_only (bool): if True, unchanged tables of unchanged sources are skipped
+            fetch_batch_size (int): number of rows fetched at a time from database sources; 0 fetches all rows
+            commit_granularity (str, optional): one of the granularities in :mod:`spine_items.commit_policy`
+            dry_run (bool): if True, data is counted instead of imported
+            prefetch_existing_items (bool): if True, an index of existing items is built for each downstream database
+            stream_excel (bool): if True, Excel sources are read through a streaming reader
+        """
+        self.chunk_size = chunk_size
+        self.commit_interval = commit_interval
+        self.read_process_count = read_process_count
+        self.force_reimport = force_reimport
+        self.concurrent_import = concurrent_import
+        self.sqlite_bulk_load = sqlite_bulk_load
+        self.changed_tables_only = changed_tables_only
+        self.fetch_batch_size = fetch_batch_size
+        self.commit_granularity = commit_granularity
+        self.dry_run = dry_run
+        self.prefetch_existing_items = prefetch_existing_items
+        self.stream_excel = stream_excel
+
+    def __eq__(self, other):
+        if not isinstance(other, ExecutionSettings):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    @property
+    def streaming(self):
+        """True if source data should be read and imported in chunks."""
+        return self.chunk_size > 0
+
+    @property
+    def commit_policy(self):
+        """Policy that decides when imported data is committed."""
+        if self.commit_granularity is None:
+            granularity = EVERY_N_ITEMS if self.commit_interval > 0 else PER_RUN
+        else:
+            granularity = self.commit_granularity
+        return CommitPolicy(granularity, self.commit_interval)
+
+    def to_dict(self):
+        """
+        Serializes settings into a JSON compatible dictionary.
+
+        Returns:
+            dict: serialized settings
+        """
+        return {
+            "chunk_size": self.chunk_size,
+            "commit_interval": self.commit_interval,
+            "read_process_count": self.read_process_count,
+            "force_reimport": self.force_reimport,
+            "concurrent_import": self.concurrent_import,
+            "sqlite_bulk_load": self.sqlite_bulk_load,
+            "changed_tables_only": self.changed_tables_only,
+            "fetch_batch_size": self.fetch_batch_size,
+            "commit_granularity": self.commit_granularity,
+            "dry_run": self.dry_run,
+            "prefetch_existing_items": self.prefetch_existing_items,
+            "stream_excel": self.stream_excel,
+        }
+
+    @staticmethod
+    def from_dict(settings_dict):
+        """
+        Restores settings from a dictionary.
+
+        Args:
+            settings_dict (dict): serialized settings
+
+        Returns:
+            ExecutionSettings: restored settings
+        """
+        return ExecutionSettings(
+            settings_dict.get("chunk_size", 0),
+            settings_dict.get("commit_interval", 0),
+            settings_dict.get("read_process_count", 1),
+            settings_dict.get("force_reimport", False),
+            settings_dict.get("concurrent_import", False),
+            settings_dict.get("sqlite_bulk_load", False),
+            settings_dict.get("changed_tables_only", False),
+            settings_dict.get("fetch_batch_size", 0),
+            settings_dict.get("commit_granularity"),
+            settings_dict.get("dry_run", False),
+            settings_dict.get("prefetch_existing_items", False),
+            settings_dict.get("stream_excel", False),
+        )
@@ -0,0 +1,258 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Contains an index of items that already exist in an import target database.
+
+:date:    18.10.2026
+"""
+
+
+class ExistenceIndex:
+    """Name to id maps of classes, entities, parameter definitions and alternatives in a database.
+
+    The index is used to drop declarations of items that would not change the database
+    from mapped data before it is passed to ``import_data``.
+    If all declarations of an item type are dropped, ``import_data`` does not need to
+    query the corresponding tables at all.
+
+    A declaration is dropped if it is identical to the latest declaration of the same item imported
+    during the same execution, or if it has no optional fields and the item exists with default optional fields.
+    Items imported successfully are added to the index as pending
+    and become part of it when the session is committed; rollback discards them.
+
+    Parameter values are not indexed.
+    They usually make up the bulk of imported data and a value can be dropped only if it equals the stored one,
+    so the index would have to hold every value blob in memory and compare them one by one,
+    which costs about as much as the lookups ``import_data`` does for values anyway.
+    """
+
+    KEY_FUNCTIONS = {
+        "object_classes": lambda item: _name(item),
+        "relationship_classes": lambda item: (item[0], tuple(item[1])),
+        "objects": lambda item: (item[0], item[1]),
+        "relationships": lambda item: (item[0], tuple(item[1])),
+        "object_parameters": lambda item: (item[0], item[1]),
+        "relationship_parameters": lambda item: (item[0], item[1]),
+        "alternatives": lambda item: _name(item),
+    }
+    """Functions that return an item's index key from its declaration by item type."""
+    REQUIRED_FIELD_COUNTS = {
+        "object_classes": 1,
+        "relationship_classes": 2,
+        "objects": 2,
+        "relationships": 2,
+        "object_parameters": 2,
+        "relationship_parameters": 2,
+        "alternatives": 1,
+    }
+    """Number of non-optional fields in a declaration by item type."""
+
+    def __init__(self, ids):
+        """
+        Args:
+            ids (dict): mapping from item type to a dict that maps item key to a tuple of item id
+                and a flag that tells if the item's optional fields have their default values
+        """
+        self._ids = {item_type: dict(ids.get(item_type, {})) for item_type in self.KEY_FUNCTIONS}
+        self._declarations = {item_type: dict() for item_type in self.KEY_FUNCTIONS}
+        self._pending_ids = {item_type: dict() for item_type in self.KEY_FUNCTIONS}
+        self._pending_declarations = {item_type: dict() for item_type in self.KEY_FUNCTIONS}
+
+    @classmethod
+    def build(cls, db_map):
+        """Queries existing items from a database.
+
+        Args:
+            db_map (DatabaseMapping): database mapping
+
+        Returns:
+            ExistenceIndex: index
+        """
+        class_names = dict()
+        object_classes = dict()
+        for row in db_map.query(db_map.object_class_sq):
+            class_names[row.id] = row.name
+            object_classes[row.name] = (row.id, row.description is None and row.display_icon is None)
+        relationship_classes = dict()
+        for row in db_map.query(db_map.wide_relationship_class_sq):
+            class_names[row.id] = row.name
+            key = (row.name, tuple(row.object_class_name_list.split(",")))
+            plain = all(getattr(row, field, None) is None for field in ("description", "display_icon"))
+            relationship_classes[key] = (row.id, plain)
+        objects = {
+            (class_names[row.class_id], row.name): (row.id, row.description is None)
+            for row in db_map.query(db_map.object_sq)
+        }
+        relationships = {
+            (row.class_name, tuple(row.object_name_list.split(","))): (row.id, True)
+            for row in db_map.query(db_map.wide_relationship_sq)
+        }
+        object_parameters = dict()
+        relationship_parameters = dict()
+        for row in db_map.query(db_map.parameter_definition_sq):
+            class_name = class_names.get(row.entity_class_id)
+            if class_name is None:
+                continue
+            plain = all(getattr(row, field, None) is None for field in _PARAMETER_OPTIONAL_FIELDS)
+            definitions = object_parameters if class_name in object_classes else relationship_parameters
+            definitions[(class_name, row.name)] = (row.id, plain)
+        alternatives = {row.name: (row.id, row.description is None) for row in db_map.query(db_map.alternative_sq)}
+        return cls(
+            {
+                "object_classes": object_classes,
+                "relationship_classes": relationship_classes,
+                "objects": objects,
+                "relationships": relationships,
+                "object_parameters": object_parameters,
+                "relationship_parameters": relationship_parameters,
+                "alternatives": alternatives,
+            }
+        )
+
+    def id(self, item_type, key):
+        """Returns the id of an existing item.
+
+        Args:
+            item_type (str): item type, e.g. 'objects'
+            key (Any): item key, e.g. a tuple of class name and object name
+
+        Returns:
+            int: item id or None if the item did not exist when the index was built
+        """
+        entry = self._ids.get(item_type, {}).get(key)
+        return entry[0] if entry is not None else None
+
+    def exists(self, item_type, key):
+        """Checks if an item exists in the database or has been imported during execution.
+
+        Args:
+            item_type (str): item type, e.g. 'objects'
+            key (Any): item key, e.g. a tuple of class name and object name
+
+        Returns:
+            bool: True if item exists, False otherwise
+        """
+        return key in self._ids.get(item_type, {}) or key in self._pending_ids.get(item_type, {})
+
+    def prune(self, data):
+        """Drops declarations that would not change the database.
+
+        Args:
+            data (dict): mapped data
+
+        Returns:
+            dict: mapped data without redundant declarations; item types without declarations are omitted
+        """
+        pruned = dict()
+        for item_type, items in data.items():
+            key_function = self.KEY_FUNCTIONS.get(item_type)
+            if key_function is None:
+                if items:
+                    pruned[item_type] = items
+                continue
+            kept = list()
+            seen = set()
+            for item in items:
+                frozen = _freeze(item)
+                if frozen is not None and frozen in seen:
+                    continue
+                if self._is_redundant(item_type, key_function(item), item, frozen):
+                    continue
+                kept.append(item)
+                if frozen is not None:
+                    seen.add(frozen)
+            if kept:
+                pruned[item_type] = kept
+        return pruned
+
+    def add(self, data):
+        """Adds successfully imported declarations to the index as pending.
+
+        Args:
+            data (dict): mapped data that was imported without errors
+        """
+        for item_type, key_function in self.KEY_FUNCTIONS.items():
+            pending_ids = self._pending_ids[item_type]
+            pending_declarations = self._pending_declarations[item_type]
+            for item in data.get(item_type, ()):
+                key = key_function(item)
+                existing = self._ids[item_type].get(key)
+                pending_ids[key] = (existing[0] if existing is not None else None, not _has_optionals(item_type, item))
+                pending_declarations[key] = _freeze(item)
+
+    def commit(self):
+        """Makes pending items part of the index."""
+        for item_type in self.KEY_FUNCTIONS:
+            self._ids[item_type].update(self._pending_ids[item_type])
+            self._declarations[item_type].update(self._pending_declarations[item_type])
+        self.rollback()
+
+    def rollback(self):
+        """Discards pending items."""
+        self._pending_ids = {item_type: dict() for item_type in self.KEY_FUNCTIONS}
+        self._pending_declarations = {item_type: dict() for item_type in self.KEY_FUNCTIONS}
+
+    def _is_redundant(self, item_type, key, item, frozen):
+        """Checks if importing a declaration would leave the database unchanged.
+
+        Args:
+            item_type (str): item type
+            key (Any): item key
+            item (Any): declaration
+            frozen (Any): hashable declaration or None
+
+        Returns:
+            bool: True if declaration can be dropped, False otherwise
+        """
+        if key in self._pending_declarations[item_type]:
+            declaration = self._pending_declarations[item_type][key]
+        else:
+            declaration = self._declarations[item_type].get(key)
+        if frozen is not None and declaration == frozen:
+            return True
+        if _has_optionals(item_type, item):
+            return False
+        entry = self._pending_ids[item_type].get(key)
+        if entry is None:
+            entry = self._ids[item_type].get(key)
+        return entry is not None and entry[1]
+
+
+_PARAMETER_OPTIONAL_FIELDS = ("default_value", "parameter_value_list_id", "description")
+
+
+def _name(item):
+    """Returns the name of a declaration that is either a name or a list starting with the name."""
+    return item if isinstance(item, str) else item[0]
+
+
+def _has_optionals(item_type, item):
+    """Checks if a declaration sets any optional fields."""
+    if isinstance(item, str):
+        return False
+    return any(field is not None for field in item[ExistenceIndex.REQUIRED_FIELD_COUNTS[item_type] :])
+
+
+def _freeze(item):
+    """Converts a declaration into a hashable form.
+
+    Returns:
+        tuple or str: hashable declaration or None if the declaration contains unhashable values
+    """
+    if isinstance(item, str):
+        return item
+    frozen = tuple(tuple(field) if isinstance(field, list) else field for field in item)
+    try:
+        hash(frozen)
+    except TypeError:
+        return None
+    return frozen
@@ -0,0 +1,253 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Contains Importer's import manifest that keeps track of successfully imported sources.
+
+:date:    18.10.2026
+"""
+import hashlib
+import json
+import os.path
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class ImportManifest:
+    """
+    Records which sources have been imported into which databases with which mapping.
+
+    Entries are stored per target URL and source path.
+    Each entry records the target database's URL and latest commit after the import;
+    an entry is valid only as long as the database has not been committed to since.
+    An import that was interrupted leaves a checkpoint entry that lists the tables that were committed.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): path to manifest file
+        """
+        self._path = path
+        self._imports = dict()
+        if os.path.exists(path):
+            try:
+                with open(path) as manifest_file:
+                    self._imports = json.load(manifest_file).get("imports", {})
+            except (OSError, ValueError):
+                self._imports = dict()
+
+    def is_up_to_date(self, source, source_hash, mapping_hash, url, commit):
+        """
+        Checks if a source has been imported into a database with the same contents and mapping.
+
+        Args:
+            source (str): path to source
+            source_hash (str, optional): hash of source's contents
+            mapping_hash (str): hash of the import mapping
+            url (str): target database URL
+            commit (list, optional): id and date of database's latest commit
+
+        Returns:
+            bool: True if source is up to date in target database, False otherwise
+        """
+        entry = self._valid_entry(source, source_hash, url, commit)
+        if entry is None or entry.get("checkpoint", False):
+            return False
+        return entry["mapping_hash"] == mapping_hash
+
+    def is_checkpoint(self, source, source_hash, url, commit):
+        """
+        Checks if the import of an unchanged source into a database was interrupted after some tables were committed.
+
+        Args:
+            source (str): path to source
+            source_hash (str, optional): hash of source's contents
+            url (str): target database URL
+            commit (list, optional): id and date of database's latest commit
+
+        Returns:
+            bool: True if there is a checkpoint for the source, False otherwise
+        """
+        entry = self._valid_entry(source, source_hash, url, commit)
+        return entry is not None and entry.get("checkpoint", False)
+
+    def outdated_tables(self, source, source_hash, table_hashes, url, commit):
+        """
+        Lists tables that have changed since source was last imported into a database.
+
+        All tables are outdated if the source or the database has changed or the source has not been imported before.
+
+        Args:
+            source (str): path to source
+            source_hash (str, optional): hash of source's contents
+            table_hashes (dict): mapping from table name to hash of table's mappings and options
+            url (str): target database URL
+            commit (list, optional): id and date of database's latest commit
+
+        Returns:
+            list of str: names of outdated tables
+        """
+        entry = self._valid_entry(source, source_hash, url, commit)
+        if entry is None or "table_hashes" not in entry:
+            return list(table_hashes)
+        imported_hashes = entry["table_hashes"]
+        return [table for table, hash_ in table_hashes.items() if imported_hashes.get(table) != hash_]
+
+    def update(self, source, source_hash, mapping_hash, url, commit, table_hashes=None):
+        """
+        Records a successful import.
+
+        Args:
+            source (str): path to source
+            source_hash (str, optional): hash of source's contents
+            mapping_hash (str): hash of the import mapping
+            url (str): target database URL
+            commit (list, optional): id and date of database's latest commit after the import
+            table_hashes (dict, optional): mapping from table name to hash of table's mappings and options
+        """
+        if source_hash is None or commit is None:
+            return
+        entry = {"source_hash": source_hash, "mapping_hash": mapping_hash, "target": _target(url, commit)}
+        if table_hashes is not None:
+            entry["table_hashes"] = table_hashes
+        self._imports.setdefault(url, {})[source] = entry
+
+    def update_checkpoint(self, source, source_hash, url, commit, table_hashes, resumed_commit=None):
+        """
+        Records tables that were committed before an import was interrupted.
+
+        Tables recorded earlier for the same source contents are kept
+        if the import resumed from that checkpoint, i.e. the checkpoint was recorded at ``resumed_commit``.
+
+        Args:
+            source (str): path to source
+            source_hash (str, optional): hash of source's contents
+            url (str): target database URL
+            commit (list, optional): id and date of database's latest commit after the interruption
+            table_hashes (dict): mapping from committed table's name to hash of its mappings and options
+            resumed_commit (list, optional): id and date of database's latest commit before the import
+        """
+        if source_hash is None or commit is None:
+            return
+        entries = self._imports.setdefault(url, {})
+        committed = dict()
+        resumed_entry = self._valid_entry(source, source_hash, url, resumed_commit)
+        if resumed_entry is not None and resumed_entry.get("checkpoint", False):
+            committed.update(resumed_entry.get("table_hashes", {}))
+        committed.update(table_hashes)
+        entries[source] = {
+            "source_hash": source_hash,
+            "mapping_hash": None,
+            "target": _target(url, commit),
+            "table_hashes": committed,
+            "checkpoint": True,
+        }
+
+    def save(self):
+        """Writes the manifest to disk."""
+        with open(self._path, "w") as manifest_file:
+            json.dump({"imports": self._imports}, manifest_file, indent=4)
+
+    def _valid_entry(self, source, source_hash, url, commit):
+        """
+        Returns source's entry if it was recorded for the same source contents and database state.
+
+        Args:
+            source (str): path to source
+            source_hash (str, optional): hash of source's contents
+            url (str): target database URL
+            commit (list, optional): id and date of database's latest commit
+
+        Returns:
+            dict: entry or None if there is no valid entry
+        """
+        if source_hash is None or commit is None:
+            return None
+        entry = self._imports.get(url, {}).get(source)
+        if entry is None or entry["source_hash"] != source_hash or entry.get("target") != _target(url, commit):
+            return None
+        return entry
+
+
+def _target(url, commit):
+    """
+    Creates a JSON compatible record of target database's state.
+
+    Args:
+        url (str): target database URL
+        commit (list): id and date of database's latest commit
+
+    Returns:
+        dict: database state
+    """
+    return {"url": url, "commit": list(commit)}
+
+
+def source_hash(path):
+    """
+    Calculates a hash of file's contents.
+
+    Args:
+        path (str): path to file
+
+    Returns:
+        str: hex digest or None if path is not a readable file
+    """
+    if not os.path.isfile(path):
+        return None
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as source_file:
+            for block in iter(lambda: source_file.read(_HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def mapping_hash(mapping):
+    """
+    Calculates a hash of import mapping.
+
+    Args:
+        mapping (dict): import mapping
+
+    Returns:
+        str: hex digest
+    """
+    serialized = json.dumps(mapping, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def table_hashes(mapping):
+    """
+    Calculates hashes of each selected table's mappings, options and types.
+
+    Args:
+        mapping (dict): import mapping
+
+    Returns:
+        dict: mapping from table name to hex digest
+    """
+    selected_tables = mapping.get("selected_tables", [])
+    return {
+        table: mapping_hash(
+            {
+                "mappings": table_mappings,
+                "options": mapping.get("table_options", {}).get(table, {}),
+                "types": mapping.get("table_types", {}).get(table, {}),
+                "row_types": mapping.get("table_row_types", {}).get(table, {}),
+            }
+        )
+        for table, table_mappings in mapping.get("table_mappings", {}).items()
+        if table in selected_tables
+    }
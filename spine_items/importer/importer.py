@@ -25,6 +25,7 @@ from spine_engine import ExecutionDirection
 from ..commands import UpdateCancelOnErrorCommand, ChangeItemSelectionCommand
 from ..models import CheckableFileListModel
 from .executable_item import ExecutableItem
+from .execution_settings import ExecutionSettings
 from .item_info import ItemInfo
 
 
@@ -40,6 +41,7 @@ class Importer(ProjectItem):
         specification_name="",
         cancel_on_error=True,
         file_selection=None,
+        execution_settings=None,
     ):
         """Importer class.
 
@@ -53,6 +55,7 @@ class Importer(ProjectItem):
             specification_name (str, optional): a spec name
             cancel_on_error (bool): if True the item's execution will stop on import error
             file_selection (dict): a map from label to a bool indicating if the file item is checked
+            execution_settings (ExecutionSettings, optional): settings that control reading and writing data
        """
         super().__init__(name, description, x, y, project)
         # Make logs subdirectory for this item
@@ -69,6 +72,7 @@ class Importer(ProjectItem):
                 f"Importer <b>{self.name}</b> should have a specification <b>{specification_name}</b> but it was not found"
             )
         self.cancel_on_error = cancel_on_error
+        self.execution_settings = execution_settings if execution_settings is not None else ExecutionSettings()
         self._file_model = CheckableFileListModel(header_label="Source files")
         self._file_model.set_initial_state(file_selection if file_selection is not None else dict())
         self._file_model.checked_state_changed.connect(self._push_file_selection_change_to_undo_stack)
@@ -255,6 +259,7 @@ class Importer(ProjectItem):
         else:
             d["specification"] = self.specification().name
         d["cancel_on_error"] = self.cancel_on_error
+        d["execution_settings"] = self.execution_settings.to_dict()
         selections = list()
         for row in range(self._file_model.rowCount()):
             label, selected = self._file_model.checked_data(self._file_model.index(row, 0))
@@ -269,7 +274,19 @@ class Importer(ProjectItem):
         specification_name = item_dict.get("specification", "")
         cancel_on_error = item_dict.get("cancel_on_error", False)
         file_selection = {label: selected for label, selected in item_dict.get("file_selection", list())}
-        return Importer(name, description, x, y, toolbox, project, specification_name, cancel_on_error, file_selection)
+        execution_settings = ExecutionSettings.from_dict(item_dict.get("execution_settings", {}))
+        return Importer(
+            name,
+            description,
+            x,
+            y,
+            toolbox,
+            project,
+            specification_name,
+            cancel_on_error,
+            file_selection,
+            execution_settings,
+        )
 
     def notify_destination(self, source_item):
         """See base class."""
@@ -694,6 +694,7 @@ class MappingSpecificationModel(QAbstractTableModel):
         if columns is None:
             columns = []
         self._item_mapping.skip_columns = list(set(columns))
+        self.mapping_changed.emit()
 
     def set_time_series_repeat(self, repeat):
         """Toggles the repeat flag in the parameter's options."""
@@ -14,11 +14,11 @@ Contains the source data table model.
 :author: P. Vennström (VTT)
 :date:   1.6.2019
 """
-from PySide2.QtCore import Qt, Signal, Slot
+import numpy
+from PySide2.QtCore import Qt, QTimer, Signal, Slot
 from spinedb_api import (
     EntityClassMapping,
     ParameterValueMapping,
-    SingleMappingBase,
     ColumnHeaderMapping,
     ColumnMapping,
     RowMapping,
@@ -26,9 +26,12 @@ from spinedb_api import (
     mapping_non_pivoted_columns,
 )
 from spinetoolbox.mvcmodels.minimal_table_model import MinimalTableModel
-from spinedb_api.spine_io.type_conversion import ConvertSpec
+from spinedb_api.spine_io.type_conversion import ConvertSpec, FloatConvertSpec
 from ..mapping_colors import ERROR_COLOR
 
+_VALIDATION_BATCH_SIZE = 200
+"""Number of rows to validate at a time."""
+
 
 class SourceDataTableModel(MinimalTableModel):
     """A model for import mapping specification.
@@ -48,28 +51,44 @@ class SourceDataTableModel(MinimalTableModel):
         self._mapping_specification = None
         self._column_types = {}
         self._row_types = {}
-        self._column_type_errors = {}
-        self._row_type_errors = {}
-        self._converted_data = {}
+        self._converted_columns = {}
+        self._converted_rows = {}
+        self._validated_row_count = 0
+        self._validation_timer = QTimer(self)
+        self._validation_timer.setSingleShot(True)
+        self._validation_timer.setInterval(0)
+        self._validation_timer.timeout.connect(self._validate_next_rows)
+        self._mapping_roles = None
 
     def mapping_specification(self):
         return self._mapping_specification
 
     def clear(self):
-        self._column_type_errors = {}
-        self._row_type_errors = {}
         self._column_types = {}
         self._row_types = {}
-        self._converted_data = {}
+        self._converted_columns = {}
+        self._converted_rows = {}
+        self._validation_timer.stop()
+        self._validated_row_count = 0
+        self._mapping_roles = None
         super().clear()
 
     def reset_model(self, main_data=None):
-        self._column_type_errors = {}
-        self._row_type_errors = {}
         self._column_types = {}
         self._row_types = {}
-        self._converted_data = {}
+        self._converted_columns = {}
+        self._converted_rows = {}
+        self._mapping_roles = None
         super().reset_model(main_data)
+        self._validated_row_count = min(self.rowCount(), _VALIDATION_BATCH_SIZE)
+        if self._validated_row_count < self.rowCount():
+            self._validation_timer.start()
+        else:
+            self._validation_timer.stop()
+
+    def set_horizontal_header_labels(self, labels):
+        self._mapping_roles = None
+        super().set_horizontal_header_labels(labels)
 
     def set_mapping(self, mapping):
         """Set mapping to display colors from
@@ -80,6 +99,7 @@ class SourceDataTableModel(MinimalTableModel):
         if self._mapping_specification is not None:
             self._mapping_specification.dataChanged.disconnect(self._mapping_data_changed)
             self._mapping_specification.mapping_read_start_row_changed.disconnect(self._mapping_data_changed)
+            self._mapping_specification.mapping_changed.disconnect(self._mapping_data_changed)
             self._mapping_specification.row_or_column_type_recommendation_changed.disconnect(self.set_type)
             self._mapping_specification.multi_column_type_recommendation_changed.disconnect(self.set_all_column_types)
         self._mapping_specification = mapping
@@ -87,6 +107,7 @@ class SourceDataTableModel(MinimalTableModel):
             self._mapping_specification.dataChanged.connect(self._mapping_data_changed)
             self._mapping_specification.modelReset.connect(self._mapping_data_changed)
             self._mapping_specification.mapping_read_start_row_changed.connect(self._mapping_data_changed)
+            self._mapping_specification.mapping_changed.connect(self._mapping_data_changed)
             self._mapping_specification.row_or_column_type_recommendation_changed.connect(self.set_type)
             self._mapping_specification.multi_column_type_recommendation_changed.connect(self.set_all_column_types)
         self._mapping_data_changed()
@@ -95,37 +116,107 @@ class SourceDataTableModel(MinimalTableModel):
         type_class = self.get_type(section, orientation)
         if type_class is None:
             return
-        converter = type_class.convert_function()
         if orientation == Qt.Horizontal:
-            for row in range(self.rowCount()):
-                self._column_type_errors.pop((row, section), None)
-                data = self.index(row, section).data(Qt.EditRole)
-                if isinstance(data, str) and not data:
-                    data = None
-                if data is not None:
-                    try:
-                        self._converted_data[row, section] = converter(data)
-                    except (ValueError, ParameterValueFormatError) as e:
-                        self._converted_data.pop((row, section), None)
-                        self._column_type_errors[row, section] = e
+            converted = ConvertedSection(type_class, self.rowCount())
+            converted.convert(_column_values(self._main_data[: self._validated_row_count], section))
+            self._converted_columns[section] = converted
             top_left = self.index(0, section)
-            bottom_right = self.index(self.rowCount() - 1, section)
+            bottom_right = self.index(self._validated_row_count - 1, section)
         else:
-            for column in range(self.columnCount()):
-                self._row_type_errors.pop((section, column), None)
-                data = self.index(section, column).data(Qt.EditRole)
-                if isinstance(data, str) and not data:
-                    data = None
-                if data is not None:
-                    try:
-                        self._converted_data[section, column] = converter(data)
-                    except (ValueError, ParameterValueFormatError) as e:
-                        self._converted_data.pop((section, column), None)
-                        self._row_type_errors[section, column] = e
+            converted = ConvertedSection(type_class, self.columnCount())
+            converted.convert(self._main_data[section])
+            self._converted_rows[section] = converted
             top_left = self.index(section, 0)
             bottom_right = self.index(section, self.columnCount() - 1)
         self.dataChanged.emit(top_left, bottom_right)
 
+    @Slot(int)
+    def validate_rows(self, last_row):
+        """Makes sure column types have been validated up to given row.
+
+        Remaining rows are validated in the background.
+
+        Args:
+            last_row (int): last row to validate
+        """
+        self._extend_validated_rows(last_row + 1)
+        if self._validated_row_count < self.rowCount() and not self._validation_timer.isActive():
+            self._validation_timer.start()
+
+    @Slot()
+    def _validate_next_rows(self):
+        """Validates the next batch of rows and reschedules itself if there are rows left."""
+        self._extend_validated_rows(self._validated_row_count + _VALIDATION_BATCH_SIZE)
+        if self._validated_row_count < self.rowCount():
+            self._validation_timer.start()
+
+    def _extend_validated_rows(self, row_count):
+        """Validates column types of rows that have not been validated yet up to given row count.
+
+        Args:
+            row_count (int): number of rows that should be validated
+        """
+        row_count = min(row_count, self.rowCount())
+        first_row = self._validated_row_count
+        if row_count <= first_row:
+            return
+        rows = self._main_data[first_row:row_count]
+        for column, converted in self._converted_columns.items():
+            converted.convert(_column_values(rows, column), first_row)
+        self._validated_row_count = row_count
+        if self._converted_columns:
+            self.dataChanged.emit(self.index(first_row, 0), self.index(row_count - 1, self.columnCount() - 1))
+
+    def type_errors(self, orientation=Qt.Horizontal, complete=False):
+        """Collects conversion errors of rows or columns.
+
+        Column types are validated lazily, so by default column type errors
+        cover only the rows that have been validated so far.
+
+        Args:
+            orientation (Qt.Orientation): Qt.Horizontal for column type errors, Qt.Vertical for row type errors
+            complete (bool): if True, remaining rows are validated first so errors of the whole table are returned
+
+        Returns:
+            dict: mapping from (row, column) to error
+        """
+        if orientation == Qt.Horizontal:
+            if complete:
+                self._validation_timer.stop()
+                self._extend_validated_rows(self.rowCount())
+            return {
+                (row, column): error
+                for column, section in self._converted_columns.items()
+                for row, error in section.errors.items()
+            }
+        return {
+            (row, column): error
+            for row, section in self._converted_rows.items()
+            for column, error in section.errors.items()
+        }
+
+    def _type_error(self, row, column, orientation):
+        """Returns conversion error of a cell or None if the cell was converted successfully."""
+        if orientation == Qt.Horizontal:
+            section = self._converted_columns.get(column)
+            position = row
+        else:
+            section = self._converted_rows.get(row)
+            position = column
+        if section is None:
+            return None
+        return section.error(position)
+
+    def _converted_value(self, row, column):
+        """Returns converted value of a cell or None if the cell has not been converted."""
+        section = self._converted_columns.get(column)
+        value = section.value(row) if section is not None else None
+        if value is None:
+            section = self._converted_rows.get(row)
+            if section is not None:
+                value = section.value(column)
+        return value
+
     def get_type(self, section, orientation=Qt.Horizontal):
         if orientation == Qt.Horizontal:
             return self._column_types.get(section, None)
@@ -175,6 +266,7 @@ class SourceDataTableModel(MinimalTableModel):
 
     @Slot()
     def _mapping_data_changed(self):
+        self._mapping_roles = None
         self.update_colors()
         self.mapping_changed.emit()
 
@@ -193,34 +285,23 @@ class SourceDataTableModel(MinimalTableModel):
             return ERROR_COLOR
 
     def data(self, index, role=Qt.DisplayRole):
-        if self._mapping_specification:
-            last_pivoted_row = self._mapping_specification.last_pivot_row
-            read_from_row = self._mapping_specification.read_start_row
-        else:
-            last_pivoted_row = -1
-            read_from_row = 0
         if role in (Qt.ToolTipRole, Qt.BackgroundRole):
-            if index.row() > max(last_pivoted_row, read_from_row - 1):
-                error = self._column_type_errors.get((index.row(), index.column()))
+            roles = self._roles()
+            if index.row() >= roles.first_data_row:
+                error = self._type_error(index.row(), index.column(), Qt.Horizontal)
                 if error is not None:
                     return self.data_error(error, index, role, orientation=Qt.Horizontal)
 
-            if index.row() <= last_pivoted_row:
-                if (
-                    index.column()
-                    not in mapping_non_pivoted_columns(
-                        self._mapping_specification.mapping, self.columnCount(), self.header
-                    )
-                    and index.column() not in self._mapping_specification.skip_columns
-                ):
-                    error = self._row_type_errors.get((index.row(), index.column()))
+            if index.row() <= roles.last_pivoted_row:
+                if index.column() not in roles.non_pivoted_columns:
+                    error = self._type_error(index.row(), index.column(), Qt.Vertical)
                     if error is not None:
                         return self.data_error(error, index, role, orientation=Qt.Vertical)
 
         if role == Qt.BackgroundRole and self._mapping_specification:
             return self.data_color(index)
         if role == Qt.DisplayRole:
-            converted_data = self._converted_data.get((index.row(), index.column()))
+            converted_data = self._converted_value(index.row(), index.column())
             if converted_data is not None:
                 return str(converted_data)
         return super().data(index, role)
@@ -235,59 +316,17 @@ class SourceDataTableModel(MinimalTableModel):
         Returns:
             QColor: color of index
         """
-        mapping = self._mapping_specification.mapping
-        if self.index_below_last_pivot_row(mapping, index):
-            return self._mapping_specification.data_color("Parameter values")
-        for k, component_mapping in enumerate(self._mapping_specification._component_mappings):
-            if self.index_in_mapping(component_mapping, index):
-                return self._mapping_specification._colors[k]
-        return None
-
-    def index_below_last_pivot_row(self, mapping, index):
-        if not isinstance(mapping, EntityClassMapping):
-            return False
-        if not isinstance(mapping.parameters, ParameterValueMapping):
-            return False
-        if not mapping.is_pivoted():
-            return False
-        last_row = max(mapping.last_pivot_row(), mapping.read_start_row - 1)
-        return (
-            last_row is not None and index.row() > last_row and index.column() not in self.mapping_column_ref_int_list()
-        )
-
-    def index_in_mapping(self, mapping, index):
-        """
-        Checks if index is in mapping
+        return self._roles().data_color(index.row(), index.column())
 
-        Args:
-            mapping (SingleMappingBase): mapping
-            index (QModelIndex): index
+    def _roles(self):
+        """Returns mapping roles of rows and columns, building them first if necessary.
 
         Returns:
-            bool: True if mapping is in index
+            MappingRoles: roles
         """
-        if not isinstance(mapping, SingleMappingBase):
-            return False
-        if isinstance(mapping, ColumnHeaderMapping):
-            # column header can't be in data
-            return False
-        if isinstance(mapping, ColumnMapping):
-            if index.column() == self._reference_from_header(mapping.reference):
-                if self._mapping_specification.mapping.is_pivoted():
-                    # only rows below pivoted rows
-                    last_row = max(
-                        self._mapping_specification.mapping.last_pivot_row(),
-                        self._mapping_specification.read_start_row - 1,
-                    )
-                    if last_row is not None and index.row() > last_row:
-                        return True
-                elif index.row() >= self._mapping_specification.read_start_row:
-                    return True
-        if isinstance(mapping, RowMapping):
-            if index.row() == mapping.reference:
-                if index.column() not in self.mapping_column_ref_int_list():
-                    return True
-        return False
+        if self._mapping_roles is None:
+            self._mapping_roles = MappingRoles(self)
+        return self._mapping_roles
 
     def mapping_column_ref_int_list(self):
         """Returns a list of column indexes that are not pivoted
@@ -322,13 +361,175 @@ class SourceDataTableModel(MinimalTableModel):
             return super().headerData(section, orientation, role)
         if self._mapping_specification is None:
             return super().headerData(section, orientation, role)
-        for k, component_mapping in enumerate(self._mapping_specification._component_mappings):
-            if self.section_in_mapping(component_mapping, section):
-                return self._mapping_specification._colors[k]
-
-    def section_in_mapping(self, mapping, section):
-        if isinstance(mapping, ColumnHeaderMapping):
-            return section == self._reference_from_header(mapping.reference)
-        if isinstance(mapping, RowMapping):
-            return mapping.reference == -1
-        return False
+        return self._roles().header_color(section)
+
+
+class MappingRoles:
+    """Lookup tables that tell which mapping component each row and column belongs to.
+
+    The tables are built once per mapping change so painting cells does not need to go through the mapping.
+    """
+
+    def __init__(self, model):
+        """
+        Args:
+            model (SourceDataTableModel): source data model
+        """
+        specification = model.mapping_specification()
+        self._column_rules = dict()
+        self._row_rules = dict()
+        self._header_colors = dict()
+        self._all_headers_color = None
+        self._pivoted_values_start_row = None
+        self._pivoted_values_color = None
+        self._reference_columns = set()
+        if specification is None:
+            self.last_pivoted_row = -1
+            self.first_data_row = 0
+            self.non_pivoted_columns = set()
+            return
+        mapping = specification.mapping
+        self.last_pivoted_row = specification.last_pivot_row
+        self.first_data_row = max(self.last_pivoted_row, specification.read_start_row - 1) + 1
+        self.non_pivoted_columns = set(mapping_non_pivoted_columns(mapping, model.columnCount(), model.header))
+        self.non_pivoted_columns |= set(specification.skip_columns)
+        self._reference_columns = set(model.mapping_column_ref_int_list())
+        if (
+            isinstance(mapping, EntityClassMapping)
+            and isinstance(mapping.parameters, ParameterValueMapping)
+            and mapping.is_pivoted()
+        ):
+            last_row = max(mapping.last_pivot_row(), mapping.read_start_row - 1)
+            if last_row is not None:
+                self._pivoted_values_start_row = last_row + 1
+                self._pivoted_values_color = specification.data_color("Parameter values")
+        if mapping.is_pivoted():
+            last_row = max(mapping.last_pivot_row(), specification.read_start_row - 1)
+            column_start_row = last_row + 1 if last_row is not None else None
+        else:
+            column_start_row = specification.read_start_row
+        for k, (component, color) in enumerate(zip(specification._component_mappings, specification._colors)):
+            if isinstance(component, ColumnHeaderMapping):
+                self._header_colors.setdefault(model._reference_from_header(component.reference), (k, color))
+            elif isinstance(component, RowMapping):
+                if component.reference == -1 and self._all_headers_color is None:
+                    self._all_headers_color = (k, color)
+                self._row_rules.setdefault(component.reference, (k, color))
+            elif isinstance(component, ColumnMapping) and column_start_row is not None:
+                column = model._reference_from_header(component.reference)
+                self._column_rules.setdefault(column, (k, column_start_row, color))
+
+    def data_color(self, row, column):
+        """Returns background color of a cell.
+
+        Args:
+            row (int): row
+            column (int): column
+
+        Returns:
+            QColor: color or None if cell is not part of any mapping component
+        """
+        if (
+            self._pivoted_values_start_row is not None
+            and row >= self._pivoted_values_start_row
+            and column not in self._reference_columns
+        ):
+            return self._pivoted_values_color
+        candidates = list()
+        column_rule = self._column_rules.get(column)
+        if column_rule is not None and row >= column_rule[1]:
+            candidates.append((column_rule[0], column_rule[2]))
+        row_rule = self._row_rules.get(row)
+        if row_rule is not None and column not in self._reference_columns:
+            candidates.append(row_rule)
+        if not candidates:
+            return None
+        return min(candidates, key=lambda candidate: candidate[0])[1]
+
+    def header_color(self, section):
+        """Returns background color of a horizontal header section.
+
+        Args:
+            section (int): column
+
+        Returns:
+            QColor: color or None if section is not part of any mapping component
+        """
+        candidates = [rule for rule in (self._header_colors.get(section), self._all_headers_color) if rule is not None]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda candidate: candidate[0])[1]
+
+
+class ConvertedSection:
+    """Converted values and conversion errors of a single row or column.
+
+    Values are converted in batches as they are needed.
+    Floats are parsed by numpy if all of them are valid, otherwise values are converted one by one.
+    Floats are stored in a float array where NaN marks a missing value;
+    other types are kept in an object array.
+    Errors are kept only for the values that failed to convert.
+    """
+
+    __slots__ = ("_type_class", "_values", "errors")
+
+    def __init__(self, type_class, size):
+        """
+        Args:
+            type_class (ConvertSpec): conversion specification
+            size (int): number of values in the section
+        """
+        self._type_class = type_class
+        if isinstance(type_class, FloatConvertSpec):
+            self._values = numpy.full(size, numpy.nan)
+        else:
+            self._values = numpy.full(size, None, dtype=object)
+        self.errors = dict()
+
+    def convert(self, values, first=0):
+        """Converts a batch of values.
+
+        Args:
+            values (Sequence): raw values
+            first (int): position of the first value within the section
+        """
+        positions = [
+            first + i
+            for i, value in enumerate(values)
+            if value is not None and not (isinstance(value, str) and not value)
+        ]
+        if not positions:
+            return
+        present_values = [values[position - first] for position in positions]
+        if isinstance(self._type_class, FloatConvertSpec):
+            try:
+                floats = numpy.array(present_values, dtype=float)
+            except (TypeError, ValueError):
+                pass
+            else:
+                self._values[positions] = floats
+                return
+        converter = self._type_class.convert_function()
+        for position, value in zip(positions, present_values):
+            try:
+                self._values[position] = converter(value)
+            except (ValueError, ParameterValueFormatError) as e:
+                self.errors[position] = e
+
+    def value(self, position):
+        """Returns converted value at given position or None if value is missing or could not be converted."""
+        if position >= len(self._values):
+            return None
+        value = self._values[position]
+        if self._values.dtype == object:
+            return value
+        return None if numpy.isnan(value) else float(value)
+
+    def error(self, position):
+        """Returns conversion error at given position or None if there was no error."""
+        return self.errors.get(position)
+
+
+def _column_values(rows, column):
+    """Picks values of a column from given rows."""
+    return [row[column] if column < len(row) else None for row in rows]
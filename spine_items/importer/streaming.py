@@ -0,0 +1,83 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Contains utilities to read and map source data in chunks.
+
+:date:    18.10.2026
+"""
+from itertools import islice
+import time
+from .throughput import TimedRows
+
+
+def mapped_data_chunks(connector, compiled_tables, chunk_size, report=None, source=None):
+    """
+    Reads and maps source tables at most ``chunk_size`` rows at a time.
+
+    Tables that have pivoted mappings need the pivoted rows to map any other row;
+    such tables are mapped in full.
+
+    Args:
+        connector (SourceConnection): a connector that has been connected to source
+        compiled_tables (dict): mapping from table name to :class:`CompiledTable`
+        chunk_size (int): maximum number of rows in a chunk; 0 maps each table in full
+        report (ThroughputReport, optional): report to record read and map times as well as row and item counts
+        source (str, optional): source path for the report
+
+    Yields:
+        tuple: table name, mapped data and a list of (table name, error) tuples
+    """
+    for table, compiled in compiled_tables.items():
+        start = time.perf_counter()
+        data_iterator, header, column_count = connector.get_data_iterator(table, compiled.options, -1)
+        rows = TimedRows(data_iterator)
+        if report is not None:
+            report.add_time("read", time.perf_counter() - start, source, table)
+        if chunk_size <= 0 or compiled.pivoted:
+            chunks = ((0, rows),)
+        else:
+            chunks = _chunks(rows, chunk_size)
+        read_seconds = rows.seconds
+        row_count = rows.count
+        for first_row, chunk in chunks:
+            start = time.perf_counter()
+            read_seconds_before_mapping = rows.seconds
+            data, errors = compiled.map_rows(chunk, column_count, header, first_row)
+            if report is not None:
+                map_seconds = time.perf_counter() - start - (rows.seconds - read_seconds_before_mapping)
+                report.add_time("read", rows.seconds - read_seconds, source, table)
+                report.add_time("map", map_seconds, source, table)
+                report.add_rows(rows.count - row_count, source, table)
+                report.add_items(sum(len(d) for d in data.values()), source, table)
+                read_seconds = rows.seconds
+                row_count = rows.count
+            yield table, data, [(table, error) for error in errors]
+
+
+def _chunks(rows, chunk_size):
+    """
+    Splits rows into chunks.
+
+    Args:
+        rows (Iterator): rows
+        chunk_size (int): maximum number of rows in a chunk
+
+    Yields:
+        tuple: index of chunk's first row and list of rows in the chunk
+    """
+    first_row = 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        yield first_row, chunk
+        first_row += len(chunk)
@@ -0,0 +1,127 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Contains an Excel source connector that reads sheets lazily from disk.
+
+:date:    18.10.2026
+"""
+from itertools import chain, islice, takewhile
+from openpyxl import load_workbook
+from spinedb_api.spine_io.importers.excel_reader import ExcelConnector
+
+
+class StreamingExcelConnector(ExcelConnector):
+    """An ExcelConnector that streams sheet rows from the workbook file.
+
+    The base class copies the whole workbook into memory before opening it;
+    this connector opens the file in read-only mode and parses only as many rows as are consumed,
+    so memory use does not grow with sheet size and previews of the first rows are fast.
+    The workbook file is opened for each data request and closed once its rows have been consumed,
+    so the file does not stay locked between requests.
+    """
+
+    def __init__(self, settings):
+        super().__init__(settings)
+        self._sheet_names = []
+
+    def connect_to_source(self, source):
+        """See base class."""
+        if source:
+            self._filename = source
+            workbook = self._open_workbook()
+            try:
+                self._sheet_names = list(workbook.sheetnames)
+            finally:
+                workbook.close()
+
+    def disconnect(self):
+        """See base class."""
+        super().disconnect()
+        self._sheet_names = []
+
+    def create_default_mapping(self):
+        """See base class."""
+        if self._filename is None:
+            return super().create_default_mapping()
+        self._wb = self._open_workbook()
+        try:
+            return super().create_default_mapping()
+        finally:
+            self._wb.close()
+            self._wb = None
+
+    def get_tables(self):
+        """See base class."""
+        return list(self._sheet_names)
+
+    def get_data_iterator(self, table, options, max_rows=-1):
+        """See base class."""
+        if self._filename is None or table not in self._sheet_names:
+            return iter([]), [], 0
+        workbook = self._open_workbook()
+        try:
+            worksheet = workbook[table]
+            has_header = options.get("header", False)
+            skip_rows = options.get("row", 0)
+            skip_columns = options.get("column", 0)
+            stop_at_empty_col = options.get("read_until_col", False)
+            stop_at_empty_row = options.get("read_until_row", False)
+            last_row = skip_rows + max_rows if max_rows >= 0 else None
+            rows = worksheet.iter_rows(
+                min_row=skip_rows + 1, max_row=last_row, min_col=skip_columns + 1, values_only=True
+            )
+            first_row = next(rows, None)
+        except Exception:
+            workbook.close()
+            raise
+        if first_row is None:
+            workbook.close()
+            return iter([]), [], 0
+        column_count = len(first_row)
+        if stop_at_empty_col:
+            for i, value in enumerate(first_row):
+                if value is None:
+                    column_count = i
+                    break
+        if has_header:
+            header = list(first_row[:column_count])
+        else:
+            header = []
+            rows = chain((first_row,), rows)
+        data_iterator = (list(islice(row, column_count)) for row in rows)
+        if stop_at_empty_row:
+            data_iterator = takewhile(lambda row: bool(row) and row[0] is not None, data_iterator)
+        return _closing(data_iterator, workbook), header, column_count
+
+    def _open_workbook(self):
+        """Opens the source file as a read-only workbook.
+
+        Returns:
+            Workbook: workbook
+        """
+        return load_workbook(self._filename, read_only=True, data_only=True, keep_links=False)
+
+
+def _closing(rows, workbook):
+    """Yields rows and closes the workbook once they have been consumed or the generator is discarded.
+
+    Args:
+        rows (Iterator): data rows
+        workbook (Workbook): workbook the rows are read from
+
+    Yields:
+        list: data row
+    """
+    try:
+        yield from rows
+    finally:
+        workbook.close()
@@ -0,0 +1,254 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Contains utilities to measure Importer's throughput.
+
+:date:    18.10.2026
+"""
+from contextlib import contextmanager
+import json
+import os.path
+import threading
+import time
+from spine_engine.utils.helpers import create_log_file_timestamp
+
+STAGES = ("connect", "read", "map", "convert", "import", "commit")
+
+
+class ThroughputReport:
+    """
+    Collects time spent in each import stage as well as row and item counts per source and table.
+
+    Stage times and counts added to a source or table are accumulated into run totals as well.
+    The report can be updated from multiple threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._elapsed = None
+        self._totals = _new_statistics()
+        self._sources = dict()
+        self._imported = dict()
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def row_count(self):
+        """Total number of rows read from sources."""
+        return self._totals["rows"]
+
+    @contextmanager
+    def timed(self, stage, source=None, table=None):
+        """
+        Measures the time spent in the context and adds it to given stage.
+
+        Args:
+            stage (str): stage name
+            source (str, optional): source path
+            table (str, optional): source table
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.perf_counter() - start, source, table)
+
+    def add_time(self, stage, seconds, source=None, table=None):
+        """
+        Adds time to a stage.
+
+        Args:
+            stage (str): stage name
+            seconds (float): time in seconds
+            source (str, optional): source path
+            table (str, optional): source table
+        """
+        with self._lock:
+            for statistics in self._statistics(source, table):
+                statistics["stages"][stage] += seconds
+
+    def add_rows(self, count, source, table):
+        """
+        Adds to the number of rows read.
+
+        Args:
+            count (int): number of rows
+            source (str): source path
+            table (str): source table
+        """
+        with self._lock:
+            for statistics in self._statistics(source, table):
+                statistics["rows"] += count
+
+    def add_items(self, count, source, table):
+        """
+        Adds to the number of mapped items.
+
+        Args:
+            count (int): number of items
+            source (str): source path
+            table (str): source table
+        """
+        with self._lock:
+            for statistics in self._statistics(source, table):
+                statistics["items"] += count
+
+    def add_imported(self, count, url):
+        """
+        Records the number of items imported into a database.
+
+        Args:
+            count (int): number of imported items
+            url (str): database URL
+        """
+        with self._lock:
+            self._imported[url] = self._imported.get(url, 0) + count
+
+    def merge(self, other):
+        """
+        Adds statistics from another report to this one.
+
+        Args:
+            other (ThroughputReport): report to merge
+        """
+        with self._lock:
+            _add_statistics(self._totals, other._totals)
+            for source, other_statistics in other._sources.items():
+                statistics = self._sources.setdefault(source, _new_source_statistics())
+                _add_statistics(statistics, other_statistics)
+                for table, other_table_statistics in other_statistics["tables"].items():
+                    _add_statistics(statistics["tables"].setdefault(table, _new_statistics()), other_table_statistics)
+            for url, count in other._imported.items():
+                self._imported[url] = self._imported.get(url, 0) + count
+
+    def finish(self):
+        """Stops the wall clock."""
+        self._elapsed = time.perf_counter() - self._start
+
+    def elapsed(self):
+        """
+        Returns the wall clock time since the report was created or finished.
+
+        Returns:
+            float: elapsed time in seconds
+        """
+        return self._elapsed if self._elapsed is not None else time.perf_counter() - self._start
+
+    def to_dict(self):
+        """
+        Serializes the report into a JSON compatible dictionary.
+
+        Returns:
+            dict: serialized report
+        """
+        elapsed = self.elapsed()
+        report = dict(elapsed=elapsed, rows_per_second=_rate(self._totals["rows"], elapsed))
+        report.update(self._totals)
+        report["imported"] = dict(self._imported)
+        report["sources"] = self._sources
+        return report
+
+    def save(self, logs_dir):
+        """
+        Writes the report into a time stamped JSON file in the logs directory.
+
+        Args:
+            logs_dir (str): path to logs directory
+
+        Returns:
+            str: path to the report file
+        """
+        timestamp = create_log_file_timestamp()
+        path = os.path.abspath(os.path.join(logs_dir, timestamp + "_throughput.json"))
+        with open(path, "w") as report_file:
+            json.dump(self.to_dict(), report_file, indent=4)
+        return path
+
+    def summary(self):
+        """
+        Returns a one-line summary of the report.
+
+        Returns:
+            str: summary
+        """
+        elapsed = self.elapsed()
+        rows = self._totals["rows"]
+        slowest = max(STAGES, key=lambda stage: self._totals["stages"][stage])
+        return (
+            f"Processed {rows} rows into {self._totals['items']} items in {elapsed:.2f} s "
+            f"({_rate(rows, elapsed):.0f} rows/s); most time spent in {slowest} stage."
+        )
+
+    def _statistics(self, source, table):
+        """Collects statistics dicts that should be updated for given source and table."""
+        statistics = [self._totals]
+        if source is None:
+            return statistics
+        source_statistics = self._sources.setdefault(source, _new_source_statistics())
+        statistics.append(source_statistics)
+        if table is not None:
+            statistics.append(source_statistics["tables"].setdefault(table, _new_statistics()))
+        return statistics
+
+
+class TimedRows:
+    """An iterator wrapper that counts rows and measures the time spent fetching them."""
+
+    def __init__(self, rows):
+        """
+        Args:
+            rows (Iterable): source rows
+        """
+        self._rows = iter(rows)
+        self.count = 0
+        self.seconds = 0.0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            row = next(self._rows)
+        finally:
+            self.seconds += time.perf_counter() - start
+        self.count += 1
+        return row
+
+
+def _new_statistics():
+    return {"stages": {stage: 0.0 for stage in STAGES}, "rows": 0, "items": 0}
+
+
+def _new_source_statistics():
+    statistics = _new_statistics()
+    statistics["tables"] = dict()
+    return statistics
+
+
+def _add_statistics(statistics, other):
+    for stage, seconds in other["stages"].items():
+        statistics["stages"][stage] += seconds
+    statistics["rows"] += other["rows"]
+    statistics["items"] += other["items"]
+
+
+def _rate(count, seconds):
+    return count / seconds if seconds > 0.0 else 0.0
@@ -0,0 +1,140 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Contains functions that infer source column types from a sample of rows.
+
+:date:    18.10.2026
+"""
+from collections import namedtuple
+import random
+from spinedb_api import ParameterValueFormatError
+from spinedb_api.spine_io.type_conversion import (
+    DateTimeConvertSpec,
+    DurationConvertSpec,
+    FloatConvertSpec,
+    StringConvertSpec,
+)
+
+DEFAULT_SAMPLE_SIZE = 1000
+"""Default number of rows to sample from a source table."""
+DEFAULT_MIN_CONFIDENCE = 0.95
+"""Default fraction of sampled values a type must convert to be proposed."""
+
+TypeProposal = namedtuple("TypeProposal", ["convert_spec", "confidence"])
+"""Proposed column type and the fraction of sampled values it converts."""
+
+_CANDIDATE_TYPES = (FloatConvertSpec, DurationConvertSpec, DateTimeConvertSpec)
+"""Types to try in order of preference; strings are the fallback."""
+_CONVERSION_ERRORS = (ValueError, TypeError, OverflowError, ParameterValueFormatError)
+
+
+def sample_rows(rows, sample_size=DEFAULT_SAMPLE_SIZE, seed=0):
+    """Picks rows uniformly across the whole row iterator.
+
+    Uses reservoir sampling, so the iterator is consumed once and only the sample is kept in memory.
+
+    Args:
+        rows (Iterable of list): source rows
+        sample_size (int): maximum number of rows to sample
+        seed (int): seed of the random number generator; fixed seed makes the sample reproducible
+
+    Returns:
+        list of list: sampled rows in their original order
+    """
+    if sample_size <= 0:
+        return []
+    generator = random.Random(seed)
+    reservoir = list()
+    for index, row in enumerate(rows):
+        if index < sample_size:
+            reservoir.append((index, row))
+            continue
+        slot = generator.randint(0, index)
+        if slot < sample_size:
+            reservoir[slot] = (index, row)
+    reservoir.sort(key=lambda item: item[0])
+    return [row for _, row in reservoir]
+
+
+def infer_column_types(sample, column_count, min_confidence=DEFAULT_MIN_CONFIDENCE):
+    """Proposes a type for each column of sampled rows.
+
+    The most specific type that converts at least ``min_confidence`` of a column's non-empty values wins;
+    columns that no candidate type fits well enough are proposed as strings.
+    Columns without any values in the sample get no proposal.
+
+    Args:
+        sample (list of list): sampled rows
+        column_count (int): number of columns
+        min_confidence (float): minimum fraction of values a type must convert
+
+    Returns:
+        dict: mapping from column index to :class:`TypeProposal`
+    """
+    proposals = dict()
+    for column in range(column_count):
+        values = [row[column] for row in sample if column < len(row) and not _is_empty(row[column])]
+        if not values:
+            continue
+        proposals[column] = _propose_type(values, min_confidence)
+    return proposals
+
+
+def _propose_type(values, min_confidence):
+    """Finds the first candidate type that converts enough values.
+
+    Args:
+        values (list): non-empty column values
+        min_confidence (float): minimum fraction of values a type must convert
+
+    Returns:
+        TypeProposal: proposal
+    """
+    allowed_failures = int(len(values) * (1.0 - min_confidence))
+    for spec_type in _CANDIDATE_TYPES:
+        convert_spec = spec_type()
+        converted = validate_values(values, convert_spec, allowed_failures)
+        if converted is not None:
+            return TypeProposal(convert_spec, converted / len(values))
+    return TypeProposal(StringConvertSpec(), 1.0)
+
+
+def validate_values(values, convert_spec, allowed_failures=0):
+    """Converts values in bulk and counts successful conversions.
+
+    Validation stops as soon as the number of failures exceeds ``allowed_failures``.
+
+    Args:
+        values (Iterable): values to convert
+        convert_spec (ConvertSpec): conversion specification
+        allowed_failures (int): maximum number of values that may fail to convert
+
+    Returns:
+        int: number of converted values or None if too many values failed
+    """
+    converted = 0
+    failures = 0
+    for value in values:
+        try:
+            convert_spec(value)
+        except _CONVERSION_ERRORS:
+            failures += 1
+            if failures > allowed_failures:
+                return None
+            continue
+        converted += 1
+    return converted
+
+
+def _is_empty(value):
+    """Returns True if value is missing from source."""
+    return value is None or (isinstance(value, str) and not value.strip())
@@ -22,11 +22,13 @@ from spinedb_api import ObjectClassMapping
 from spinedb_api.spine_io.type_conversion import value_to_convert_spec
 from .custom_menus import SourceListMenu, SourceDataTableMenu
 from .options_widget import OptionsWidget
-from ..commands import PasteMappings, PasteOptions, RestoreMappingsFromDict
+from ..commands import PasteMappings, PasteOptions, RestoreMappingsFromDict, SetInferredColumnTypes
+from ..import_manifest import mapping_hash
 from ..mvcmodels.mapping_list_model import MappingListModel
 from ..mvcmodels.mapping_specification_model import MappingSpecificationModel
 from ..mvcmodels.source_data_table_model import SourceDataTableModel
 from ..mvcmodels.source_table_list_model import SourceTableItem, SourceTableListModel
+from ..type_inference import DEFAULT_SAMPLE_SIZE
 
 
 class ImportEditor(QObject):
@@ -34,8 +36,14 @@ class ImportEditor(QObject):
     Provides an interface for defining one or more Mappings associated to a data Source (CSV file, Excel file, etc).
     """
 
+    MAPPED_DATA_PREVIEW_ROWS = 100
+    """Default number of rows per table to map in preview mode."""
+    TYPE_INFERENCE_SAMPLE_SIZE = DEFAULT_SAMPLE_SIZE
+    """Default number of rows to sample across a table when inferring column types."""
+
     table_checked = Signal()
     mapped_data_ready = Signal(dict, list)
+    mapped_data_preview_ready = Signal(dict, list)
     source_table_selected = Signal(str, object)
     preview_data_updated = Signal(int)
 
@@ -56,6 +64,11 @@ class ImportEditor(QObject):
         self._table_updating = False
         self._data_updating = False
         self._copied_mappings = parent._copied_mappings
+        self.mapped_data_preview_rows = self.MAPPED_DATA_PREVIEW_ROWS
+        self.type_inference_sample_size = self.TYPE_INFERENCE_SAMPLE_SIZE
+        self._mapped_data_preview = MappedDataPreview()
+        self._full_mapping_pending = False
+        self._preview_after_full_mapping = False
         self._copied_options = {}
         self._undo_stack = parent._undo_stack
         self._preview_table_model = SourceDataTableModel()
@@ -76,22 +89,26 @@ class ImportEditor(QObject):
         self._ui.source_list.customContextMenuRequested.connect(self.show_source_list_context_menu)
         self._ui.source_list.selectionModel().currentChanged.connect(self._change_selected_table)
         self._ui.source_data_table.customContextMenuRequested.connect(self._ui_source_data_table_menu.request_menu)
+        self._ui.source_data_table.type_inference_requested.connect(self.infer_column_types)
 
         # signals for connector
         self._connector.connection_ready.connect(self.request_new_tables_from_connector)
         self._connector.data_ready.connect(self.update_preview_data)
         self._connector.tables_ready.connect(self.update_tables)
-        self._connector.mapped_data_ready.connect(self.mapped_data_ready.emit)
+        self._connector.mapped_table_data_ready.connect(self._handle_mapped_table_data)
         self._connector.default_mapping_ready.connect(self._set_default_mapping)
+        self._connector.column_types_inferred.connect(self._apply_inferred_column_types)
         # when data is ready set loading status to False.
         self._connector.connection_ready.connect(lambda: self.set_loading_status(False))
         self._connector.data_ready.connect(lambda: self.set_loading_status(False))
         self._connector.tables_ready.connect(lambda: self.set_loading_status(False))
-        self._connector.mapped_data_ready.connect(lambda: self.set_loading_status(False))
+        self._connector.mapped_table_data_ready.connect(lambda: self.set_loading_status(False))
+        self._connector.column_types_inferred.connect(lambda: self.set_loading_status(False))
         # when data is getting fetched set loading status to True
         self._connector.fetching_data.connect(lambda: self.set_loading_status(True))
         # set loading status to False if error.
         self._connector.error.connect(lambda: self.set_loading_status(False))
+        self._connector.error.connect(self._abandon_mapped_data_requests)
 
         # current mapping changed
         self._preview_table_model.mapping_changed.connect(self._update_display_row_types)
@@ -173,9 +190,110 @@ class ImportEditor(QObject):
         selection_model.setCurrentIndex(index, QItemSelectionModel.ClearAndSelect)
 
     def request_mapped_data(self):
+        """Requests mapped data of all rows of checked tables.
+
+        The data is emitted by :attr:`mapped_data_ready`.
+        """
+        self._mapped_data_preview.cancel()
+        self._full_mapping_pending = True
         tables_mappings = {t: self._table_mappings[t].get_mappings() for t in self.checked_tables}
         self._connector.request_mapped_data(tables_mappings, max_rows=-1)
 
+    @Slot()
+    def request_mapped_data_preview(self):
+        """Requests mapped data of the first ``mapped_data_preview_rows`` rows of checked tables.
+
+        Tables whose mappings, options and types have not changed since last request are not re-mapped.
+        The data is emitted by :attr:`mapped_data_preview_ready`.
+        """
+        if self._full_mapping_pending:
+            self._preview_after_full_mapping = True
+            return
+        tables = self.checked_tables
+        fingerprints = {table: self._mapped_preview_fingerprint(table) for table in tables}
+        outdated_tables = self._mapped_data_preview.outdated_tables(fingerprints)
+        if not outdated_tables:
+            self._emit_mapped_data_preview()
+            return
+        self._mapped_data_preview.start({table: fingerprints[table] for table in outdated_tables})
+        tables_mappings = {t: self._table_mappings[t].get_mappings() for t in outdated_tables}
+        self._connector.request_mapped_data(tables_mappings, max_rows=self.mapped_data_preview_rows)
+
+    def _mapped_preview_fingerprint(self, table):
+        """Returns a hash of everything that affects table's mapped preview data."""
+        return mapped_data_fingerprint(
+            self._connector.source,
+            [m.to_dict() for m in self._table_mappings[table].mapping_specifications],
+            self._connector.table_options.get(table, {}),
+            self._connector.table_types.get(table, {}),
+            self._connector.table_row_types.get(table, {}),
+            self.mapped_data_preview_rows,
+        )
+
+    @Slot(dict, list)
+    def _handle_mapped_table_data(self, table_data, errors):
+        """Emits mapped data either as preview or as full data depending on what was requested."""
+        if self._mapped_data_preview.is_pending:
+            self._mapped_data_preview.store(table_data, errors)
+            self._emit_mapped_data_preview()
+            return
+        self._full_mapping_pending = False
+        data = dict()
+        for mapped_data in table_data.values():
+            for key, value in mapped_data.items():
+                data.setdefault(key, []).extend(value)
+        self.mapped_data_ready.emit(data, errors)
+        if self._preview_after_full_mapping:
+            self._preview_after_full_mapping = False
+            self.request_mapped_data_preview()
+
+    @Slot()
+    def _abandon_mapped_data_requests(self):
+        """Forgets pending mapped data requests after connector has failed."""
+        self._mapped_data_preview.cancel()
+        self._full_mapping_pending = False
+        self._preview_after_full_mapping = False
+
+    def _emit_mapped_data_preview(self):
+        """Emits cached mapped preview data of checked tables."""
+        data, errors = self._mapped_data_preview.collect(self.checked_tables)
+        self.mapped_data_preview_ready.emit(data, errors)
+
+    @Slot()
+    def infer_column_types(self):
+        """Requests column type proposals for current table from a sample spread across the whole table."""
+        table = self._connector.current_table
+        if table is None:
+            return
+        self._connector.request_type_inference(table, self.type_inference_sample_size)
+
+    @Slot(str, dict)
+    def _apply_inferred_column_types(self, table, proposals):
+        """Sets proposed types to preview table's columns.
+
+        Args:
+            table (str): source table name
+            proposals (dict): mapping from column index to TypeProposal
+        """
+        if table != self._connector.current_table:
+            return
+        new_types = dict()
+        previous_types = dict()
+        for column, proposal in proposals.items():
+            if column >= self._preview_table_model.columnCount():
+                continue
+            previous_type = self._preview_table_model.get_type(column)
+            if previous_type is None:
+                previous_type = value_to_convert_spec("string")
+            if previous_type.to_json_value() == proposal.convert_spec.to_json_value():
+                continue
+            new_types[column] = proposal.convert_spec
+            previous_types[column] = previous_type
+        if not new_types:
+            return
+        header = self._ui.source_data_table.horizontalHeader()
+        self._undo_stack.push(SetInferredColumnTypes(table, header, new_types, previous_types))
+
     @Slot(dict)
     def update_tables(self, tables):
         """
@@ -439,6 +557,105 @@ class ImportEditor(QObject):
         self.select_table(table)
 
 
+class MappedDataPreview:
+    """Keeps mapped preview data of source tables with fingerprints of the settings they were mapped with."""
+
+    def __init__(self):
+        self._previews = dict()
+        self._pending_fingerprints = None
+
+    @property
+    def is_pending(self):
+        """True if a preview has been requested but has not arrived yet."""
+        return self._pending_fingerprints is not None
+
+    def outdated_tables(self, fingerprints):
+        """Lists tables that have no preview or whose preview was mapped with different settings.
+
+        Args:
+            fingerprints (dict): mapping from table name to fingerprint of table's current settings
+
+        Returns:
+            list of str: table names
+        """
+        return [
+            table
+            for table, fingerprint in fingerprints.items()
+            if table not in self._previews or self._previews[table][0] != fingerprint
+        ]
+
+    def start(self, fingerprints):
+        """Marks tables as being re-mapped.
+
+        Args:
+            fingerprints (dict): mapping from table name to fingerprint of table's current settings
+        """
+        self._pending_fingerprints = dict(fingerprints)
+
+    def cancel(self):
+        """Forgets pending request."""
+        self._pending_fingerprints = None
+
+    def store(self, table_data, errors):
+        """Stores mapped data of pending request.
+
+        Args:
+            table_data (dict): mapping from table name to mapped data
+            errors (list): mapping errors as (table name, error) tuples
+        """
+        for table, mapped_data in table_data.items():
+            table_errors = [error for error in errors if isinstance(error, tuple) and error[0] == table]
+            self._previews[table] = (self._pending_fingerprints.get(table), mapped_data, table_errors)
+        self._pending_fingerprints = None
+
+    def collect(self, tables):
+        """Merges stored mapped data and errors of given tables.
+
+        Args:
+            tables (Iterable of str): table names
+
+        Returns:
+            tuple: mapped data and list of errors
+        """
+        data = dict()
+        errors = list()
+        for table in tables:
+            preview = self._previews.get(table)
+            if preview is None:
+                continue
+            _, mapped_data, table_errors = preview
+            for key, value in mapped_data.items():
+                data.setdefault(key, []).extend(value)
+            errors += table_errors
+        return data, errors
+
+
+def mapped_data_fingerprint(source, mappings, options, types, row_types, max_rows):
+    """Calculates a hash of everything that affects a table's mapped data.
+
+    Args:
+        source (str): source path or URL
+        mappings (list of dict): serialized mapping specifications
+        options (dict): table options
+        types (dict): mapping from column index to convert spec
+        row_types (dict): mapping from row index to convert spec
+        max_rows (int): number of rows to map
+
+    Returns:
+        str: hex digest
+    """
+    return mapping_hash(
+        {
+            "source": source,
+            "mappings": mappings,
+            "options": options,
+            "types": {column: spec.to_json_value() for column, spec in types.items()},
+            "row_types": {row: spec.to_json_value() for row, spec in row_types.items()},
+            "max_rows": max_rows,
+        }
+    )
+
+
 def _sanitize_data(data, header):
     """Fills empty data cells with None."""
     expected_columns = len(header) if header else max(len(x) for x in data)
@@ -23,6 +23,7 @@ from copy import deepcopy
 from PySide2.QtCore import Qt, Signal, Slot
 from PySide2.QtGui import QKeySequence
 from PySide2.QtWidgets import (
+    QAction,
     QMainWindow,
     QErrorMessage,
     QFileDialog,
@@ -61,6 +62,9 @@ _CONNECTOR_NAME_TO_CLASS = {
 }
 
 
+_MAX_VALIDATION_ERRORS_SHOWN = 20
+
+
 class ImportEditorWindow(QMainWindow):
     """A QMainWindow to let users define Mappings for an Importer item."""
 
@@ -90,6 +94,12 @@ class ImportEditorWindow(QMainWindow):
         self._ui = Ui_MainWindow()
         self._ui.setupUi(self)
         self.takeCentralWidget()
+        self._preview_action = QAction("Check first rows", self)
+        self._preview_action.setToolTip("Map the first rows of checked tables and report errors")
+        self._preview_action.setEnabled(False)
+        self._validate_action = QAction("Validate all rows", self)
+        self._validate_action.setToolTip("Map all rows of checked tables and report errors")
+        self._validate_action.setEnabled(False)
         self._spec_toolbar = SpecNameDescriptionToolbar(self, self._specification, self._undo_stack)
         self.addToolBar(Qt.TopToolBarArea, self._spec_toolbar)
         self._populate_main_menu()
@@ -120,6 +130,8 @@ class ImportEditorWindow(QMainWindow):
         self._ui.export_mappings_action.triggered.connect(self.export_mapping_to_file)
         self._ui.actionSwitch_connector.triggered.connect(self._switch_connector)
         self._ui.actionSaveAndClose.triggered.connect(self.save_and_close)
+        self._preview_action.triggered.connect(self._check_first_rows)
+        self._validate_action.triggered.connect(self._validate_all_rows)
         self.connection_failed.connect(self.show_error)
         self._undo_stack.cleanChanged.connect(self._update_window_modified)
         if filepath:
@@ -129,6 +141,8 @@ class ImportEditorWindow(QMainWindow):
         menu = self._spec_toolbar.menu
         menu.addActions([self._ui.actionLoad_file, self._ui.actionSwitch_connector])
         menu.addSeparator()
+        menu.addActions([self._preview_action, self._validate_action])
+        menu.addSeparator()
         menu.addActions([self._ui.import_mappings_action, self._ui.export_mappings_action])
         menu.addSeparator()
         undo_action = self._undo_stack.createUndoAction(self)
@@ -198,6 +212,8 @@ class ImportEditorWindow(QMainWindow):
                     self.close()
                 return
         self._ui.actionSwitch_connector.setEnabled(True)
+        self._preview_action.setEnabled(False)
+        self._validate_action.setEnabled(False)
         connector_settings = {"gams_directory": _gams_system_directory(self._toolbox)}
         self._connection_manager = ConnectionManager(connector, connector_settings)
         self._connection_manager.source = filepath
@@ -214,6 +230,8 @@ class ImportEditorWindow(QMainWindow):
         self._editor.source_table_selected.connect(self._ui.source_data_table.horizontalHeader().set_source_table)
         self._editor.source_table_selected.connect(self._ui.source_data_table.verticalHeader().set_source_table)
         self._editor.preview_data_updated.connect(self._import_mapping_options.set_num_available_columns)
+        self._editor.mapped_data_preview_ready.connect(self._show_mapped_data_preview_result)
+        self._editor.mapped_data_ready.connect(self._show_validation_result)
         self._connection_manager.connection_ready.connect(self._handle_connection_ready)
         self._connection_manager.init_connection()
 
@@ -221,6 +239,8 @@ class ImportEditorWindow(QMainWindow):
     def _handle_connection_ready(self):
         self._ui.export_mappings_action.setEnabled(True)
         self._ui.import_mappings_action.setEnabled(True)
+        self._preview_action.setEnabled(True)
+        self._validate_action.setEnabled(True)
         self._ui.actionLoad_file.setText("Switch file...")
 
     def _get_connector(self, filepath):
@@ -267,6 +287,49 @@ class ImportEditorWindow(QMainWindow):
         update_existing = self._specification.name == self._original_spec_name
         return self._toolbox.add_specification(self._specification, update_existing, self)
 
+    @Slot(bool)
+    def _check_first_rows(self, _=False):
+        """Maps the first rows of checked tables re-mapping only tables that have changed since last check."""
+        if self._editor is None:
+            return
+        self._ui.statusbar.showMessage(f"Mapping first {self._editor.mapped_data_preview_rows} rows...")
+        self._editor.request_mapped_data_preview()
+
+    @Slot(bool)
+    def _validate_all_rows(self, _=False):
+        """Maps all rows of checked tables to find errors the preview may have missed."""
+        if self._editor is None:
+            return
+        self._ui.statusbar.showMessage("Mapping all rows...")
+        self._editor.request_mapped_data()
+
+    @Slot(dict, list)
+    def _show_mapped_data_preview_result(self, data, errors):
+        """Shows a summary of mapping the first rows and lists the errors if there were any."""
+        self._show_mapping_result(f"First {self._editor.mapped_data_preview_rows} rows", data, errors)
+
+    @Slot(dict, list)
+    def _show_validation_result(self, data, errors):
+        """Shows a summary of mapping all rows and lists the errors if there were any."""
+        self._show_mapping_result("All rows", data, errors)
+
+    def _show_mapping_result(self, label, data, errors):
+        """Shows a summary of mapped data in the status bar and lists the errors if there were any.
+
+        Args:
+            label (str): description of what was mapped
+            data (dict): mapped data
+            errors (list): mapping errors
+        """
+        item_count = sum(len(items) for items in data.values())
+        self._ui.statusbar.showMessage(f"{label} mapped: {item_count} items, {len(errors)} errors.")
+        if errors:
+            messages = [f"{error[0]}: {error[1]}" if isinstance(error, tuple) else str(error) for error in errors]
+            shown = messages[:_MAX_VALIDATION_ERRORS_SHOWN]
+            if len(messages) > len(shown):
+                shown.append(f"... and {len(messages) - len(shown)} more.")
+            self.show_error(f"Mapping {label.lower()} failed:<br>" + "<br>".join(shown))
+
     @Slot(str)
     def show_error(self, message):
         self._ui_error.showMessage(message)
@@ -112,6 +112,9 @@ class IntegerSequenceDateTimeConvertSpecDialog(QDialog):
 class TableViewWithButtonHeader(QTableView):
     """Customized table with data type buttons on horizontal and vertical headers"""
 
+    type_inference_requested = Signal()
+    """Emitted when user wants column types to be inferred from source data."""
+
     def __init__(self, parent=None):
         """
         Args:
@@ -136,6 +139,22 @@ class TableViewWithButtonHeader(QTableView):
             self._horizontal_header.fix_widget_positions()
         if dy != 0:
             self._vertical_header.fix_widget_positions()
+            self._validate_visible_rows()
+
+    def resizeEvent(self, event):
+        """Validates rows that became visible."""
+        super().resizeEvent(event)
+        self._validate_visible_rows()
+
+    def _validate_visible_rows(self):
+        """Asks the model to validate at least the rows that are currently visible."""
+        model = self.model()
+        if not isinstance(model, SourceDataTableModel):
+            return
+        last_visible_row = self.rowAt(self.viewport().height() - 1)
+        if last_visible_row < 0:
+            last_visible_row = model.rowCount() - 1
+        model.validate_rows(last_visible_row)
 
     @Slot(object)
     def update_buttons(self, orientation):
@@ -157,6 +176,7 @@ class TableViewWithButtonHeader(QTableView):
         type_menu = _create_allowed_types_menu(parent, self._set_all_column_data_types)
         type_menu.setTitle("Set all data types to...")
         menu.addMenu(type_menu)
+        menu.addAction("Infer data types from source", self.type_inference_requested.emit)
         return menu
 
     def _create_vertical_header_menu(self):
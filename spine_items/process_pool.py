@@ -0,0 +1,451 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Contains a pool of warm worker processes that execute items' do_work kernels.
+
+:date:    18.10.2026
+"""
+import atexit
+import importlib
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+import traceback
+
+_PRELOADED_MODULES = ("sqlalchemy", "spinedb_api", "spinedb_api.spine_io.importers", "spinedb_api.spine_io.exporters")
+_RESULT = "result"
+_LOG = "log"
+_CANCEL = "cancel"
+_cancel_lock = threading.Lock()
+_cancelled_tasks = set()
+_current_task = None
+
+
+class PooledProcess:
+    """Runs a do_work kernel in a warm worker process.
+
+    This is a drop-in replacement for spine_engine's ReturningProcess.
+    The kernel gets a logger as its last argument; the messages are relayed to the real logger in this process,
+    so the logger does not need to be picklable.
+    """
+
+    def __init__(self, target, args, logger):
+        """
+        Args:
+            target (Callable): module level function to execute
+            args (tuple): target's arguments excluding the logger
+            logger (LoggerInterface): a logger
+        """
+        self._target = target
+        self._args = args
+        self._logger = logger
+        self._worker = None
+        self._terminated = False
+        self._lock = threading.Lock()
+
+    def run_until_complete(self):
+        """Executes the target in a worker process and waits for it to finish.
+
+        Returns:
+            tuple: Return value of the target where the first element is a status flag
+        """
+        worker = worker_pool().acquire()
+        with self._lock:
+            if self._terminated:
+                worker_pool().release(worker)
+                return (False,)
+            self._worker = worker
+        try:
+            result = worker.run(self._target, self._args, self._logger)
+        finally:
+            with self._lock:
+                self._worker = None
+            if self._terminated:
+                worker_pool().discard(worker)
+            else:
+                worker_pool().release(worker)
+        if self._terminated:
+            return (False,)
+        if result is None:
+            self._logger.msg_error.emit("Worker process exited unexpectedly.")
+            return (False,)
+        return result
+
+    def terminate(self):
+        """Kills the worker process if the target is still running."""
+        with self._lock:
+            self._terminated = True
+            if self._worker is not None:
+                self._worker.kill()
+
+    def cancel(self, grace_period):
+        """Asks the target to stop cooperatively.
+
+        The target should poll :func:`cancel_requested` and return early when it is set.
+        If the target is still running after the grace period, the worker process is killed.
+
+        Args:
+            grace_period (float): seconds to wait for the target to stop before killing the worker
+        """
+        with self._lock:
+            worker = self._worker
+            if worker is not None:
+                # Sending while holding the lock makes sure the worker has not been returned to the pool
+                # and given another task yet.
+                worker.request_cancel()
+        if worker is None:
+            self.terminate()
+            return
+        timer = threading.Timer(grace_period, self._terminate_if_running, args=(worker,))
+        timer.daemon = True
+        timer.start()
+
+    def _terminate_if_running(self, worker):
+        """Kills given worker if it is still executing the target."""
+        with self._lock:
+            if self._worker is not worker:
+                return
+            self._terminated = True
+            worker.kill()
+
+
+class WorkerPool:
+    """A size-limited pool of idle worker processes.
+
+    Workers that have been idle longer than given timeout are shut down.
+    If all workers are busy, a new one is started unless the pool is at its maximum size
+    in which case :meth:`acquire` blocks until a worker is released.
+    Surplus workers are shut down once they finish.
+    """
+
+    def __init__(self, max_idle_workers, idle_timeout, max_workers=None, prestarted_workers=0):
+        """
+        Args:
+            max_idle_workers (int): maximum number of workers to keep alive between executions
+            idle_timeout (float): seconds after which an idle worker is shut down
+            max_workers (int, optional): maximum number of busy workers; unlimited if None
+            prestarted_workers (int): number of workers to start right away; capped by ``max_idle_workers``
+        """
+        self._max_idle_workers = max_idle_workers
+        self._idle_timeout = idle_timeout
+        self._idle_workers = list()
+        self._lock = threading.Lock()
+        self._eviction_timer = None
+        self._busy_slots = threading.BoundedSemaphore(max_workers) if max_workers is not None else None
+        for _ in range(min(prestarted_workers, max_idle_workers)):
+            self._idle_workers.append(_Worker())
+        if self._idle_workers:
+            self._schedule_eviction()
+
+    def acquire(self):
+        """Returns an idle worker or starts a new one.
+
+        Blocks while the maximum number of workers is busy.
+        Every acquired worker must be given back by :meth:`release` or :meth:`discard`.
+
+        Returns:
+            _Worker: a worker
+        """
+        if self._busy_slots is not None:
+            self._busy_slots.acquire()
+        try:
+            with self._lock:
+                while self._idle_workers:
+                    worker = self._idle_workers.pop()
+                    if worker.is_alive():
+                        return worker
+                    worker.kill()
+            return _Worker()
+        except BaseException:
+            self._free_busy_slot()
+            raise
+
+    def release(self, worker):
+        """Returns a worker to the pool.
+
+        Args:
+            worker (_Worker): worker that has finished its task
+        """
+        try:
+            if not worker.is_alive():
+                return
+            with self._lock:
+                if len(self._idle_workers) < self._max_idle_workers:
+                    worker.last_used = time.monotonic()
+                    self._idle_workers.append(worker)
+                    worker = None
+                    self._schedule_eviction()
+            if worker is not None:
+                worker.shut_down()
+        finally:
+            self._free_busy_slot()
+
+    def discard(self, worker):
+        """Kills a worker instead of returning it to the pool.
+
+        Args:
+            worker (_Worker): worker acquired from the pool
+        """
+        try:
+            worker.kill()
+        finally:
+            self._free_busy_slot()
+
+    def shut_down(self):
+        """Shuts down all idle workers."""
+        with self._lock:
+            workers = self._idle_workers
+            self._idle_workers = list()
+            if self._eviction_timer is not None:
+                self._eviction_timer.cancel()
+                self._eviction_timer = None
+        for worker in workers:
+            worker.shut_down()
+
+    def _free_busy_slot(self):
+        """Lets another caller of :meth:`acquire` proceed."""
+        if self._busy_slots is not None:
+            self._busy_slots.release()
+
+    def _schedule_eviction(self):
+        """Starts the eviction timer unless it is already running."""
+        if self._eviction_timer is not None:
+            return
+        self._eviction_timer = threading.Timer(self._idle_timeout, self._evict_idle_workers)
+        self._eviction_timer.daemon = True
+        self._eviction_timer.start()
+
+    def _evict_idle_workers(self):
+        """Shuts down workers that have been idle too long and reschedules eviction for the rest."""
+        now = time.monotonic()
+        with self._lock:
+            self._eviction_timer = None
+            expired = [worker for worker in self._idle_workers if now - worker.last_used >= self._idle_timeout]
+            self._idle_workers = [worker for worker in self._idle_workers if worker not in expired]
+            if self._idle_workers:
+                self._schedule_eviction()
+        for worker in expired:
+            worker.shut_down()
+
+
+class _Worker:
+    """Parent side handle of a worker process."""
+
+    def __init__(self):
+        self._connection, child_connection = mp.Pipe()
+        self._process = mp.Process(target=_serve, args=(child_connection,))
+        self._process.start()
+        child_connection.close()
+        self._task_id = 0
+        self.last_used = time.monotonic()
+
+    def is_alive(self):
+        return self._process.is_alive()
+
+    def run(self, target, args, logger):
+        """Executes target in the worker process relaying log messages to logger.
+
+        Args:
+            target (Callable): function to execute
+            args (tuple): target's arguments excluding the logger
+            logger (LoggerInterface): a logger
+
+        Returns:
+            tuple: target's return value or None if the worker died
+        """
+        self._task_id += 1
+        try:
+            self._connection.send((self._task_id, target, args))
+            while True:
+                message_type, payload = self._connection.recv()
+                if message_type == _RESULT:
+                    return payload
+                signal_name, signal_args = payload
+                getattr(logger, signal_name).emit(*signal_args)
+        except (EOFError, OSError):
+            return None
+
+    def request_cancel(self):
+        """Asks the worker process to stop executing its current target."""
+        try:
+            self._connection.send((_CANCEL, self._task_id))
+        except (BrokenPipeError, OSError):
+            pass
+
+    def shut_down(self):
+        """Asks the worker process to exit."""
+        try:
+            self._connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self._process.join(1.0)
+        if self._process.is_alive():
+            self._process.terminate()
+        self._connection.close()
+
+    def kill(self):
+        """Terminates the worker process immediately."""
+        if self._process.is_alive():
+            self._process.terminate()
+        self._connection.close()
+
+
+class _RelayedSignal:
+    """Stands in for logger's signals in the worker process."""
+
+    def __init__(self, connection, send_lock, name):
+        self._connection = connection
+        self._send_lock = send_lock
+        self._name = name
+
+    def emit(self, *args):
+        with self._send_lock:
+            self._connection.send((_LOG, (self._name, args)))
+
+
+class _RelayLogger:
+    """A logger that sends messages back to the parent process.
+
+    Targets may log from several threads; sends to the connection are serialized by :attr:`send_lock`
+    so messages do not interleave in the pipe.
+    """
+
+    def __init__(self, connection):
+        self._connection = connection
+        self.send_lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return _RelayedSignal(self._connection, self.send_lock, name)
+
+
+def cancel_requested():
+    """Checks if the target running in this worker process has been asked to stop.
+
+    Always False outside worker processes.
+
+    Returns:
+        bool: True if cancellation has been requested, False otherwise
+    """
+    with _cancel_lock:
+        return _current_task is not None and _current_task in _cancelled_tasks
+
+
+def _serve(connection):
+    """Worker process' main loop.
+
+    Args:
+        connection (Connection): connection to parent process
+    """
+    for module_name in _PRELOADED_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+    tasks = queue.Queue()
+    listener = threading.Thread(target=_listen, args=(connection, tasks), daemon=True)
+    listener.start()
+    logger = _RelayLogger(connection)
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        task_id, target, args = task
+        _start_task(task_id)
+        try:
+            result = target(*args, logger)
+        except Exception:  # pylint: disable=broad-except
+            logger.msg_error.emit(f"Execution failed:<br>{traceback.format_exc()}")
+            result = (False,)
+        _finish_task(task_id)
+        try:
+            with logger.send_lock:
+                connection.send((_RESULT, result))
+        except (BrokenPipeError, OSError):
+            break
+    connection.close()
+
+
+def _listen(connection, tasks):
+    """Receives tasks and cancellation requests from parent process.
+
+    Args:
+        connection (Connection): connection to parent process
+        tasks (queue.Queue): queue for tasks
+    """
+    while True:
+        try:
+            message = connection.recv()
+        except (EOFError, OSError):
+            tasks.put(None)
+            return
+        if message is not None and message[0] == _CANCEL:
+            with _cancel_lock:
+                _cancelled_tasks.add(message[1])
+            continue
+        tasks.put(message)
+        if message is None:
+            return
+
+
+def _start_task(task_id):
+    """Makes given task the current one and forgets cancellations of earlier tasks.
+
+    Cancellations of the task itself are kept even if they arrived before the task started.
+
+    Args:
+        task_id (int): task identifier
+    """
+    global _current_task
+    with _cancel_lock:
+        _current_task = task_id
+        stale = {cancelled for cancelled in _cancelled_tasks if cancelled < task_id}
+        _cancelled_tasks.difference_update(stale)
+
+
+def _finish_task(task_id):
+    """Clears current task.
+
+    Args:
+        task_id (int): task identifier
+    """
+    global _current_task
+    with _cancel_lock:
+        _current_task = None
+        _cancelled_tasks.discard(task_id)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def worker_pool():
+    """Returns the shared worker pool creating it if necessary.
+
+    Returns:
+        WorkerPool: worker pool
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            worker_count = os.cpu_count() or 1
+            _pool = WorkerPool(
+                max_idle_workers=worker_count,
+                idle_timeout=300.0,
+                max_workers=worker_count,
+                prestarted_workers=worker_count,
+            )
+            atexit.register(_pool.shut_down)
+        return _pool
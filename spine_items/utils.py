@@ -17,14 +17,21 @@ Contains utilities shared between project items.
 """
 
 from datetime import datetime
+import multiprocessing as mp
 import os.path
 import re
 from time import time
 from contextlib import contextmanager
+from sqlalchemy import create_engine, MetaData, select, Table
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.exc import SQLAlchemyError
 from spinedb_api.spine_db_server import start_spine_db_server, shutdown_spine_db_server
 from spine_engine.project_item.project_item_resource import extract_packs
 
 
+_SQLITE_BULK_LOAD_PRAGMAS = {"journal_mode": "MEMORY", "synchronous": "OFF", "temp_store": "MEMORY"}
+
+
 def labelled_resource_filepaths(resources):
     """Returns a dict mapping resource labels to file paths available in given resources.
     The label acts as an identifier for a 'transient_file'.
@@ -255,3 +262,88 @@ def subdirectory_for_fork(output_file_name, data_dir, output_time_stamps, fork):
     else:
         path = os.path.join(data_dir, time_stamp, output_file_name)
     return path
+
+
+def is_sqlite_url(url):
+    """
+    Checks if given URL points to a SQLite database.
+
+    Args:
+        url (str or URL): database URL
+
+    Returns:
+        bool: True if URL is a SQLite URL, False otherwise
+    """
+    return make_url(str(url)).get_backend_name() == "sqlite"
+
+
+def latest_commit(url):
+    """
+    Reads the id and date of the latest commit in a database.
+
+    Args:
+        url (str): database URL without filter configurations
+
+    Returns:
+        list: commit id and date or None if there are no commits or database could not be read
+    """
+    try:
+        if is_sqlite_url(url):
+            database = make_url(url).database
+            if not database or not os.path.isfile(database):
+                return None
+        engine = create_engine(url)
+    except (SQLAlchemyError, ValueError):
+        return None
+    try:
+        commit = Table("commit", MetaData(), autoload=True, autoload_with=engine)
+        statement = select([commit.c.id, commit.c.date]).order_by(commit.c.id.desc()).limit(1)
+        with engine.connect() as connection:
+            row = connection.execute(statement).first()
+    except SQLAlchemyError:
+        return None
+    finally:
+        engine.dispose()
+    if row is None:
+        return None
+    return [row.id, str(row.date)]
+
+
+def relax_sqlite_durability(connection):
+    """
+    Switches off journaling to disk and syncing on a SQLite connection to speed up bulk loading.
+
+    The pragmas apply to given connection only and end when it is closed;
+    other connections to the database keep their own settings, so there is nothing to restore afterwards.
+    Rolling back still works as the rollback journal is kept in memory,
+    but the database may get corrupted if the process or the OS crashes during a commit.
+
+    Args:
+        connection (Connection): SQLAlchemy connection to a SQLite database
+    """
+    for pragma, value in _SQLITE_BULK_LOAD_PRAGMAS.items():
+        connection.execute(f"PRAGMA {pragma} = {value}")
+
+
+@contextmanager
+def process_pool_map(function, items, process_count):
+    """
+    Applies function to items either one by one or in a pool of worker processes.
+
+    Results are yielded in the order of ``items`` in both cases.
+    Worker processes are terminated when the context exits, even if some items have not been processed yet.
+
+    Args:
+        function (Callable): picklable function that takes an item
+        items (list): items to process
+        process_count (int): maximum number of worker processes
+
+    Yields:
+        Iterator: results of ``function``
+    """
+    process_count = min(process_count, len(items))
+    if process_count < 2:
+        yield map(function, items)
+        return
+    with mp.Pool(process_count) as pool:
+        yield pool.imap(function, items)
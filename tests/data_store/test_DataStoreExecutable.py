@@ -19,8 +19,9 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 import unittest
 from unittest import mock
-from spinedb_api import create_new_spine_database, DatabaseMapping, DiffDatabaseMapping, import_functions
+from spinedb_api import create_new_spine_database, DatabaseMapping, DiffDatabaseMapping, from_database, import_functions
 from spine_engine import ExecutionDirection
+from spine_items.commit_policy import CommitPolicy, EVERY_N_ITEMS
 from spine_items.data_store.executable_item import ExecutableItem
 from spine_engine.project_item.project_item_resource import database_resource
 
@@ -123,6 +124,39 @@ class TestDataStoreExecutable(unittest.TestCase):
         self.assertEqual(object_list_b[0].name, "b_1")
         output_db_map.connection.close()
 
+    def test_execute_merge_parameter_values_committing_every_two_items(self):
+        db1_url = "sqlite:///" + str(Path(self._temp_dir.name, "db1.sqlite"))
+        create_new_spine_database(db1_url)
+        db1_map = DiffDatabaseMapping(db1_url)
+        import_functions.import_alternatives(db1_map, ["alt"])
+        import_functions.import_scenarios(db1_map, ["scen"])
+        import_functions.import_scenario_alternatives(db1_map, [("scen", "alt")])
+        import_functions.import_object_classes(db1_map, ["a"])
+        import_functions.import_objects(db1_map, [("a", "a_1")])
+        import_functions.import_object_parameters(db1_map, [("a", "p")])
+        import_functions.import_object_parameter_values(db1_map, [("a", "a_1", "p", 2.3, "alt")])
+        db1_map.commit_session("Add parameter values in an alternative for unit tests.")
+        db1_map.connection.close()
+        db2_url = "sqlite:///" + str(Path(self._temp_dir.name, "db2.sqlite"))
+        create_new_spine_database(db2_url)
+        logger = mock.MagicMock()
+        logger.__reduce__ = lambda _: (mock.MagicMock, ())
+        executable = ExecutableItem(
+            "name", db2_url, True, self._temp_dir.name, logger, commit_policy=CommitPolicy(EVERY_N_ITEMS, 2)
+        )
+        self.assertTrue(executable.execute([database_resource("provider", db1_url)], []))
+        logger.msg_error.emit.assert_not_called()
+        output_db_map = DatabaseMapping(db2_url)
+        scenarios = output_db_map.query(output_db_map.ext_scenario_sq).all()
+        self.assertEqual([(row.name, row.alternative_name) for row in scenarios], [("scen", "alt")])
+        values = output_db_map.query(output_db_map.object_parameter_value_sq).all()
+        self.assertEqual(len(values), 1)
+        self.assertEqual(values[0].object_name, "a_1")
+        self.assertEqual(values[0].parameter_name, "p")
+        self.assertEqual(values[0].alternative_name, "alt")
+        self.assertEqual(from_database(values[0].value, values[0].type), 2.3)
+        output_db_map.connection.close()
+
     def test_output_resources_backward(self):
         executable = ExecutableItem("name", "sqlite:///database.sqlite", True, self._temp_dir.name, mock.MagicMock())
         resources = executable.output_resources(ExecutionDirection.BACKWARD)
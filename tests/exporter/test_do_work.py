@@ -16,6 +16,7 @@ Unit tests for Exporter's :func:`do_work` function.
 """
 from csv import reader
 import os.path
+from shutil import copyfile
 from tempfile import TemporaryDirectory
 import unittest
 from unittest.mock import MagicMock
@@ -46,7 +47,9 @@ class TestWithCsvWriter(unittest.TestCase):
         databases = {self._url: "test_export_database.csv"}
         logger = MagicMock()
         self.assertTrue(
-            do_work(specification.to_dict(), False, False, self._temp_dir.name, databases, {self._url: set()}, logger)
+            do_work(
+                specification.to_dict(), False, False, self._temp_dir.name, databases, {self._url: set()}, 1, logger
+            )
         )
         out_path = os.path.join(self._temp_dir.name, "test_export_database.csv")
         self.assertTrue(os.path.exists(out_path))
@@ -56,6 +59,31 @@ class TestWithCsvWriter(unittest.TestCase):
         expected = [["oc1", "o11"], ["oc1", "o12"], ["oc2", "o21"], ["oc2", "o22"], ["oc2", "o23"]]
         self.assertEqual(table, expected)
 
+    def test_export_databases_in_parallel(self):
+        root_mapping = object_export(class_position=0, object_position=1)
+        mapping_specification = MappingSpecification(MappingType.objects, False, False, root_mapping)
+        specification = Specification("name", "description", {"mapping": mapping_specification})
+        copy_file = os.path.join(self._temp_dir.name, "test_db_copy.sqlite")
+        copyfile(os.path.join(self._temp_dir.name, "test_db.sqlite"), copy_file)
+        urls = [self._url, "sqlite:///" + copy_file]
+        file_names = ["first_parallel_export.csv", "second_parallel_export.csv"]
+        databases = dict(zip(urls, file_names))
+        forks = {url: set() for url in urls}
+        logger = MagicMock()
+        success, written_files = do_work(
+            specification.to_dict(), False, False, self._temp_dir.name, databases, forks, 2, logger
+        )
+        self.assertTrue(success)
+        self.assertEqual(
+            written_files,
+            {file_name: [os.path.join(self._temp_dir.name, file_name)] for file_name in file_names},
+        )
+        expected = [["oc1", "o11"], ["oc1", "o12"], ["oc2", "o21"], ["oc2", "o22"], ["oc2", "o23"]]
+        for file_name in file_names:
+            with open(os.path.join(self._temp_dir.name, file_name)) as input_:
+                table = [row for row in reader(input_)]
+            self.assertEqual(table, expected)
+
 
 if __name__ == "__main__":
     unittest.main()
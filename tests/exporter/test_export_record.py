@@ -0,0 +1,78 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Unit tests for Exporter's export record.
+
+:date:    18.10.2026
+"""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from spinedb_api import DiffDatabaseMapping, import_object_classes
+from spine_items.exporter.export_record import export_stamp, ExportRecord, specification_hash
+from spine_items.utils import latest_commit
+
+
+class TestExportRecord(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self._record_path = str(Path(self._temp_dir.name, "record.json"))
+        self._output_path = Path(self._temp_dir.name, "out.csv")
+        self._output_path.write_text("data")
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_recorded_files_are_up_to_date_with_same_stamp(self):
+        record = ExportRecord(self._record_path)
+        stamp = {"commit": [1, "2021-01-01 00:00:00"], "specification_hash": "abc"}
+        record.update("out.csv", stamp, [str(self._output_path)])
+        record.save()
+        record = ExportRecord(self._record_path)
+        self.assertEqual(record.up_to_date_files("out.csv", stamp), [str(self._output_path)])
+        changed_stamp = {"commit": [2, "2021-01-02 00:00:00"], "specification_hash": "abc"}
+        self.assertIsNone(record.up_to_date_files("out.csv", changed_stamp))
+        self.assertIsNone(record.up_to_date_files("out.csv", None))
+        self.assertIsNone(record.up_to_date_files("other.csv", stamp))
+
+    def test_missing_output_files_are_not_up_to_date(self):
+        record = ExportRecord(self._record_path)
+        stamp = {"commit": [1, "2021-01-01 00:00:00"], "specification_hash": "abc"}
+        record.update("out.csv", stamp, [str(self._output_path)])
+        self._output_path.unlink()
+        self.assertIsNone(record.up_to_date_files("out.csv", stamp))
+
+    def test_export_stamp_changes_with_commits_and_specification(self):
+        url = "sqlite:///" + str(Path(self._temp_dir.name, "db.sqlite"))
+        db_map = DiffDatabaseMapping(url, create=True)
+        try:
+            import_object_classes(db_map, ("oc1",))
+            db_map.commit_session("Add test data.")
+            first_commit = latest_commit(url)
+            first_stamp = export_stamp(url, specification_hash({"name": "spec"}), False)
+            self.assertEqual(export_stamp(url, specification_hash({"name": "spec"}), False), first_stamp)
+            self.assertNotEqual(export_stamp(url, specification_hash({"name": "changed"}), False), first_stamp)
+            import_object_classes(db_map, ("oc2",))
+            db_map.commit_session("Add more data.")
+        finally:
+            db_map.connection.close()
+        self.assertGreater(latest_commit(url)[0], first_commit[0])
+        self.assertNotEqual(export_stamp(url, specification_hash({"name": "spec"}), False), first_stamp)
+
+    def test_export_stamp_is_none_for_missing_database(self):
+        url = "sqlite:///" + str(Path(self._temp_dir.name, "no_such.sqlite"))
+        self.assertIsNone(export_stamp(url, specification_hash({}), False))
+        self.assertFalse(Path(self._temp_dir.name, "no_such.sqlite").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
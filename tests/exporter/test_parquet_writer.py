@@ -0,0 +1,107 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Unit tests for Exporter's Parquet writer.
+
+:date:    18.10.2026
+"""
+from datetime import datetime
+import os.path
+from tempfile import TemporaryDirectory
+import unittest
+import numpy
+from spinedb_api.parameter_value import TimeSeriesVariableResolution
+from spinedb_api.spine_io.exporters.writer import WriterException
+from spine_items.exporter.parquet_writer import ParquetWriter
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class TestParquetWriter(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _write(self, writer, table_name, rows):
+        writer.start_table(table_name)
+        for row in rows:
+            writer.write_row(row)
+        writer.finish_table()
+
+    def test_numbers_are_written_as_float64(self):
+        writer = ParquetWriter(self._temp_dir.name, "out.parquet")
+        writer.first_row_is_header = True
+        self._write(writer, None, [["object", "value"], ["a", 1], ["b", 2.5], ["c", None]])
+        out_path = os.path.join(self._temp_dir.name, "out.parquet")
+        self.assertEqual(writer.output_files(), [out_path])
+        table = pyarrow.parquet.read_table(out_path)
+        self.assertEqual(table.schema.names, ["object", "value"])
+        self.assertEqual(table.schema.field("object").type, pyarrow.string())
+        self.assertEqual(table.schema.field("value").type, pyarrow.float64())
+        self.assertEqual(table.to_pydict(), {"object": ["a", "b", "c"], "value": [1.0, 2.5, None]})
+
+    def test_columns_are_named_by_position_without_header(self):
+        writer = ParquetWriter(self._temp_dir.name, "out.parquet")
+        self._write(writer, "objects", [["oc", "a"], ["oc", "b"]])
+        table = pyarrow.parquet.read_table(os.path.join(self._temp_dir.name, "objects.parquet"))
+        self.assertEqual(table.to_pydict(), {"column_1": ["oc", "oc"], "column_2": ["a", "b"]})
+
+    def test_time_series_are_expanded_into_long_form(self):
+        time_series = TimeSeriesVariableResolution(
+            ["2021-01-01T00:00", "2021-01-01T01:00"], [2.0, 3.0], ignore_year=False, repeat=False
+        )
+        writer = ParquetWriter(self._temp_dir.name, "out.parquet")
+        writer.first_row_is_header = True
+        self._write(writer, None, [["object", "value"], ["a", 1.0], ["b", time_series]])
+        table = pyarrow.parquet.read_table(os.path.join(self._temp_dir.name, "out.parquet"))
+        self.assertEqual(table.schema.names, ["object", "value_index", "value"])
+        self.assertEqual(table.schema.field("value_index").type, pyarrow.timestamp("us"))
+        self.assertEqual(
+            table.to_pydict(),
+            {
+                "object": ["a", "b", "b"],
+                "value_index": [None, datetime(2021, 1, 1, 0), datetime(2021, 1, 1, 1)],
+                "value": [1.0, 2.0, 3.0],
+            },
+        )
+
+    def test_rows_are_written_in_row_groups(self):
+        writer = ParquetWriter(self._temp_dir.name, "out.parquet", row_group_size=2)
+        self._write(writer, None, [[numpy.datetime64("2021-01-01T00:00"), float(i)] for i in range(5)])
+        parquet_file = pyarrow.parquet.ParquetFile(os.path.join(self._temp_dir.name, "out.parquet"))
+        self.assertEqual(parquet_file.metadata.num_row_groups, 3)
+        self.assertEqual(parquet_file.schema_arrow.field("column_1").type, pyarrow.timestamp("us"))
+        self.assertEqual(parquet_file.read().column("column_2").to_pylist(), [0.0, 1.0, 2.0, 3.0, 4.0])
+
+    def test_values_that_do_not_fit_first_row_group_raise(self):
+        writer = ParquetWriter(self._temp_dir.name, "out.parquet", row_group_size=1)
+        writer.start_table(None)
+        writer.write_row(["a", 1.0])
+        with self.assertRaises(WriterException):
+            writer.write_row(["b", "not a number"])
+
+    def test_writing_same_table_twice_raises(self):
+        writer = ParquetWriter(self._temp_dir.name, "out.parquet")
+        self._write(writer, "objects", [["a"]])
+        with self.assertRaises(WriterException):
+            writer.start_table("objects")
+
+
+if __name__ == "__main__":
+    unittest.main()
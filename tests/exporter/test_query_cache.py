@@ -0,0 +1,65 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Unit tests for Exporter's query cache.
+
+:date:    18.10.2026
+"""
+import unittest
+from spinedb_api import DiffDatabaseMapping, import_object_classes, import_objects
+from spine_items.exporter.query_cache import QueryCache
+
+
+class TestQueryCache(unittest.TestCase):
+    def setUp(self):
+        self._db_map = DiffDatabaseMapping("sqlite://", create=True)
+        import_object_classes(self._db_map, ("oc1", "oc2"))
+        import_objects(self._db_map, (("oc1", "o11"), ("oc1", "o12"), ("oc2", "o21")))
+        self._db_map.commit_session("Add test data.")
+
+    def tearDown(self):
+        self._db_map.connection.close()
+
+    def test_identical_queries_are_executed_once(self):
+        cache = QueryCache(self._db_map)
+        db_map = cache.database_map
+        first = [row.name for row in db_map.query(db_map.object_sq).yield_per(1000)]
+        second = [row.name for row in db_map.query(db_map.object_sq).yield_per(1000)]
+        self.assertEqual(first, ["o11", "o12", "o21"])
+        self.assertEqual(second, first)
+        self.assertEqual(cache.miss_count, 1)
+        self.assertEqual(cache.hit_count, 1)
+
+    def test_queries_with_different_parameters_are_cached_separately(self):
+        cache = QueryCache(self._db_map)
+        db_map = cache.database_map
+        object_sq = db_map.object_sq
+        class_ids = {row.name: row.id for row in db_map.query(db_map.object_class_sq)}
+        oc1_objects = [row.name for row in db_map.query(object_sq).filter(object_sq.c.class_id == class_ids["oc1"])]
+        oc2_objects = [row.name for row in db_map.query(object_sq).filter(object_sq.c.class_id == class_ids["oc2"])]
+        self.assertEqual(oc1_objects, ["o11", "o12"])
+        self.assertEqual(oc2_objects, ["o21"])
+        self.assertEqual(cache.miss_count, 3)
+        self.assertEqual(cache.hit_count, 0)
+
+    def test_clear_drops_cached_results(self):
+        cache = QueryCache(self._db_map)
+        db_map = cache.database_map
+        db_map.query(db_map.object_class_sq).all()
+        cache.clear()
+        db_map.query(db_map.object_class_sq).all()
+        self.assertEqual(cache.miss_count, 2)
+        self.assertEqual(cache.hit_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,7 +17,14 @@ from PySide2.QtCore import Qt
 from spine_items.importer.mvcmodels.mapping_specification_model import MappingSpecificationModel
 from spine_items.importer.mvcmodels.source_data_table_model import SourceDataTableModel
 from spinedb_api.spine_io.type_conversion import value_to_convert_spec
-from spinedb_api import item_mapping_from_dict
+from spinedb_api import (
+    item_mapping_from_dict,
+    ColumnHeaderMapping,
+    ColumnMapping,
+    EntityClassMapping,
+    ParameterValueMapping,
+    RowMapping,
+)
 
 
 class TestSourceDataTableModel(unittest.TestCase):
@@ -25,14 +32,14 @@ class TestSourceDataTableModel(unittest.TestCase):
         model = SourceDataTableModel()
         model.reset_model([["1", "0h", "2018-01-01 00:00"], ["2", "1h", "2018-01-01 00:00"]])
         model.set_type(0, value_to_convert_spec('float'))
-        self.assertEqual(model._column_type_errors, {})
-        self.assertEqual(model._row_type_errors, {})
+        self.assertEqual(model.type_errors(Qt.Horizontal), {})
+        self.assertEqual(model.type_errors(Qt.Vertical), {})
         model.set_type(1, value_to_convert_spec('duration'))
-        self.assertEqual(model._column_type_errors, {})
-        self.assertEqual(model._row_type_errors, {})
+        self.assertEqual(model.type_errors(Qt.Horizontal), {})
+        self.assertEqual(model.type_errors(Qt.Vertical), {})
         model.set_type(2, value_to_convert_spec('datetime'))
-        self.assertEqual(model._column_type_errors, {})
-        self.assertEqual(model._row_type_errors, {})
+        self.assertEqual(model.type_errors(Qt.Horizontal), {})
+        self.assertEqual(model.type_errors(Qt.Vertical), {})
 
     def test_row_type_checking(self):
         model = SourceDataTableModel()
@@ -40,23 +47,23 @@ class TestSourceDataTableModel(unittest.TestCase):
             [["1", "1", "1.1"], ["2h", "1h", "2h"], ["2018-01-01 00:00", "2018-01-01 00:00", "2018-01-01 00:00"]]
         )
         model.set_type(0, value_to_convert_spec('float'), orientation=Qt.Vertical)
-        self.assertEqual(model._column_type_errors, {})
-        self.assertEqual(model._row_type_errors, {})
+        self.assertEqual(model.type_errors(Qt.Horizontal), {})
+        self.assertEqual(model.type_errors(Qt.Vertical), {})
         model.set_type(1, value_to_convert_spec('duration'), orientation=Qt.Vertical)
-        self.assertEqual(model._column_type_errors, {})
-        self.assertEqual(model._row_type_errors, {})
+        self.assertEqual(model.type_errors(Qt.Horizontal), {})
+        self.assertEqual(model.type_errors(Qt.Vertical), {})
         model.set_type(2, value_to_convert_spec('datetime'), orientation=Qt.Vertical)
-        self.assertEqual(model._column_type_errors, {})
-        self.assertEqual(model._row_type_errors, {})
+        self.assertEqual(model.type_errors(Qt.Horizontal), {})
+        self.assertEqual(model.type_errors(Qt.Vertical), {})
 
     def test_column_type_checking_produces_error(self):
         model = SourceDataTableModel()
         model.reset_model([["Not a valid number", "2.4"], ["1", "3"]])
         model.set_type(0, value_to_convert_spec('float'))
         error_index = (0, 0)
-        self.assertEqual(len(model._column_type_errors), 1)
-        self.assertEqual(model._row_type_errors, {})
-        self.assertTrue(error_index in model._column_type_errors)
+        self.assertEqual(len(model.type_errors(Qt.Horizontal)), 1)
+        self.assertEqual(model.type_errors(Qt.Vertical), {})
+        self.assertTrue(error_index in model.type_errors(Qt.Horizontal))
         self.assertEqual(model.data(model.index(*error_index)), "Not a valid number")
 
         # if we add a pivoted mapping for the row with the error, the error should not be
@@ -80,14 +87,39 @@ class TestSourceDataTableModel(unittest.TestCase):
         model.set_mapping(mapping)
         self.assertEqual(model.data(model.index(*error_index)), "Not a valid number")
 
+    def test_column_values_are_displayed_as_converted(self):
+        model = SourceDataTableModel()
+        model.reset_model([["1", "Not a valid number"], ["", "2"], ["3.5", "4"]])
+        model.set_type(0, value_to_convert_spec('float'))
+        model.set_type(1, value_to_convert_spec('float'))
+        self.assertEqual(model.data(model.index(0, 0)), "1.0")
+        self.assertEqual(model.data(model.index(1, 0)), "")
+        self.assertEqual(model.data(model.index(2, 0)), "3.5")
+        self.assertEqual(list(model.type_errors(Qt.Horizontal)), [(0, 1)])
+        self.assertEqual(model.data(model.index(2, 1)), "4.0")
+
+    def test_rows_beyond_first_batch_are_validated_on_request(self):
+        model = SourceDataTableModel()
+        model.reset_model([["1"]] * 500 + [["Not a valid number"]])
+        model.set_type(0, value_to_convert_spec('float'))
+        self.assertEqual(model.type_errors(Qt.Horizontal), {})
+        model.validate_rows(500)
+        self.assertEqual(list(model.type_errors(Qt.Horizontal)), [(500, 0)])
+
+    def test_complete_type_errors_validate_remaining_rows(self):
+        model = SourceDataTableModel()
+        model.reset_model([["1"]] * 500 + [["Not a valid number"]])
+        model.set_type(0, value_to_convert_spec('float'))
+        self.assertEqual(list(model.type_errors(Qt.Horizontal, complete=True)), [(500, 0)])
+
     def test_row_type_checking_produces_error(self):
         model = SourceDataTableModel()
         model.reset_model([["1", "2.4"], ["Not a valid number", "3"]])
         model.set_type(1, value_to_convert_spec('float'), orientation=Qt.Vertical)
         error_index = (1, 0)
-        self.assertEqual(len(model._row_type_errors), 1)
-        self.assertEqual(model._column_type_errors, {})
-        self.assertTrue(error_index in model._row_type_errors)
+        self.assertEqual(len(model.type_errors(Qt.Vertical)), 1)
+        self.assertEqual(model.type_errors(Qt.Horizontal), {})
+        self.assertTrue(error_index in model.type_errors(Qt.Vertical))
         # Error should only be shown if we have a pivot mapping on that row.
         self.assertEqual(model.data(model.index(*error_index)), "Not a valid number")
 
@@ -192,5 +224,106 @@ class TestSourceDataTableModel(unittest.TestCase):
         self.assertEqual(model.data(model.index(1, 1), role=Qt.BackgroundRole), None)
 
 
+    def test_non_pivoted_colors_match_reference(self):
+        mapping_dict = {
+            "map_type": "ObjectClass",
+            "name": {"map_type": "column", "reference": 0},
+            "objects": {"map_type": "column", "reference": 1},
+            "parameters": {
+                "map_type": "parameter",
+                "name": {"map_type": "column", "reference": 2},
+                "value": {"map_type": "column", "reference": 3},
+            },
+            "read_start_row": 1,
+        }
+        self._assert_colors_match_reference(mapping_dict)
+
+    def test_pivoted_colors_match_reference(self):
+        mapping_dict = {
+            "map_type": "ObjectClass",
+            "name": {"map_type": "column", "reference": 0},
+            "objects": {"map_type": "column", "reference": 1},
+            "parameters": {"map_type": "parameter", "name": {"map_type": "row", "reference": 0}},
+        }
+        self._assert_colors_match_reference(mapping_dict)
+        mapping_dict["read_start_row"] = 2
+        self._assert_colors_match_reference(mapping_dict)
+
+    def test_pivoted_colors_with_skipped_columns_match_reference(self):
+        mapping_dict = {
+            "map_type": "ObjectClass",
+            "name": {"map_type": "column", "reference": 0},
+            "objects": {"map_type": "column", "reference": 1},
+            "parameters": {"map_type": "parameter", "name": {"map_type": "row", "reference": 0}},
+            "skip_columns": [2],
+        }
+        self._assert_colors_match_reference(mapping_dict)
+
+    def test_header_colors_match_reference(self):
+        mapping_dict = {
+            "map_type": "ObjectClass",
+            "name": {"map_type": "column_header", "reference": "b"},
+            "objects": {"map_type": "row", "reference": -1},
+            "skip_columns": ["a"],
+        }
+        self._assert_colors_match_reference(mapping_dict)
+
+    def _assert_colors_match_reference(self, mapping_dict):
+        model = SourceDataTableModel()
+        model.reset_model([[str(5 * row + column) for column in range(5)] for row in range(5)])
+        model.set_horizontal_header_labels(["a", "b", "c", "d", "e"])
+        specification = MappingSpecificationModel(
+            "source table", "mapping", item_mapping_from_dict(mapping_dict), MagicMock()
+        )
+        model.set_mapping(specification)
+        for row in range(model.rowCount()):
+            for column in range(model.columnCount()):
+                with self.subTest(row=row, column=column):
+                    self.assertEqual(
+                        model.data(model.index(row, column), role=Qt.BackgroundRole),
+                        _reference_data_color(model, specification, row, column),
+                    )
+        for column in range(model.columnCount()):
+            with self.subTest(header=column):
+                self.assertEqual(
+                    model.headerData(column, Qt.Horizontal, Qt.BackgroundRole),
+                    _reference_header_color(model, specification, column),
+                )
+
+
+def _reference_data_color(model, specification, row, column):
+    """Cell color as it was resolved before mapping roles were cached."""
+    mapping = specification.mapping
+    reference_columns = model.mapping_column_ref_int_list()
+    if isinstance(mapping, EntityClassMapping) and isinstance(mapping.parameters, ParameterValueMapping):
+        if mapping.is_pivoted():
+            last_row = max(mapping.last_pivot_row(), mapping.read_start_row - 1)
+            if last_row is not None and row > last_row and column not in reference_columns:
+                return specification.data_color("Parameter values")
+    for component, color in zip(specification._component_mappings, specification._colors):
+        if isinstance(component, ColumnHeaderMapping):
+            continue
+        if isinstance(component, ColumnMapping) and column == model._reference_from_header(component.reference):
+            if mapping.is_pivoted():
+                last_row = max(mapping.last_pivot_row(), specification.read_start_row - 1)
+                if last_row is not None and row > last_row:
+                    return color
+            elif row >= specification.read_start_row:
+                return color
+        if isinstance(component, RowMapping) and row == component.reference and column not in reference_columns:
+            return color
+    return None
+
+
+def _reference_header_color(model, specification, section):
+    """Header color as it was resolved before mapping roles were cached."""
+    for component, color in zip(specification._component_mappings, specification._colors):
+        if isinstance(component, ColumnHeaderMapping) and section == model._reference_from_header(component.reference):
+            return color
+        if isinstance(component, RowMapping) and component.reference == -1:
+            return color
+    return None
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -22,6 +22,7 @@ from unittest import mock
 from spinedb_api import create_new_spine_database, DatabaseMapping
 from spine_engine.project_item.project_item_resource import database_resource, file_resource
 from spine_items.importer.executable_item import ExecutableItem
+from spine_items.importer.execution_settings import ExecutionSettings
 from spine_items.importer.importer_specification import ImporterSpecification
 
 
@@ -112,6 +113,180 @@ class TestImporterExecutable(unittest.TestCase):
         self.assertEqual(object_list[0].name, "entity")
         database_map.connection.close()
 
+    def test_execute_import_in_chunks(self):
+        data_file = Path(self._temp_dir.name, "data.dat")
+        with open(data_file, "w") as out_file:
+            out_file.write("class,entity_1\nclass,entity_2\nclass,entity_3\n")
+        mapping = self._simple_input_data_mapping()
+        database_path = Path(self._temp_dir.name, "database.sqlite")
+        database_url = "sqlite:///" + str(database_path)
+        create_new_spine_database(database_url)
+        logger = mock.MagicMock()
+        logger.__reduce__ = lambda _: (mock.MagicMock, ())
+        settings = ExecutionSettings(chunk_size=2, commit_interval=1)
+        executable = ExecutableItem(
+            "name", mapping, [str(data_file)], "", True, self._temp_dir.name, logger, execution_settings=settings
+        )
+        database_resources = [database_resource("provider", database_url)]
+        file_resources = [file_resource("provider", str(data_file))]
+        self.assertTrue(executable.execute(file_resources, database_resources))
+        database_map = DatabaseMapping(database_url)
+        object_list = database_map.object_list().all()
+        self.assertEqual(sorted(o.name for o in object_list), ["entity_1", "entity_2", "entity_3"])
+        database_map.connection.close()
+
+    def test_execute_sqlite_bulk_load(self):
+        data_file = Path(self._temp_dir.name, "data.dat")
+        with open(data_file, "w") as out_file:
+            out_file.write("class,entity_1\nclass,entity_2\nclass,entity_3\n")
+        mapping = self._simple_input_data_mapping()
+        database_path = Path(self._temp_dir.name, "database.sqlite")
+        database_url = "sqlite:///" + str(database_path)
+        create_new_spine_database(database_url)
+        logger = mock.MagicMock()
+        logger.__reduce__ = lambda _: (mock.MagicMock, ())
+        settings = ExecutionSettings(chunk_size=2, sqlite_bulk_load=True)
+        executable = ExecutableItem(
+            "name", mapping, [str(data_file)], "", True, self._temp_dir.name, logger, execution_settings=settings
+        )
+        database_resources = [database_resource("provider", database_url)]
+        file_resources = [file_resource("provider", str(data_file))]
+        self.assertTrue(executable.execute(file_resources, database_resources))
+        database_map = DatabaseMapping(database_url)
+        object_list = database_map.object_list().all()
+        self.assertEqual(sorted(o.name for o in object_list), ["entity_1", "entity_2", "entity_3"])
+        database_map.connection.close()
+
+    def test_execute_with_prefetched_existing_items(self):
+        data_file = Path(self._temp_dir.name, "data.dat")
+        with open(data_file, "w") as out_file:
+            out_file.write("class,entity_1\n")
+        mapping = self._simple_input_data_mapping()
+        database_url = "sqlite:///" + str(Path(self._temp_dir.name, "database.sqlite"))
+        create_new_spine_database(database_url)
+        logger = mock.MagicMock()
+        logger.__reduce__ = lambda _: (mock.MagicMock, ())
+        settings = ExecutionSettings(prefetch_existing_items=True)
+        database_resources = [database_resource("provider", database_url)]
+        file_resources = [file_resource("provider", str(data_file))]
+        executable = ExecutableItem(
+            "name", mapping, [str(data_file)], "", True, self._temp_dir.name, logger, execution_settings=settings
+        )
+        self.assertTrue(executable.execute(file_resources, database_resources))
+        with open(data_file, "a") as out_file:
+            out_file.write("class,entity_2\n")
+        executable = ExecutableItem(
+            "name", mapping, [str(data_file)], "", True, self._temp_dir.name, logger, execution_settings=settings
+        )
+        self.assertTrue(executable.execute(file_resources, database_resources))
+        database_map = DatabaseMapping(database_url)
+        self.assertEqual([c.name for c in database_map.object_class_list()], ["class"])
+        object_list = database_map.object_list().all()
+        self.assertEqual(sorted(o.name for o in object_list), ["entity_1", "entity_2"])
+        database_map.connection.close()
+
+    def test_execute_read_sources_in_parallel(self):
+        data_files = list()
+        for i in range(3):
+            data_file = Path(self._temp_dir.name, f"data_{i}.dat")
+            with open(data_file, "w") as out_file:
+                out_file.write(f"class,entity_{i}\n")
+            data_files.append(data_file)
+        mapping = self._simple_input_data_mapping()
+        database_path = Path(self._temp_dir.name, "database.sqlite")
+        database_url = "sqlite:///" + str(database_path)
+        create_new_spine_database(database_url)
+        logger = mock.MagicMock()
+        logger.__reduce__ = lambda _: (mock.MagicMock, ())
+        settings = ExecutionSettings(read_process_count=2)
+        selected_files = [str(path) for path in data_files]
+        executable = ExecutableItem(
+            "name", mapping, selected_files, "", True, self._temp_dir.name, logger, execution_settings=settings
+        )
+        database_resources = [database_resource("provider", database_url)]
+        file_resources = [file_resource("provider", str(path)) for path in data_files]
+        self.assertTrue(executable.execute(file_resources, database_resources))
+        database_map = DatabaseMapping(database_url)
+        object_list = database_map.object_list().all()
+        self.assertEqual(sorted(o.name for o in object_list), ["entity_0", "entity_1", "entity_2"])
+        database_map.connection.close()
+
+    def test_execute_import_into_multiple_databases_concurrently(self):
+        data_file = Path(self._temp_dir.name, "data.dat")
+        self._write_simple_data(data_file)
+        mapping = self._simple_input_data_mapping()
+        database_urls = list()
+        for i in range(2):
+            database_url = "sqlite:///" + str(Path(self._temp_dir.name, f"database_{i}.sqlite"))
+            create_new_spine_database(database_url)
+            database_urls.append(database_url)
+        logger = mock.MagicMock()
+        logger.__reduce__ = lambda _: (mock.MagicMock, ())
+        settings = ExecutionSettings(concurrent_import=True)
+        executable = ExecutableItem(
+            "name", mapping, [str(data_file)], "", True, self._temp_dir.name, logger, execution_settings=settings
+        )
+        database_resources = [database_resource("provider", url) for url in database_urls]
+        file_resources = [file_resource("provider", str(data_file))]
+        self.assertTrue(executable.execute(file_resources, database_resources))
+        for database_url in database_urls:
+            database_map = DatabaseMapping(database_url)
+            object_list = database_map.object_list().all()
+            self.assertEqual([o.name for o in object_list], ["entity"])
+            database_map.connection.close()
+
+    def test_execute_changed_tables_only_skips_tables_with_unchanged_mappings(self):
+        data_file = Path(self._temp_dir.name, "data.dat")
+        self._write_simple_data(data_file)
+        mapping = self._simple_input_data_mapping()
+        database_url = "sqlite:///" + str(Path(self._temp_dir.name, "database.sqlite"))
+        create_new_spine_database(database_url)
+        database_resources = [database_resource("provider", database_url)]
+        file_resources = [file_resource("provider", str(data_file))]
+        executable = ExecutableItem("name", mapping, [str(data_file)], "", True, self._temp_dir.name, mock.MagicMock())
+        self.assertTrue(executable.execute(file_resources, database_resources))
+        mapping["table_mappings"]["unselected table"] = mapping["table_mappings"]["csv"]
+        logger = mock.MagicMock()
+        settings = ExecutionSettings(changed_tables_only=True)
+        executable = ExecutableItem(
+            "name", mapping, [str(data_file)], "", True, self._temp_dir.name, logger, execution_settings=settings
+        )
+        self.assertTrue(executable.execute(file_resources, database_resources))
+        logger.msg.emit.assert_any_call(f"Skipping '{data_file}': unchanged since last import.")
+        mapping["table_options"]["csv"]["skip"] = 1
+        logger = mock.MagicMock()
+        executable = ExecutableItem(
+            "name", mapping, [str(data_file)], "", True, self._temp_dir.name, logger, execution_settings=settings
+        )
+        self.assertTrue(executable.execute(file_resources, database_resources))
+        self.assertNotIn(
+            mock.call(f"Skipping '{data_file}': unchanged since last import."), logger.msg.emit.call_args_list
+        )
+
+    def test_execute_dry_run_writes_nothing_to_database(self):
+        data_file = Path(self._temp_dir.name, "data.dat")
+        with open(data_file, "w") as out_file:
+            out_file.write("class,entity_1\nclass,entity_2\nclass,entity_3\n")
+        mapping = self._simple_input_data_mapping()
+        database_url = "sqlite:///" + str(Path(self._temp_dir.name, "database.sqlite"))
+        create_new_spine_database(database_url)
+        logger = mock.MagicMock()
+        settings = ExecutionSettings(dry_run=True)
+        executable = ExecutableItem(
+            "name", mapping, [str(data_file)], "", True, self._temp_dir.name, logger, execution_settings=settings
+        )
+        database_resources = [database_resource("provider", database_url)]
+        file_resources = [file_resource("provider", str(data_file))]
+        self.assertTrue(executable.execute(file_resources, database_resources))
+        messages = [call.args[0] for call in logger.msg.emit.call_args_list]
+        self.assertIn("Dry run: nothing will be written to downstream databases.", messages)
+        summary = next(message for message in messages if message.startswith("Dry run of"))
+        self.assertTrue(summary.startswith("Dry run of 1 sources: 3 rows would be imported"))
+        self.assertTrue(summary.endswith("with 0 read errors and 0 conversion errors."))
+        database_map = DatabaseMapping(database_url)
+        self.assertEqual(database_map.object_list().all(), [])
+        database_map.connection.close()
+
     def test_execute_skip_deselected_file(self):
         data_file = Path(self._temp_dir.name, "data.dat")
         self._write_simple_data(data_file)
@@ -0,0 +1,65 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Unit tests for BatchedSqlAlchemyConnector.
+
+:date:    18.10.2026
+"""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from sqlalchemy import Column, create_engine, Integer, MetaData, Table, Text
+from spine_items.importer.batched_sqlalchemy_connector import BatchedSqlAlchemyConnector
+
+
+class TestBatchedSqlAlchemyConnector(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self._database_path = str(Path(self._temp_dir.name, "source.sqlite"))
+        engine = create_engine("sqlite:///" + self._database_path)
+        metadata = MetaData()
+        table = Table("data", metadata, Column("id", Integer, primary_key=True), Column("name", Text))
+        metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(table.insert(), [{"id": i, "name": f"row {i}"} for i in range(5)])
+        engine.dispose()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_batch_size_defaults_when_not_given(self):
+        self.assertEqual(BatchedSqlAlchemyConnector(None).batch_size, BatchedSqlAlchemyConnector.DEFAULT_BATCH_SIZE)
+        self.assertEqual(BatchedSqlAlchemyConnector({"fetch_batch_size": 2}).batch_size, 2)
+
+    def test_get_data_iterator_yields_all_rows(self):
+        connector = BatchedSqlAlchemyConnector({"fetch_batch_size": 2})
+        connector.connect_to_source(self._database_path)
+        try:
+            rows, header, column_count = connector.get_data_iterator("data", {})
+            self.assertEqual(header, ["id", "name"])
+            self.assertEqual(column_count, 2)
+            self.assertEqual(list(rows), [[i, f"row {i}"] for i in range(5)])
+        finally:
+            connector.disconnect()
+
+    def test_get_data_iterator_respects_max_rows(self):
+        connector = BatchedSqlAlchemyConnector({"fetch_batch_size": 2})
+        connector.connect_to_source(self._database_path)
+        try:
+            rows, _, _ = connector.get_data_iterator("data", {}, max_rows=3)
+            self.assertEqual(list(rows), [[0, "row 0"], [1, "row 1"], [2, "row 2"]])
+        finally:
+            connector.disconnect()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Unit tests for the compiled_mapping module.
+
+:date:    18.10.2026
+"""
+import unittest
+from spine_items.importer.compiled_mapping import compile_specification, compile_table
+
+
+def _object_class_mapping():
+    return {
+        "map_type": "ObjectClass",
+        "name": {"map_type": "column", "reference": 0},
+        "objects": {"map_type": "column", "reference": 1},
+    }
+
+
+def _specification_mapping():
+    return {
+        "table_mappings": {"table 1": [_object_class_mapping()], "table 2": [_object_class_mapping()]},
+        "table_options": {"table 1": {"has_header": False}},
+        "table_types": {"table 1": {"0": "string"}},
+        "table_row_types": {},
+        "selected_tables": ["table 1"],
+    }
+
+
+class TestCompiledMapping(unittest.TestCase):
+    def test_compile_specification_includes_selected_tables_only(self):
+        compiled = compile_specification(_specification_mapping())
+        self.assertEqual(list(compiled), ["table 1"])
+        table = compiled["table 1"]
+        self.assertEqual(table.options, {"has_header": False})
+        self.assertEqual(list(table.column_types), [0])
+        self.assertFalse(table.pivoted)
+
+    def test_map_rows_from_middle_of_table(self):
+        table = compile_table(dict(_object_class_mapping(), read_start_row=1))
+        data, errors = table.map_rows([["class", "object 2"]], 2, [], first_row=1)
+        self.assertEqual(errors, [])
+        self.assertEqual(data["object_classes"], ["class"])
+        self.assertEqual(data["objects"], [("class", "object 2")])
+        self.assertEqual(table.mappings[0].read_start_row, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+
+"""
+Unit tests for connection_manager module.
+
+:date:    18.10.2026
+"""
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from spine_items.importer.connection_manager import PreviewCache, RequestGenerations
+
+
+class TestPreviewCache(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self._source = str(Path(self._temp_dir.name, "source.csv"))
+        with open(self._source, "w") as source_file:
+            source_file.write("a,b\n")
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_get_returns_stored_preview(self):
+        cache = PreviewCache(2)
+        cache.put(self._source, "table", {"delimiter": ","}, 100, [["a", "b"]], ["x", "y"])
+        self.assertEqual(cache.get(self._source, "table", {"delimiter": ","}, 100), ([["a", "b"]], ["x", "y"]))
+        self.assertIsNone(cache.get(self._source, "table", {"delimiter": ";"}, 100))
+        self.assertIsNone(cache.get(self._source, "table", {"delimiter": ","}, 10))
+
+    def test_least_recently_used_preview_gets_evicted(self):
+        cache = PreviewCache(2)
+        cache.put(self._source, "table 1", {}, 100, [["1"]], [])
+        cache.put(self._source, "table 2", {}, 100, [["2"]], [])
+        cache.get(self._source, "table 1", {}, 100)
+        cache.put(self._source, "table 3", {}, 100, [["3"]], [])
+        self.assertIsNotNone(cache.get(self._source, "table 1", {}, 100))
+        self.assertIsNone(cache.get(self._source, "table 2", {}, 100))
+        self.assertIsNotNone(cache.get(self._source, "table 3", {}, 100))
+
+    def test_modified_source_invalidates_previews(self):
+        cache = PreviewCache(2)
+        cache.put(self._source, "table", {}, 100, [["a", "b"]], [])
+        mtime = os.path.getmtime(self._source)
+        os.utime(self._source, (mtime + 10.0, mtime + 10.0))
+        self.assertIsNone(cache.get(self._source, "table", {}, 100))
+
+    def test_sources_that_are_not_files_are_not_cached(self):
+        cache = PreviewCache(2)
+        url = "sqlite:///" + str(Path(self._temp_dir.name, "db.sqlite"))
+        cache.put(url, "table", {}, 100, [["a", "b"]], [])
+        self.assertIsNone(cache.get(url, "table", {}, 100))
+
+
+class TestRequestGenerations(unittest.TestCase):
+    def test_newer_request_supersedes_older(self):
+        generations = RequestGenerations()
+        first = generations.next("data")
+        self.assertTrue(generations.is_current("data", first))
+        second = generations.next("data")
+        self.assertFalse(generations.is_current("data", first))
+        self.assertTrue(generations.is_current("data", second))
+
+    def test_request_kinds_are_independent(self):
+        generations = RequestGenerations()
+        data_generation = generations.next("data")
+        generations.next("mapped data")
+        self.assertTrue(generations.is_current("data", data_generation))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Unit tests for Importer's do_work module.
+
+:date:    18.10.2026
+"""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+from spinedb_api import create_new_spine_database, DatabaseMapping, DiffDatabaseMapping, import_object_classes
+from spine_items.commit_policy import CommitPolicy, PER_RUN
+from spine_items.importer.do_work import _ImportTarget, _SkipCache
+
+
+class TestImportTarget(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self._url = "sqlite:///" + str(Path(self._temp_dir.name, "database.sqlite"))
+        create_new_spine_database(self._url)
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_bulk_load_relaxes_durability_of_target_connection_only(self):
+        other_db_map = DatabaseMapping(self._url)
+        original_synchronous = other_db_map.connection.execute("PRAGMA synchronous").scalar()
+        db_map = DatabaseMapping(self._url, upgrade=False, username="Importer")
+        target = _ImportTarget(self._url, db_map, CommitPolicy(PER_RUN), bulk_load=True)
+        self.assertEqual(db_map.connection.execute("PRAGMA synchronous").scalar(), 0)
+        self.assertEqual(other_db_map.connection.execute("PRAGMA synchronous").scalar(), original_synchronous)
+        self.assertEqual(target.import_data({"object_classes": ["oc"], "objects": [("oc", "o1")]}), [])
+        self.assertTrue(target.commit())
+        target.close()
+        other_db_map.connection.close()
+        db_map = DatabaseMapping(self._url)
+        self.assertEqual([row.name for row in db_map.query(db_map.object_sq)], ["o1"])
+        db_map.connection.close()
+
+    def test_database_stays_consistent_after_failed_bulk_load(self):
+        db_map = DatabaseMapping(self._url, upgrade=False, username="Importer")
+        target = _ImportTarget(self._url, db_map, CommitPolicy(PER_RUN), bulk_load=True)
+        self.assertEqual(target.import_data({"object_classes": ["oc1"]}), [])
+        self.assertTrue(target.commit())
+        self.assertEqual(target.import_data({"object_classes": ["oc2"], "objects": [("oc2", "o1")]}), [])
+        self.assertNotEqual(target.import_data({"objects": [("no such class", "o2")]}), [])
+        self.assertTrue(target.rollback())
+        self.assertEqual(target.import_data({"object_classes": ["oc3"]}), [])
+        target.close()
+        db_map = DatabaseMapping(self._url)
+        self.assertEqual(db_map.connection.execute("PRAGMA integrity_check").scalar(), "ok")
+        self.assertEqual([row.name for row in db_map.query(db_map.object_class_sq)], ["oc1"])
+        self.assertEqual(db_map.query(db_map.object_sq).all(), [])
+        db_map.connection.close()
+
+
+class TestSkipCache(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self._url = "sqlite:///" + str(Path(self._temp_dir.name, "database.sqlite"))
+        create_new_spine_database(self._url)
+        self._manifest_path = str(Path(self._temp_dir.name, "manifest.json"))
+        self._source = str(Path(self._temp_dir.name, "data.csv"))
+        Path(self._source).write_text("oc,o1\n")
+        self._mapping = {"table_mappings": {"csv": [{"map_type": "ObjectClass"}]}, "selected_tables": ["csv"]}
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_unchanged_source_is_skipped_until_database_gets_committed_to(self):
+        cache = _SkipCache(self._manifest_path, self._mapping)
+        logger = mock.MagicMock()
+        self.assertEqual(cache.tables_to_import([self._source], [self._url], False, logger), {self._source: ["csv"]})
+        cache.record_imports([self._source], self._url)
+        cache = _SkipCache(self._manifest_path, self._mapping)
+        self.assertEqual(cache.tables_to_import([self._source], [self._url], False, logger), {self._source: []})
+        db_map = DiffDatabaseMapping(self._url)
+        import_object_classes(db_map, ("other_class",))
+        db_map.commit_session("Change database behind Importer's back.")
+        db_map.connection.close()
+        cache = _SkipCache(self._manifest_path, self._mapping)
+        self.assertEqual(cache.tables_to_import([self._source], [self._url], False, logger), {self._source: ["csv"]})
+
+    def test_sources_are_not_hashed_when_cache_is_disabled(self):
+        cache = _SkipCache(self._manifest_path, self._mapping, enabled=False)
+        with mock.patch("spine_items.importer.do_work.source_hash") as source_hash:
+            tables = cache.tables_to_import([self._source], [self._url], False, mock.MagicMock())
+            cache.record_imports([self._source], self._url)
+            cache.record_checkpoint({self._source: ["csv"]}, self._url)
+            source_hash.assert_not_called()
+        self.assertEqual(tables, {self._source: ["csv"]})
+        self.assertFalse(Path(self._manifest_path).exists())
+
+    def test_sources_are_hashed_once(self):
+        cache = _SkipCache(self._manifest_path, self._mapping)
+        with mock.patch("spine_items.importer.do_work.source_hash", return_value="abc") as source_hash:
+            cache.tables_to_import([self._source], [self._url], False, mock.MagicMock())
+            cache.record_imports([self._source], self._url)
+            source_hash.assert_called_once_with(self._source)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Unit tests for the existence_index module.
+
+:date:    18.10.2026
+"""
+import unittest
+from spinedb_api import DiffDatabaseMapping, import_functions
+from spine_items.importer.existence_index import ExistenceIndex
+
+
+class TestExistenceIndex(unittest.TestCase):
+    def test_build_indexes_existing_items(self):
+        db_map = DiffDatabaseMapping("sqlite://", create=True)
+        import_functions.import_object_classes(db_map, ["class"])
+        import_functions.import_objects(db_map, [("class", "object")])
+        import_functions.import_relationship_classes(db_map, [("relationship_class", ["class"])])
+        import_functions.import_relationships(db_map, [("relationship_class", ["object"])])
+        import_functions.import_object_parameters(db_map, [("class", "parameter")])
+        db_map.commit_session("Add test data.")
+        index = ExistenceIndex.build(db_map)
+        db_map.connection.close()
+        self.assertIsNotNone(index.id("object_classes", "class"))
+        self.assertIsNotNone(index.id("objects", ("class", "object")))
+        self.assertIsNotNone(index.id("relationship_classes", ("relationship_class", ("class",))))
+        self.assertIsNotNone(index.id("relationships", ("relationship_class", ("object",))))
+        self.assertIsNotNone(index.id("object_parameters", ("class", "parameter")))
+        self.assertTrue(index.exists("alternatives", "Base"))
+        self.assertFalse(index.exists("objects", ("class", "another_object")))
+
+    def test_prune_drops_plain_declarations_of_existing_items(self):
+        index = ExistenceIndex({"object_classes": {"class": (1, True)}, "objects": {("class", "object"): (2, True)}})
+        data = {
+            "object_classes": ["class"],
+            "objects": [("class", "object"), ("class", "new_object")],
+            "object_parameter_values": [("class", "object", "parameter", 2.3)],
+        }
+        pruned = index.prune(data)
+        self.assertEqual(
+            pruned,
+            {
+                "objects": [("class", "new_object")],
+                "object_parameter_values": [("class", "object", "parameter", 2.3)],
+            },
+        )
+
+    def test_prune_keeps_declarations_that_would_change_existing_items(self):
+        index = ExistenceIndex({"object_classes": {"class": (1, False), "other": (2, True)}})
+        data = {"object_classes": ["class", ("other", "description")]}
+        self.assertEqual(index.prune(data), data)
+
+    def test_prune_drops_duplicates(self):
+        index = ExistenceIndex({})
+        self.assertEqual(index.prune({"object_classes": ["class", "class"]}), {"object_classes": ["class"]})
+
+    def test_added_items_are_dropped_after_commit(self):
+        index = ExistenceIndex({})
+        data = {"object_classes": ["class"], "objects": [("class", "object", "description")]}
+        index.add(index.prune(data))
+        index.commit()
+        self.assertEqual(index.prune(data), {})
+        self.assertTrue(index.exists("objects", ("class", "object")))
+
+    def test_later_declaration_replaces_earlier_one(self):
+        index = ExistenceIndex({})
+        with_description = {"objects": [("class", "object", "description")]}
+        without_description = {"objects": [("class", "object")]}
+        index.add(with_description)
+        index.add(without_description)
+        index.commit()
+        self.assertEqual(index.prune(with_description), with_description)
+        self.assertEqual(index.prune(without_description), {})
+
+    def test_rollback_discards_pending_items(self):
+        index = ExistenceIndex({})
+        data = {"object_classes": ["class"]}
+        index.add(data)
+        self.assertEqual(index.prune(data), {})
+        index.rollback()
+        self.assertEqual(index.prune(data), data)
+        self.assertFalse(index.exists("object_classes", "class"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+
+"""
+Unit tests for Importer's import manifest.
+
+:date:    18.10.2026
+"""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from spine_items.importer.import_manifest import ImportManifest, mapping_hash, source_hash, table_hashes
+
+_COMMIT = [1, "2021-01-01 00:00:00"]
+_LATER_COMMIT = [2, "2021-01-02 00:00:00"]
+
+
+class TestImportManifest(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self._manifest_path = str(Path(self._temp_dir.name, "manifest.json"))
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_empty_manifest_has_no_up_to_date_sources(self):
+        manifest = ImportManifest(self._manifest_path)
+        self.assertFalse(manifest.is_up_to_date("source.csv", "abc", "def", "sqlite:///db.sqlite", _COMMIT))
+
+    def test_recorded_import_is_up_to_date_after_reload(self):
+        manifest = ImportManifest(self._manifest_path)
+        manifest.update("source.csv", "abc", "def", "sqlite:///db.sqlite", _COMMIT)
+        manifest.save()
+        manifest = ImportManifest(self._manifest_path)
+        self.assertTrue(manifest.is_up_to_date("source.csv", "abc", "def", "sqlite:///db.sqlite", _COMMIT))
+        self.assertFalse(manifest.is_up_to_date("source.csv", "changed", "def", "sqlite:///db.sqlite", _COMMIT))
+        self.assertFalse(manifest.is_up_to_date("source.csv", "abc", "changed", "sqlite:///db.sqlite", _COMMIT))
+        self.assertFalse(manifest.is_up_to_date("source.csv", "abc", "def", "sqlite:///other.sqlite", _COMMIT))
+
+    def test_import_is_outdated_when_database_has_been_committed_to(self):
+        manifest = ImportManifest(self._manifest_path)
+        manifest.update("source.csv", "abc", "def", "sqlite:///db.sqlite", _COMMIT)
+        self.assertFalse(manifest.is_up_to_date("source.csv", "abc", "def", "sqlite:///db.sqlite", _LATER_COMMIT))
+        self.assertFalse(manifest.is_up_to_date("source.csv", "abc", "def", "sqlite:///db.sqlite", None))
+
+    def test_sources_without_hash_are_never_up_to_date(self):
+        manifest = ImportManifest(self._manifest_path)
+        manifest.update("source", None, "def", "sqlite:///db.sqlite", _COMMIT)
+        self.assertFalse(manifest.is_up_to_date("source", None, "def", "sqlite:///db.sqlite", _COMMIT))
+
+    def test_source_hash_follows_file_contents(self):
+        path = Path(self._temp_dir.name, "data.csv")
+        path.write_text("a,b\n")
+        first_hash = source_hash(str(path))
+        self.assertEqual(source_hash(str(path)), first_hash)
+        path.write_text("a,c\n")
+        self.assertNotEqual(source_hash(str(path)), first_hash)
+        self.assertIsNone(source_hash(str(Path(self._temp_dir.name, "missing.csv"))))
+
+    def test_mapping_hash_does_not_depend_on_key_order(self):
+        self.assertEqual(mapping_hash({"a": 1, "b": [2, 3]}), mapping_hash({"b": [2, 3], "a": 1}))
+        self.assertNotEqual(mapping_hash({"a": 1}), mapping_hash({"a": 2}))
+
+    def test_outdated_tables_are_those_whose_hash_changed(self):
+        url = "sqlite:///db.sqlite"
+        manifest = ImportManifest(self._manifest_path)
+        manifest.update("source.xlsx", "abc", "def", url, _COMMIT, {"sheet 1": "1", "sheet 2": "2"})
+        manifest.save()
+        manifest = ImportManifest(self._manifest_path)
+        hashes = {"sheet 1": "1", "sheet 2": "changed", "sheet 3": "3"}
+        self.assertEqual(manifest.outdated_tables("source.xlsx", "abc", hashes, url, _COMMIT), ["sheet 2", "sheet 3"])
+        self.assertEqual(manifest.outdated_tables("source.xlsx", "changed", hashes, url, _COMMIT), list(hashes))
+        self.assertEqual(manifest.outdated_tables("source.xlsx", "abc", hashes, url, _LATER_COMMIT), list(hashes))
+        self.assertEqual(
+            manifest.outdated_tables("source.xlsx", "abc", hashes, "sqlite:///other.sqlite", _COMMIT), list(hashes)
+        )
+
+    def test_resumed_checkpoint_accumulates_committed_tables(self):
+        url = "sqlite:///db.sqlite"
+        manifest = ImportManifest(self._manifest_path)
+        manifest.update_checkpoint("source.xlsx", "abc", url, _COMMIT, {"sheet 1": "1"})
+        manifest.update_checkpoint("source.xlsx", "abc", url, _LATER_COMMIT, {"sheet 2": "2"}, _COMMIT)
+        manifest.save()
+        manifest = ImportManifest(self._manifest_path)
+        self.assertTrue(manifest.is_checkpoint("source.xlsx", "abc", url, _LATER_COMMIT))
+        self.assertFalse(manifest.is_checkpoint("source.xlsx", "abc", url, _COMMIT))
+        self.assertFalse(manifest.is_checkpoint("source.xlsx", "changed", url, _LATER_COMMIT))
+        self.assertFalse(manifest.is_up_to_date("source.xlsx", "abc", None, url, _LATER_COMMIT))
+        hashes = {"sheet 1": "1", "sheet 2": "2", "sheet 3": "3"}
+        self.assertEqual(manifest.outdated_tables("source.xlsx", "abc", hashes, url, _LATER_COMMIT), ["sheet 3"])
+        manifest.update("source.xlsx", "abc", "def", url, _LATER_COMMIT, hashes)
+        self.assertFalse(manifest.is_checkpoint("source.xlsx", "abc", url, _LATER_COMMIT))
+        self.assertTrue(manifest.is_up_to_date("source.xlsx", "abc", "def", url, _LATER_COMMIT))
+
+    def test_checkpoint_that_was_not_resumed_is_replaced(self):
+        url = "sqlite:///db.sqlite"
+        manifest = ImportManifest(self._manifest_path)
+        manifest.update_checkpoint("source.xlsx", "abc", url, _COMMIT, {"sheet 1": "1"})
+        manifest.update_checkpoint(
+            "source.xlsx", "abc", url, [3, "2021-01-03 00:00:00"], {"sheet 2": "2"}, _LATER_COMMIT
+        )
+        hashes = {"sheet 1": "1", "sheet 2": "2"}
+        self.assertEqual(
+            manifest.outdated_tables("source.xlsx", "abc", hashes, url, [3, "2021-01-03 00:00:00"]), ["sheet 1"]
+        )
+
+    def test_table_hashes_cover_selected_tables_only(self):
+        mapping = {
+            "table_mappings": {"sheet 1": [{"map_type": "ObjectClass"}], "sheet 2": [{"map_type": "ObjectClass"}]},
+            "table_options": {"sheet 1": {"header": True}},
+            "selected_tables": ["sheet 1"],
+        }
+        hashes = table_hashes(mapping)
+        self.assertEqual(list(hashes), ["sheet 1"])
+        mapping["table_options"]["sheet 1"]["header"] = False
+        self.assertNotEqual(table_hashes(mapping)["sheet 1"], hashes["sheet 1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
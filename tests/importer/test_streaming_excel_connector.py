@@ -0,0 +1,118 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Unit tests for StreamingExcelConnector.
+
+:date:    18.10.2026
+"""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+from openpyxl import load_workbook, Workbook
+from spine_items.importer.streaming_excel_connector import StreamingExcelConnector
+
+
+class TestStreamingExcelConnector(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self._workbook_path = str(Path(self._temp_dir.name, "source.xlsx"))
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.title = "data"
+        worksheet.append(["comment"])
+        worksheet.append([None, "name", "value", None, "ignored"])
+        for i in range(4):
+            worksheet.append([None, f"row {i}", float(i), None, "x"])
+        worksheet.append([])
+        worksheet.append([None, "after gap", 99.0])
+        workbook.save(self._workbook_path)
+        self._connector = StreamingExcelConnector(None)
+        self._connector.connect_to_source(self._workbook_path)
+
+    def tearDown(self):
+        self._connector.disconnect()
+        self._temp_dir.cleanup()
+
+    def test_get_tables(self):
+        self.assertEqual(self._connector.get_tables(), ["data"])
+
+    def test_get_data_iterator_skips_rows_and_columns_and_reads_header(self):
+        options = {"header": True, "row": 1, "column": 1, "read_until_col": True, "read_until_row": True}
+        rows, header, column_count = self._connector.get_data_iterator("data", options)
+        self.assertEqual(header, ["name", "value"])
+        self.assertEqual(column_count, 2)
+        self.assertEqual(list(rows), [[f"row {i}", float(i)] for i in range(4)])
+
+    def test_get_data_iterator_without_header_yields_first_row(self):
+        options = {"row": 2, "column": 1, "read_until_col": True, "read_until_row": True}
+        rows, header, column_count = self._connector.get_data_iterator("data", options)
+        self.assertEqual(header, [])
+        self.assertEqual(column_count, 2)
+        self.assertEqual(list(rows), [[f"row {i}", float(i)] for i in range(4)])
+
+    def test_get_data_iterator_reads_past_empty_rows_by_default(self):
+        options = {"header": True, "row": 1, "column": 1, "read_until_col": True}
+        rows, _, _ = self._connector.get_data_iterator("data", options)
+        self.assertEqual(list(rows)[-1], ["after gap", 99.0])
+
+    def test_get_data_iterator_respects_max_rows(self):
+        options = {"header": True, "row": 1, "column": 1, "read_until_col": True}
+        rows, header, _ = self._connector.get_data_iterator("data", options, max_rows=3)
+        self.assertEqual(header, ["name", "value"])
+        self.assertEqual(list(rows), [["row 0", 0.0], ["row 1", 1.0]])
+
+    def test_get_data_iterator_returns_empty_data_for_unknown_table(self):
+        rows, header, column_count = self._connector.get_data_iterator("no such sheet", {})
+        self.assertEqual(list(rows), [])
+        self.assertEqual(header, [])
+        self.assertEqual(column_count, 0)
+
+    def test_reading_until_empty_row_continues_past_rows_of_zeros(self):
+        path = str(Path(self._temp_dir.name, "zeros.xlsx"))
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.title = "zeros"
+        worksheet.append([0, 0])
+        worksheet.append([1.0, 2.0])
+        worksheet.append([])
+        worksheet.append([3.0, 4.0])
+        workbook.save(path)
+        connector = StreamingExcelConnector(None)
+        connector.connect_to_source(path)
+        rows, _, _ = connector.get_data_iterator("zeros", {"read_until_row": True})
+        self.assertEqual(list(rows), [[0, 0], [1.0, 2.0]])
+        connector.disconnect()
+
+    def test_workbook_is_closed_once_rows_have_been_consumed(self):
+        workbooks = list()
+
+        def open_workbook(*args, **kwargs):
+            workbook = load_workbook(*args, **kwargs)
+            workbook.close = mock.MagicMock(wraps=workbook.close)
+            workbooks.append(workbook)
+            return workbook
+
+        with mock.patch("spine_items.importer.streaming_excel_connector.load_workbook", side_effect=open_workbook):
+            rows, _, _ = self._connector.get_data_iterator("data", {"row": 1, "column": 1})
+            self.assertEqual(len(workbooks), 1)
+            workbooks[0].close.assert_not_called()
+            self.assertEqual(len(list(rows)), 7)
+            workbooks[0].close.assert_called_once_with()
+            rows, _, _ = self._connector.get_data_iterator("data", {"row": 1, "column": 1})
+            next(rows)
+            del rows
+            workbooks[1].close.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
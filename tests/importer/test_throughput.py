@@ -0,0 +1,77 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+
+"""
+Unit tests for Importer's throughput report.
+
+:date:    18.10.2026
+"""
+import json
+import pickle
+from tempfile import TemporaryDirectory
+import unittest
+from spine_items.importer.throughput import ThroughputReport, TimedRows
+
+
+class TestThroughputReport(unittest.TestCase):
+    def test_counts_accumulate_into_source_table_and_totals(self):
+        report = ThroughputReport()
+        report.add_rows(3, "source.csv", "table")
+        report.add_items(5, "source.csv", "table")
+        report.add_time("import", 2.0, "source.csv")
+        report.add_time("commit", 1.0)
+        report_dict = report.to_dict()
+        self.assertEqual(report_dict["rows"], 3)
+        self.assertEqual(report_dict["items"], 5)
+        self.assertEqual(report_dict["stages"]["import"], 2.0)
+        self.assertEqual(report_dict["stages"]["commit"], 1.0)
+        source = report_dict["sources"]["source.csv"]
+        self.assertEqual(source["stages"]["import"], 2.0)
+        self.assertEqual(source["stages"]["commit"], 0.0)
+        self.assertEqual(source["tables"]["table"]["rows"], 3)
+        self.assertEqual(source["tables"]["table"]["stages"]["import"], 0.0)
+
+    def test_merge_pickled_report(self):
+        worker_report = ThroughputReport()
+        worker_report.add_rows(2, "source.csv", "table")
+        worker_report.add_time("read", 1.5, "source.csv", "table")
+        report = ThroughputReport()
+        report.add_rows(1, "source.csv", "table")
+        report.merge(pickle.loads(pickle.dumps(worker_report)))
+        report_dict = report.to_dict()
+        self.assertEqual(report_dict["rows"], 3)
+        self.assertEqual(report_dict["sources"]["source.csv"]["tables"]["table"]["stages"]["read"], 1.5)
+
+    def test_save_writes_json(self):
+        report = ThroughputReport()
+        report.add_rows(1, "source.csv", "table")
+        report.add_imported(1, "sqlite:///db.sqlite")
+        report.finish()
+        with TemporaryDirectory() as logs_dir:
+            path = report.save(logs_dir)
+            with open(path) as report_file:
+                report_dict = json.load(report_file)
+        self.assertTrue(path.endswith("_throughput.json"))
+        self.assertEqual(report_dict["imported"], {"sqlite:///db.sqlite": 1})
+        self.assertIn("rows/s", report.summary())
+
+
+class TestTimedRows(unittest.TestCase):
+    def test_counts_rows(self):
+        rows = TimedRows([["a"], ["b"]])
+        self.assertEqual(list(rows), [["a"], ["b"]])
+        self.assertEqual(rows.count, 2)
+        self.assertGreaterEqual(rows.seconds, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
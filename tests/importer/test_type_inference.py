@@ -0,0 +1,76 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Unit tests for the type_inference module.
+
+:date:    18.10.2026
+"""
+import unittest
+from spinedb_api.spine_io.type_conversion import (
+    DateTimeConvertSpec,
+    DurationConvertSpec,
+    FloatConvertSpec,
+    StringConvertSpec,
+)
+from spine_items.importer.type_inference import infer_column_types, sample_rows, validate_values
+
+
+class TestSampleRows(unittest.TestCase):
+    def test_short_source_is_sampled_completely(self):
+        rows = [[i] for i in range(5)]
+        self.assertEqual(sample_rows(iter(rows), 10), rows)
+
+    def test_sample_is_spread_across_source_and_keeps_order(self):
+        rows = [[i] for i in range(10000)]
+        sample = sample_rows(iter(rows), 100)
+        self.assertEqual(len(sample), 100)
+        self.assertEqual(sample, sorted(sample))
+        self.assertGreater(sample[-1][0], 5000)
+
+    def test_sample_is_reproducible(self):
+        rows = [[i] for i in range(1000)]
+        self.assertEqual(sample_rows(iter(rows), 10), sample_rows(iter(rows), 10))
+
+
+class TestInferColumnTypes(unittest.TestCase):
+    def test_proposes_most_specific_type(self):
+        sample = [["2.3", "1h", "2020-01-01T12:00", "a"], ["5", "3D", "2020-01-02T12:00", "b"]]
+        proposals = infer_column_types(sample, 4)
+        self.assertIsInstance(proposals[0].convert_spec, FloatConvertSpec)
+        self.assertIsInstance(proposals[1].convert_spec, DurationConvertSpec)
+        self.assertIsInstance(proposals[2].convert_spec, DateTimeConvertSpec)
+        self.assertIsInstance(proposals[3].convert_spec, StringConvertSpec)
+        self.assertEqual(proposals[0].confidence, 1.0)
+
+    def test_empty_values_are_ignored(self):
+        proposals = infer_column_types([["1.0", None], ["", None], [" ", None], ["2.0"]], 2)
+        self.assertIsInstance(proposals[0].convert_spec, FloatConvertSpec)
+        self.assertNotIn(1, proposals)
+
+    def test_type_below_confidence_threshold_falls_back_to_string(self):
+        sample = [[str(i)] for i in range(9)] + [["x"]]
+        self.assertIsInstance(infer_column_types(sample, 1)[0].convert_spec, StringConvertSpec)
+        proposal = infer_column_types(sample, 1, min_confidence=0.8)[0]
+        self.assertIsInstance(proposal.convert_spec, FloatConvertSpec)
+        self.assertAlmostEqual(proposal.confidence, 0.9)
+
+
+class TestValidateValues(unittest.TestCase):
+    def test_counts_converted_values(self):
+        self.assertEqual(validate_values(["1", "x", "2"], FloatConvertSpec(), allowed_failures=1), 2)
+
+    def test_gives_up_when_too_many_values_fail(self):
+        self.assertIsNone(validate_values(["1", "x", "y"], FloatConvertSpec(), allowed_failures=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
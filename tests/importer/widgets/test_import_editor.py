@@ -0,0 +1,83 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Toolbox.
+# Spine Toolbox is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Contains unit tests for Import editor's mapped data preview.
+
+:date:    18.10.2026
+"""
+import unittest
+from spinedb_api.spine_io.type_conversion import value_to_convert_spec
+from spine_items.importer.widgets.import_editor import mapped_data_fingerprint, MappedDataPreview
+
+
+class TestMappedDataPreview(unittest.TestCase):
+    def test_tables_without_preview_are_outdated(self):
+        preview = MappedDataPreview()
+        self.assertEqual(preview.outdated_tables({"table 1": "a", "table 2": "b"}), ["table 1", "table 2"])
+
+    def test_only_tables_with_changed_fingerprints_are_remapped(self):
+        preview = MappedDataPreview()
+        preview.start({"table 1": "a", "table 2": "b"})
+        self.assertTrue(preview.is_pending)
+        preview.store(
+            {"table 1": {"object_classes": ["oc1"]}, "table 2": {"object_classes": ["oc2"]}}, [("table 2", "error")]
+        )
+        self.assertFalse(preview.is_pending)
+        self.assertEqual(preview.outdated_tables({"table 1": "a", "table 2": "b"}), [])
+        self.assertEqual(preview.outdated_tables({"table 1": "a", "table 2": "changed"}), ["table 2"])
+
+    def test_collect_merges_stored_tables_with_their_errors(self):
+        preview = MappedDataPreview()
+        preview.start({"table 1": "a", "table 2": "b"})
+        preview.store(
+            {"table 1": {"object_classes": ["oc1"]}, "table 2": {"object_classes": ["oc2"], "objects": [("oc2", "o")]}},
+            [("table 2", "error")],
+        )
+        preview.start({"table 1": "changed"})
+        preview.store({"table 1": {"object_classes": ["oc3"]}}, [])
+        data, errors = preview.collect(["table 1", "table 2", "unmapped table"])
+        self.assertEqual(data, {"object_classes": ["oc3", "oc2"], "objects": [("oc2", "o")]})
+        self.assertEqual(errors, [("table 2", "error")])
+        data, errors = preview.collect(["table 1"])
+        self.assertEqual(data, {"object_classes": ["oc3"]})
+        self.assertEqual(errors, [])
+
+    def test_cancelled_request_is_not_pending(self):
+        preview = MappedDataPreview()
+        preview.start({"table 1": "a"})
+        preview.cancel()
+        self.assertFalse(preview.is_pending)
+        self.assertEqual(preview.outdated_tables({"table 1": "a"}), ["table 1"])
+
+
+class TestMappedDataFingerprint(unittest.TestCase):
+    def test_fingerprint_changes_with_everything_that_affects_mapped_data(self):
+        mappings = [{"map_type": "ObjectClass", "name": {"map_type": "column", "reference": 0}}]
+        types = {0: value_to_convert_spec("string")}
+        fingerprint = mapped_data_fingerprint("data.csv", mappings, {"header": True}, types, {}, 100)
+        self.assertEqual(mapped_data_fingerprint("data.csv", mappings, {"header": True}, types, {}, 100), fingerprint)
+        changed_mappings = [{"map_type": "ObjectClass", "name": {"map_type": "column", "reference": 1}}]
+        variations = (
+            ("other.csv", mappings, {"header": True}, types, {}, 100),
+            ("data.csv", changed_mappings, {"header": True}, types, {}, 100),
+            ("data.csv", mappings, {"header": False}, types, {}, 100),
+            ("data.csv", mappings, {"header": True}, {0: value_to_convert_spec("float")}, {}, 100),
+            ("data.csv", mappings, {"header": True}, types, {0: value_to_convert_spec("float")}, 100),
+            ("data.csv", mappings, {"header": True}, types, {}, 50),
+        )
+        for arguments in variations:
+            with self.subTest(arguments=arguments):
+                self.assertNotEqual(mapped_data_fingerprint(*arguments), fingerprint)
+
+
+if __name__ == "__main__":
+    unittest.main()
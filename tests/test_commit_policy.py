@@ -0,0 +1,57 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Unit tests for the commit_policy module.
+
+:date:    18.10.2026
+"""
+import unittest
+from spine_items.commit_policy import CommitPolicy, EVERY_N_ITEMS, PER_FILE, PER_RUN, PER_TABLE
+
+
+class TestCommitPolicy(unittest.TestCase):
+    def test_unknown_granularity_raises(self):
+        with self.assertRaises(ValueError):
+            CommitPolicy("sometimes")
+
+    def test_per_run_never_commits_in_between(self):
+        policy = CommitPolicy(PER_RUN)
+        self.assertFalse(policy.commit_after_items(1000))
+        self.assertFalse(policy.commit_after_table())
+        self.assertFalse(policy.commit_after_file())
+
+    def test_per_table_commits_after_tables_and_files(self):
+        policy = CommitPolicy(PER_TABLE)
+        self.assertTrue(policy.commit_after_table())
+        self.assertTrue(policy.commit_after_file())
+        self.assertFalse(policy.commit_after_items(1000))
+
+    def test_every_n_items(self):
+        policy = CommitPolicy(EVERY_N_ITEMS, 10)
+        self.assertFalse(policy.commit_after_items(9))
+        self.assertTrue(policy.commit_after_items(10))
+        self.assertFalse(policy.commit_after_file())
+        self.assertFalse(CommitPolicy(EVERY_N_ITEMS, 0).commit_after_items(10))
+
+    def test_describe(self):
+        self.assertEqual(CommitPolicy(EVERY_N_ITEMS, 5).describe(), "Committing every 5 items.")
+        self.assertEqual(CommitPolicy(PER_FILE).describe(), "Committing after each source.")
+        self.assertEqual(CommitPolicy(PER_TABLE).describe(), "Committing after each table.")
+        self.assertEqual(CommitPolicy(PER_RUN).describe(), "Committing once at the end of the run.")
+
+    def test_serialization(self):
+        policy = CommitPolicy(EVERY_N_ITEMS, 23)
+        self.assertEqual(CommitPolicy.from_dict(policy.to_dict()), policy)
+
+
+if __name__ == "__main__":
+    unittest.main()
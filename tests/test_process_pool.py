@@ -0,0 +1,207 @@
+######################################################################################################################
+# Copyright (C) 2017-2021 Spine project consortium
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Unit tests for the process_pool module.
+
+:date:    18.10.2026
+"""
+from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+from spine_items.process_pool import _CANCEL, _RESULT, _Worker, cancel_requested, PooledProcess, WorkerPool
+
+
+def _work(value, logger):
+    logger.msg.emit(f"got {value}")
+    return (True, value, os.getpid())
+
+
+def _wait_for_cancel(logger):
+    logger.msg.emit("started")
+    while not cancel_requested():
+        time.sleep(0.01)
+    return (False, "stopped")
+
+
+def _sleep(seconds, logger):
+    time.sleep(seconds)
+    return (True,)
+
+
+def _check_cancel(logger):
+    return (cancel_requested(),)
+
+
+def _emit_from_threads(thread_count, message_count, logger):
+    def emit_messages(thread_index):
+        for message_index in range(message_count):
+            logger.msg.emit(f"{thread_index}:{message_index}:" + 100000 * "x")
+
+    with ThreadPoolExecutor(max_workers=thread_count) as executor:
+        list(executor.map(emit_messages, range(thread_count)))
+    return (True,)
+
+
+def _fail(logger):
+    raise RuntimeError("kernel failure")
+
+
+def _exit_abruptly(logger):
+    os._exit(1)
+
+
+class TestPooledProcess(unittest.TestCase):
+    def setUp(self):
+        self._pool = WorkerPool(max_idle_workers=1, idle_timeout=60.0)
+        patcher = mock.patch("spine_items.process_pool.worker_pool", return_value=self._pool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._pool.shut_down)
+
+    def test_returns_target_result_and_relays_log_messages(self):
+        logger = mock.MagicMock()
+        result = PooledProcess(_work, (23,), logger).run_until_complete()
+        self.assertTrue(result[0])
+        self.assertEqual(result[1], 23)
+        logger.msg.emit.assert_called_once_with("got 23")
+
+    def test_worker_is_reused(self):
+        logger = mock.MagicMock()
+        first = PooledProcess(_work, (1,), logger).run_until_complete()
+        second = PooledProcess(_work, (2,), logger).run_until_complete()
+        self.assertEqual(first[2], second[2])
+
+    def test_exception_in_target_fails_execution(self):
+        logger = mock.MagicMock()
+        result = PooledProcess(_fail, (), logger).run_until_complete()
+        self.assertEqual(result, (False,))
+        logger.msg_error.emit.assert_called_once()
+
+    def test_messages_emitted_from_several_threads_are_relayed_intact(self):
+        logger = mock.MagicMock()
+        result = PooledProcess(_emit_from_threads, (4, 50), logger).run_until_complete()
+        self.assertEqual(result, (True,))
+        messages = [call.args[0] for call in logger.msg.emit.call_args_list]
+        self.assertEqual(len(messages), 4 * 50)
+        expected = {f"{thread}:{message}:" + 100000 * "x" for thread in range(4) for message in range(50)}
+        self.assertEqual(set(messages), expected)
+
+    def test_dead_worker_fails_execution_with_error_message(self):
+        logger = mock.MagicMock()
+        result = PooledProcess(_exit_abruptly, (), logger).run_until_complete()
+        self.assertEqual(result, (False,))
+        logger.msg_error.emit.assert_called_once_with("Worker process exited unexpectedly.")
+
+    def test_terminated_process_does_not_run(self):
+        process = PooledProcess(_work, (1,), mock.MagicMock())
+        process.terminate()
+        self.assertEqual(process.run_until_complete(), (False,))
+
+    def test_cancel_stops_target_cooperatively(self):
+        logger = mock.MagicMock()
+        started = threading.Event()
+        logger.msg.emit.side_effect = lambda *args: started.set()
+        process = PooledProcess(_wait_for_cancel, (), logger)
+        results = list()
+        thread = threading.Thread(target=lambda: results.append(process.run_until_complete()))
+        thread.start()
+        self.assertTrue(started.wait(10.0))
+        process.cancel(grace_period=60.0)
+        thread.join(10.0)
+        self.assertEqual(results, [(False, "stopped")])
+        result = PooledProcess(_work, (5,), mock.MagicMock()).run_until_complete()
+        self.assertEqual(result[1], 5)
+
+
+class TestWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self._pool = WorkerPool(max_idle_workers=1, idle_timeout=60.0, max_workers=1)
+        self.addCleanup(self._pool.shut_down)
+
+    def test_acquire_waits_for_busy_worker_when_pool_is_full(self):
+        worker = self._pool.acquire()
+        acquired = list()
+        thread = threading.Thread(target=lambda: acquired.append(self._pool.acquire()))
+        thread.start()
+        thread.join(0.2)
+        self.assertTrue(thread.is_alive())
+        self.assertEqual(acquired, [])
+        self._pool.release(worker)
+        thread.join(10.0)
+        self.assertEqual(acquired, [worker])
+        self._pool.release(worker)
+
+    def test_discarded_worker_frees_its_slot(self):
+        worker = self._pool.acquire()
+        self._pool.discard(worker)
+        acquired = list()
+        thread = threading.Thread(target=lambda: acquired.append(self._pool.acquire()))
+        thread.start()
+        thread.join(10.0)
+        self.assertEqual(len(acquired), 1)
+        self.assertIsNot(acquired[0], worker)
+        self._pool.release(acquired[0])
+
+    def test_workers_are_started_when_pool_is_created(self):
+        with mock.patch("spine_items.process_pool._Worker") as worker_class:
+            worker = worker_class.return_value
+            pool = WorkerPool(max_idle_workers=2, idle_timeout=60.0, prestarted_workers=2)
+            self.assertEqual(worker_class.call_count, 2)
+            self.assertIs(pool.acquire(), worker)
+            self.assertEqual(worker_class.call_count, 2)
+            pool.release(worker)
+            pool.shut_down()
+
+
+class TestWorker(unittest.TestCase):
+    def test_cancel_that_arrives_before_task_starts_is_kept(self):
+        worker = _Worker()
+        self.addCleanup(worker.kill)
+        connection = worker._connection
+        connection.send((1, _sleep, (0.2,)))
+        connection.send((2, _check_cancel, ()))
+        connection.send((_CANCEL, 2))
+        self.assertEqual(connection.recv(), (_RESULT, (True,)))
+        self.assertEqual(connection.recv(), (_RESULT, (True,)))
+
+    def test_cancel_of_earlier_task_does_not_reach_next_task(self):
+        worker = _Worker()
+        self.addCleanup(worker.kill)
+        connection = worker._connection
+        connection.send((1, _sleep, (0.2,)))
+        connection.send((2, _check_cancel, ()))
+        connection.send((_CANCEL, 1))
+        self.assertEqual(connection.recv(), (_RESULT, (True,)))
+        self.assertEqual(connection.recv(), (_RESULT, (False,)))
+        self.assertEqual(worker.run(_check_cancel, (), mock.MagicMock()), (False,))
+
+    def test_request_cancel_targets_current_task(self):
+        worker = _Worker()
+        self.addCleanup(worker.kill)
+        logger = mock.MagicMock()
+        started = threading.Event()
+        logger.msg.emit.side_effect = lambda *args: started.set()
+        results = list()
+        thread = threading.Thread(target=lambda: results.append(worker.run(_wait_for_cancel, (), logger)))
+        thread.start()
+        self.assertTrue(started.wait(10.0))
+        worker.request_cancel()
+        thread.join(10.0)
+        self.assertEqual(results, [(False, "stopped")])
+        self.assertEqual(worker.run(_check_cancel, (), mock.MagicMock()), (False,))
+
+
+if __name__ == "__main__":
+    unittest.main()